@@ -0,0 +1,184 @@
+"""
+Scaling benchmarks for every function in `datethyme.scheduling.algorithms`.
+
+Each case is run at every size in `SIZES` (up to `--bench-max-size`), so the stored results give
+one scaling curve per function. Functions that modify their input get fresh spans every round.
+"""
+
+from functools import partial
+
+import pytest
+from helpers import make_spans, run_fresh
+
+from datethyme import Time
+from datethyme.scheduling import algorithms as alg
+from datethyme.scheduling.backends import use_backend
+
+EARLY, LATE = Time(hour=6), Time(hour=18)
+WINDOW = {"earliest": EARLY, "latest": LATE}
+
+# name -> (function of the span list, stretch of the generated spans, modifies its input)
+CASES = {
+    "earliest_start": (alg.earliest_start, 1.0, False),
+    "latest_end": (alg.latest_end, 1.0, False),
+    "most_central": (alg.most_central, 1.0, False),
+    "get_relative_lengths": (alg.get_relative_lengths, 1.0, False),
+    "get_total_length": (alg.get_total_length, 1.0, False),
+    "is_contiguous": (alg.is_contiguous, 1.0, False),
+    "snap_between": (
+        lambda seq: [alg.snap_between(span, EARLY, LATE) for span in seq],
+        1.0,
+        True,
+    ),
+    "with_bounds": (lambda seq: [alg.with_bounds(s, s.start, s.end) for s in seq], 1.0, False),
+    "water_fill": (
+        lambda seq: alg.water_fill([s.minutes for s in seq], 720, 0.1 * 720 / len(seq)),
+        1.0,
+        False,
+    ),
+    "stack_forward": (alg.stack_forward, 0.5, True),
+    "stack_backward": (alg.stack_backward, 0.5, True),
+    "stack_from_middle": (alg.stack_from_middle, 0.5, True),
+    "stack_iterative": (partial(alg.stack, mode="FORWARD", backend="iterative"), 0.5, True),
+    "stack_vectorized": (partial(alg.stack, mode="FORWARD", backend="vectorized"), 0.5, False),
+    "stack_boundaries": (
+        lambda seq: alg.stack_boundaries(
+            [s.start.to_minutes() for s in seq], [s.end.to_minutes() for s in seq], mode="FORWARD"
+        ),
+        0.5,
+        False,
+    ),
+    "squeeze_iterative": (
+        partial(alg.squeeze, mode="PROPORTIONAL", earliest=EARLY, latest=LATE, min_minutes=0),
+        1.0,
+        True,
+    ),
+    "squeeze_vectorized": (
+        partial(
+            alg.squeeze,
+            mode="PROPORTIONAL",
+            earliest=EARLY,
+            latest=LATE,
+            min_minutes=0,
+            backend="vectorized",
+        ),
+        1.0,
+        False,
+    ),
+    "squeeze_with_rollover": (
+        partial(alg.squeeze_with_rollover, mode="EQUAL", earliest=EARLY, latest=LATE),
+        1.0,
+        True,
+    ),
+    "squeeze_boundaries": (
+        lambda seq: alg.squeeze_boundaries(
+            [s.minutes for s in seq], mode="PROPORTIONAL", lower=360, upper=1080
+        ),
+        1.0,
+        False,
+    ),
+    "respan": (lambda seq: list(alg.respan(seq, [0.0] * (len(seq) + 1))), 1.0, False),
+    "snap_forward": (partial(alg.apply_pairwise, alg.snap_forward), 0.5, True),
+    "snap_back": (partial(alg.apply_pairwise, alg.snap_back), 0.5, True),
+    "split_gap_equal": (partial(alg.apply_pairwise, alg.split_gap_equal), 0.5, True),
+    "split_gap_proportional": (partial(alg.apply_pairwise, alg.split_gap_proportional), 0.5, True),
+    "split_gap_inverse_proportional": (
+        partial(alg.apply_pairwise, alg.split_gap_inverse_proportional),
+        0.5,
+        True,
+    ),
+    "split_overlap_equal": (partial(alg.apply_pairwise, alg.split_overlap_equal), 1.5, True),
+    "split_overlap_proportional": (
+        partial(alg.apply_pairwise, alg.split_overlap_proportional),
+        1.5,
+        True,
+    ),
+    "split_overlap_inverse_proportional": (
+        partial(alg.apply_pairwise, alg.split_overlap_inverse_proportional),
+        1.5,
+        True,
+    ),
+    "iter_pairwise": (
+        lambda seq: list(alg.iter_pairwise(lambda a, b: (a, b), seq)),
+        1.0,
+        False,
+    ),
+    "resolve_gaps": (partial(alg.resolve_gaps, mode="SNAP_FORWARD"), 0.5, True),
+    "resolve_overlaps": (partial(alg.resolve_overlaps, mode="EQUAL"), 1.5, True),
+    "iter_resolve_gaps": (
+        lambda seq: list(alg.iter_resolve_gaps(seq, mode="SNAP_BACK")),
+        0.5,
+        True,
+    ),
+    "iter_resolve_overlaps": (
+        lambda seq: list(alg.iter_resolve_overlaps(seq, mode="EQUAL")),
+        1.5,
+        True,
+    ),
+    "resolve_overlaps_global": (alg.resolve_overlaps_global, 2.5, False),
+    "truncate": (partial(alg.truncate, earliest=EARLY, latest=LATE), 1.0, False),
+    "truncate_nodiscard": (
+        partial(alg.truncate_nodiscard, earliest=EARLY, latest=LATE),
+        1.0,
+        True,
+    ),
+    "iter_truncate": (lambda seq: list(alg.iter_truncate(seq, EARLY, LATE)), 1.0, False),
+    "eclipse_forward": (alg.eclipse_forward, 1.5, False),
+    "eclipse_backward": (alg.eclipse_backward, 1.5, False),
+    "iter_eclipse_forward": (lambda seq: list(alg.iter_eclipse_forward(seq)), 1.5, False),
+    "eclipse_by_priority": (
+        lambda seq: [list(stream) for stream in alg.eclipse_by_priority(seq, lambda s: -s.minutes)],
+        2.5,
+        False,
+    ),
+    "coalesce": (lambda seq: list(alg.coalesce(seq, key=lambda _: None)), 1.0, False),
+    "compose": (
+        lambda seq: list(alg.compose(alg.coalesce, partial(alg.iter_truncate, **WINDOW))(seq)),
+        1.0,
+        False,
+    ),
+}
+
+# cases that currently raise on valid input; they report timings again once fixed
+BROKEN = {
+    "most_central",
+    "stack_from_middle",
+    "snap_between",
+    "split_gap_equal",
+    "split_overlap_equal",
+    "split_overlap_proportional",
+    "split_overlap_inverse_proportional",
+    "resolve_overlaps",
+    "iter_resolve_overlaps",
+    "truncate_nodiscard",
+}
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        pytest.param(name, marks=pytest.mark.xfail(reason="raises on valid input"))
+        if name in BROKEN
+        else name
+        for name in CASES
+    ],
+)
+def test_algorithm(benchmark, name, size):
+    function, stretch, mutates = CASES[name]
+    benchmark.group = f"algorithms:{name}"
+    if mutates:
+        run_fresh(benchmark, function, lambda: (make_spans(size, stretch),), size)
+    else:
+        benchmark(function, make_spans(size, stretch))
+
+
+@pytest.mark.parametrize("backend", ["python", "numpy"])
+@pytest.mark.parametrize("name", ["truncate", "eclipse_forward", "get_total_length"])
+def test_backend(benchmark, name, backend, size):
+    if backend == "numpy":
+        pytest.importorskip("numpy")
+    function, stretch, _ = CASES[name]
+    spans = make_spans(size, stretch)
+    benchmark.group = f"backends:{name}"
+    with use_backend(backend):
+        benchmark(function, spans)
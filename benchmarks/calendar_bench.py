@@ -0,0 +1,31 @@
+import pytest
+
+from datethyme import Date
+from datethyme.scheduling import Calendar, Entry
+
+
+@pytest.mark.parametrize("ndays", [7, 30, 365])
+def test_read_restricted(benchmark, calendar_file, ndays):
+    path = calendar_file(ndays)
+    benchmark(Calendar.read_restricted, path)
+
+
+@pytest.mark.parametrize("nentries", [100, 1_000, 5_000])
+def test_allocate_entries(benchmark, calendar_file, nentries):
+    """Allocate `nentries` entries of 15 to 74 minutes with staggered due dates over 30 days."""
+    path = calendar_file(30)
+    first = Date.parse("2026-01-01")
+    entries = [
+        Entry(
+            name=f"e{i}",
+            normal_time=15 + i % 60,
+            priority=(i % 7) / 7,
+            due_date=first + i % 45,
+        )
+        for i in range(nentries)
+    ]
+
+    def allocate(calendar: Calendar) -> None:
+        calendar.allocate_entries(entries, context_hierarchy=None)
+
+    benchmark.pedantic(allocate, setup=lambda: ((Calendar.read_restricted(path),), {}), rounds=10)
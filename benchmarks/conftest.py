@@ -0,0 +1,52 @@
+"""
+Shared fixtures for the benchmark suite (run with `just bench`, see benchmarks/README.md).
+
+Size-dependent benchmarks take a `size` argument and are parametrized over `SIZES`, capped by
+`--bench-max-size` so that the default run stays short; `just bench-full` goes up to 10**6.
+"""
+
+import json
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+from helpers import SIZES
+
+from datethyme import Date
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--bench-max-size",
+        type=int,
+        default=10_000,
+        help="largest input size for size-dependent benchmarks (default: 10000)",
+    )
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    if "size" in metafunc.fixturenames:
+        max_size = metafunc.config.getoption("--bench-max-size")
+        metafunc.parametrize("size", [n for n in SIZES if n <= max_size])
+
+
+@pytest.fixture(scope="session")
+def calendar_file(tmp_path_factory: pytest.TempPathFactory) -> Callable[[int], Path]:
+    """Write a generated calendar of `ndays` days with eight blocks each and return its path."""
+    cache: dict[int, Path] = {}
+
+    def write(ndays: int) -> Path:
+        if ndays not in cache:
+            first = Date.parse("2026-01-01")
+            fixed = [
+                {"start": f"{h:02d}:00", "end": f"{h:02d}:45", "name": f"block{h}", "contexts": []}
+                for h in range(8, 16)
+            ]
+            raw = {
+                str(first + i): {"schedule": {"fixed": fixed}, "entries": []} for i in range(ndays)
+            }
+            cache[ndays] = tmp_path_factory.mktemp("calendars") / f"calendar_{ndays}.json"
+            cache[ndays].write_text(json.dumps(raw))
+        return cache[ndays]
+
+    return write
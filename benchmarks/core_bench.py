@@ -0,0 +1,53 @@
+import pytest
+
+from datethyme import Date, DateRange, DateTime, Time, lite
+from datethyme.extra import MinuteRangeDated
+
+
+@pytest.mark.parametrize(
+    "cls, fields",
+    [
+        (Date, {"year": 2026, "month": 5, "day": 11}),
+        (Time, {"hour": 9, "minute": 30, "second": 15.5}),
+        (DateTime, {"year": 2026, "month": 5, "day": 11, "hour": 9, "minute": 30}),
+        (lite.Date, {"year": 2026, "month": 5, "day": 11}),
+        (lite.Time, {"hour": 9, "minute": 30, "second": 15.5}),
+        (lite.DateTime, {"year": 2026, "month": 5, "day": 11, "hour": 9, "minute": 30}),
+    ],
+    ids=["Date", "Time", "DateTime", "lite.Date", "lite.Time", "lite.DateTime"],
+)
+def test_construct(benchmark, cls, fields):
+    benchmark(cls, **fields)
+
+
+@pytest.mark.parametrize(
+    "cls, raw",
+    [(Date, "2026-05-11"), (Time, "09:30:15"), (DateTime, "2026-05-11 09:30")],
+    ids=["Date", "Time", "DateTime"],
+)
+def test_parse(benchmark, cls, raw):
+    benchmark(cls.parse, raw)
+
+
+@pytest.mark.parametrize(
+    "first, second",
+    [
+        (Date.parse("2026-05-11"), Date.parse("2026-05-12")),
+        (Time.parse("09:30"), Time.parse("17:45")),
+        (DateTime.parse("2026-05-11 09:30"), DateTime.parse("2026-05-11 17:45")),
+    ],
+    ids=["Date", "Time", "DateTime"],
+)
+def test_compare(benchmark, first, second):
+    benchmark(lambda: (first < second, first == second))
+
+
+def test_date_range_iteration(benchmark, size):
+    start = Date.parse("2000-01-01")
+    benchmark(lambda: sum(1 for _ in DateRange(start, start + size)))
+
+
+def test_minute_range_dated_iteration(benchmark, size):
+    start = DateTime.parse("2026-01-01 00:00")
+    stop = DateTime.from_pair(start.date + size // 1440, Time.from_minutes(size % 1440))
+    benchmark(lambda: sum(1 for _ in MinuteRangeDated(start, stop)))
@@ -0,0 +1,43 @@
+"""Input generators and timing helpers shared by the benchmark modules."""
+
+from collections.abc import Callable
+from typing import Any
+
+from datethyme import Time, TimeSpan
+
+SIZES = (10, 100, 1_000, 10_000, 100_000, 1_000_000)
+MINUTES_PER_DAY = 1440
+
+
+def make_spans(n: int, stretch: float = 1.0) -> list[TimeSpan]:
+    """`n` named, start-sorted spans spread evenly over one day.
+
+    Each span is `stretch` times its slot, so `stretch > 1` makes neighbours overlap and
+    `stretch < 1` leaves gaps between them.
+    """
+    slot = MINUTES_PER_DAY / n
+    length = min(slot * stretch, MINUTES_PER_DAY)
+    return [
+        TimeSpan(
+            Time.from_minutes(i * slot),
+            _clamped(i * slot + length),
+            name=f"s{i}",
+        )
+        for i in range(n)
+    ]
+
+
+def _clamped(minutes: float) -> Time:
+    return Time(hour=24) if minutes >= MINUTES_PER_DAY else Time.from_minutes(minutes)
+
+
+def run_fresh(
+    benchmark: Any, function: Callable[..., Any], make_args: Callable[[], tuple], size: int
+) -> Any:
+    """Benchmark `function` on freshly built arguments each round, for functions that mutate
+    their input; building the arguments is not timed."""
+    return benchmark.pedantic(
+        function,
+        setup=lambda: (make_args(), {}),
+        rounds=max(1, min(20, 100_000 // size)),
+    )
@@ -0,0 +1,38 @@
+"""
+Startup cost: each round runs a fresh interpreter, so the timings include interpreter startup.
+
+`baseline` runs an empty program and is the floor to subtract from the other cases. The
+`first_*` cases add the first validation of each core type, which is where pydantic builds the
+deferred validators.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+PROGRAMS = {
+    "baseline": "pass",
+    "datethyme": "import datethyme",
+    "first_time": "import datethyme; datethyme.Time(hour=9)",
+    "first_all": (
+        "import datethyme as dt; dt.Time(hour=9); dt.Date.parse('2026-05-11');"
+        " dt.DateTime.parse('2026-05-11 09:30')"
+    ),
+    "extra": "import datethyme.extra",
+    "scheduling": "import datethyme.scheduling",
+    "algorithms": "from datethyme.scheduling import algorithms",
+    "partitions": "from datethyme.scheduling.types import TimePartition",
+    "calendar": "from datethyme.scheduling import Calendar",
+    "dataformats": "from datethyme.dataformats import IcsBuilder",
+}
+
+
+def run_program(program: str) -> None:
+    subprocess.run([sys.executable, "-c", program], check=True)
+
+
+@pytest.mark.parametrize("name", PROGRAMS)
+def test_import(benchmark, name):
+    benchmark.group = "import"
+    benchmark.pedantic(run_program, args=(PROGRAMS[name],), rounds=20, warmup_rounds=1)
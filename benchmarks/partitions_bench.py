@@ -0,0 +1,60 @@
+import random
+
+import pytest
+from helpers import MINUTES_PER_DAY
+
+from datethyme import Time
+from datethyme.scheduling import TimePartition
+
+
+@pytest.fixture
+def partition(size):
+    return TimePartition.from_minutes(
+        minute_durations=[MINUTES_PER_DAY / size] * size,
+        start=Time(hour=0),
+        names=[f"s{i}" for i in range(size)],
+    )
+
+
+@pytest.fixture
+def points():
+    rng = random.Random(0)
+    return [Time.from_minutes(rng.uniform(0, MINUTES_PER_DAY)) for _ in range(100)]
+
+
+def test_build_from_minutes(benchmark, size):
+    durations = [MINUTES_PER_DAY / size] * size
+    benchmark(TimePartition.from_minutes, minute_durations=durations, start=Time(hour=0))
+
+
+def test_index_from_time(benchmark, partition, points):
+    benchmark(lambda: [partition.index_from_time(point) for point in points])
+
+
+def test_index_from_times(benchmark, partition, points):
+    benchmark(partition.index_from_times, sorted(points, key=Time.to_minutes))
+
+
+def test_span_containing(benchmark, partition, points):
+    benchmark(lambda: [partition.span_containing(point) for point in points])
+
+
+def test_index_from_name(benchmark, partition, size):
+    names = [f"s{i}" for i in range(0, size, max(1, size // 100))]
+    benchmark(lambda: [partition.index_from_name(name) for name in names])
+
+
+def test_materialize_spans(benchmark, size):
+    durations = [MINUTES_PER_DAY / size] * size
+
+    def build_and_read():
+        return TimePartition.from_minutes(minute_durations=durations, start=Time(hour=0)).spans
+
+    benchmark(build_and_read)
+
+
+def test_rollup_uncached(benchmark, partition):
+    def key(span):
+        return (span.name[:2],)
+
+    benchmark(lambda: (partition._rollup_cache.clear(), partition.rollup(key)))
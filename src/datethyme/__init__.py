@@ -1,3 +1,15 @@
+"""
+Dates, times, spans and ranges, built on pydantic.
+
+Only the core types are imported eagerly. The fixed-unit ranges of `extra` and the
+`scheduling`, `dataformats`, `instrumentation` and `lite` modules load on first attribute access,
+and pydantic builds the validators of `Date`, `Time` and `DateTime` on their first validation,
+which keeps `import datethyme` cheap for short-lived processes.
+"""
+
+from typing import TYPE_CHECKING, Any
+
+from ._lazy import listing, load
 from .constants import Unit
 from .core import (
     Date,
@@ -13,21 +25,50 @@ from .exceptions import (
     DateValidationError,
     TimeValidationError,
 )
-from .extra import (
-    DayRangeDated,
-    HourRange,
-    HourRangeDated,
-    MinuteRange,
-    MinuteRangeDated,
-    SecondRange,
-    SecondRangeDated,
-)
 from .utils import (
     DATE_REGEX,
     DATE_REGEX_STRICT,
     DATE_TIME_REGEX,
 )
 
+if TYPE_CHECKING:
+    from . import dataformats as dataformats
+    from . import instrumentation as instrumentation
+    from . import lite as lite
+    from . import scheduling as scheduling
+    from .extra import (
+        DayRangeDated,
+        HourRange,
+        HourRangeDated,
+        MinuteRange,
+        MinuteRangeDated,
+        SecondRange,
+        SecondRangeDated,
+    )
+
+__lazy__ = {
+    "DayRangeDated": ".extra",
+    "HourRange": ".extra",
+    "HourRangeDated": ".extra",
+    "MinuteRange": ".extra",
+    "MinuteRangeDated": ".extra",
+    "SecondRange": ".extra",
+    "SecondRangeDated": ".extra",
+    "dataformats": ".dataformats",
+    "instrumentation": ".instrumentation",
+    "lite": ".lite",
+    "scheduling": ".scheduling",
+}
+
+
+def __getattr__(name: str) -> Any:
+    return load(__name__, __lazy__, name)
+
+
+def __dir__() -> list[str]:
+    return listing(__name__, __lazy__)
+
+
 __all__ = (
     "DATE_REGEX",
     "DATE_REGEX_STRICT",
@@ -0,0 +1,43 @@
+"""
+Loading of heavy submodules on first use, for the module-level `__getattr__` of a package.
+
+```python
+__lazy__ = {"Calendar": ".types", "algorithms": ".algorithms"}
+
+
+def __getattr__(name: str) -> Any:
+    return load(__name__, __lazy__, name)
+
+
+def __dir__() -> list[str]:
+    return listing(__name__, __lazy__)
+```
+
+A name mapped to a module path resolves to the attribute of the same name in that module, or to
+the module itself when the name is its last component. Resolved names are cached in the package
+namespace, so `__getattr__` only runs once per name.
+"""
+
+import sys
+from collections.abc import Mapping
+from importlib import import_module
+from typing import Any
+
+
+def load(package: str, lazy: Mapping[str, str], name: str) -> Any:
+    """Import the module `lazy[name]` (relative to `package`) and return `name` from it.
+
+    Raises:
+        AttributeError: if `name` is not a lazy name of `package`
+    """
+    if name not in lazy:
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+    module = import_module(lazy[name], package)
+    value = module if module.__name__.rpartition(".")[2] == name else getattr(module, name)
+    setattr(sys.modules[package], name, value)
+    return value
+
+
+def listing(package: str, lazy: Mapping[str, str]) -> list[str]:
+    """Names of `package`, including the lazy ones that are not loaded yet."""
+    return sorted({*vars(sys.modules[package]), *lazy})
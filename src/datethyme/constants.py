@@ -165,7 +165,8 @@ class Unit(Enum):
     def cascade(self, value: int | float, round_to: int = 3) -> tuple[int, int, int, float]:
         """Perform cascading modular division at each of our four time resolutions of interest."""
         days, hours, minutes = 0, 0, 0
-        raw_seconds = float(self.seconds * value)
+        # round before carrying, so that e.g. 59.9996 s becomes 1 min rather than 60.0 s
+        raw_seconds = round(float(self.seconds * value), round_to)
         minutes, seconds = Unit.SECOND.wrt_superunit(raw_seconds)
         hours, minutes = Unit.MINUTE.wrt_superunit(minutes)
         days, hours = Unit.HOUR.wrt_superunit(hours)
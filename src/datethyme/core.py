@@ -32,6 +32,7 @@ from .exceptions import (
     DateTimeValidationError,
     TemporalLogicError,
 )
+from .protocols import DateProtocol, TimeProtocol
 from .utils import (
     DATE_TIME_REGEX,
     WeekdayLiteral,
@@ -85,7 +86,7 @@ class Date(BaseModel):
     in particular input parsing, date calculations, and ranges.
     """
 
-    model_config = ConfigDict(frozen=True)
+    model_config = ConfigDict(frozen=True, defer_build=True)
 
     year: int = Field(ge=1, le=1000000, frozen=True)
     month: int = Field(ge=1, le=12, frozen=True)
@@ -199,6 +200,8 @@ class Date(BaseModel):
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, DATETIME.date | Date):
+            if isinstance(other, DateProtocol) and not isinstance(other, TimeProtocol):
+                return NotImplemented  # e.g. a `lite.Date`, which compares equal to its counterpart
             raise TypeError("Unsupported comparison.")
         return (self.year, self.month, self.day) == (
             other.year,
@@ -418,7 +421,7 @@ class Time(BaseModel):
     in particular input parsing, time calculations, and ranges.
     """
 
-    model_config = ConfigDict(frozen=FROZEN)
+    model_config = ConfigDict(frozen=FROZEN, defer_build=True)
 
     hour: int = Field(frozen=FROZEN)
     minute: int = Field(default=0, frozen=FROZEN)
@@ -509,7 +512,7 @@ class Time(BaseModel):
 
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, Time):
-            return False  # raise TypeError("Unsupported comparison.")
+            return NotImplemented  # e.g. a `lite.Time`, which compares equal to its counterpart
         if isinstance(other, Time):
             return self.to_seconds(places=self.decimal_places) == other.to_seconds(
                 places=self.decimal_places
@@ -797,8 +800,9 @@ class Time(BaseModel):
                 return self.add_hours(n * 24)
 
 
-DAY_START = Time(hour=0)
-DAY_END = Time(hour=24)
+# built without validation, so that importing this module does not build the Time validator
+DAY_START = Time.model_construct(hour=0, minute=0, second=0.0)
+DAY_END = Time.model_construct(hour=24, minute=0, second=0.0)
 
 
 class TimeDelta:
@@ -860,7 +864,7 @@ class DateTime(BaseModel):
     .
     """
 
-    model_config = ConfigDict(frozen=FROZEN)
+    model_config = ConfigDict(frozen=FROZEN, defer_build=True)
 
     year: int = Field(ge=1, le=1000000, frozen=FROZEN)
     month: int = Field(ge=1, le=12, frozen=FROZEN)
@@ -1,8 +1,31 @@
-from .html import HTMLBuilder
-from .ics import IcsBuilder
-from .jscalendar import convert_from_jscalendar, convert_to_jscalendar
-from .latex import LaTeXBuilder
-from .typst import TypstBuilder
+from typing import TYPE_CHECKING, Any
+
+from .._lazy import listing, load
+
+if TYPE_CHECKING:
+    from .html import HTMLBuilder
+    from .ics import IcsBuilder
+    from .jscalendar import convert_from_jscalendar, convert_to_jscalendar
+    from .latex import LaTeXBuilder
+    from .typst import TypstBuilder
+
+__lazy__ = {
+    "HTMLBuilder": ".html",
+    "IcsBuilder": ".ics",
+    "LaTeXBuilder": ".latex",
+    "TypstBuilder": ".typst",
+    "convert_from_jscalendar": ".jscalendar",
+    "convert_to_jscalendar": ".jscalendar",
+}
+
+
+def __getattr__(name: str) -> Any:
+    return load(__name__, __lazy__, name)
+
+
+def __dir__() -> list[str]:
+    return listing(__name__, __lazy__)
+
 
 __all__ = (
     "HTMLBuilder",
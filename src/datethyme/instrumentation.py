@@ -0,0 +1,225 @@
+"""
+Opt-in counters and timers for the expensive paths of datethyme.
+
+Nothing is recorded until `enable()` is called. `enable()` wraps construction, validation,
+parsing and range iteration in place and `disable()` restores the original functions. The only
+permanent hooks are `if instrumentation.STATE.enabled` checks at caches and partition rebuilds,
+and in the `timed` decorator of the main entry points.
+
+```python
+from datethyme import instrumentation
+
+instrumentation.enable()
+with instrumentation.recording() as request:
+    handle_request()
+print(request.snapshot().counters)  # only what this request (thread or task) caused
+```
+
+Counters are named `"<event>:<subject>"`:
+
+- `construct:<Type>`: direct `Date`, `Time` or `DateTime` construction
+- `validate:Date` / `validate:Time`: parsing of raw input into fields, which is what every
+  validation of these types runs; a `DateTime` is validated as one `Date` plus one `Time`
+- `parse:<Type>`: calls to `<Type>.parse`
+- `iterate:<Range>`: iterations over a range
+- `rebuild:<Partition>`: partition span lists replaced, `materialize:partition` lazy span arrays
+  turned into span objects
+- `cache_hit:<cache>` / `cache_miss:<cache>`: rollup and block caches of partitions and schedules
+
+Timers are named after the timed function, e.g. `algorithms.squeeze` or
+`Calendar.create_schedule`.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import Counter
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, NamedTuple
+
+from . import core
+from ._abcs import AbstractRange
+
+
+class _State:
+    __slots__ = ("enabled",)
+
+    def __init__(self) -> None:
+        self.enabled = False
+
+
+STATE = _State()
+"""`STATE.enabled` says whether instrumentation is on; checked inline on the hooked paths."""
+
+_counters: Counter[str] = Counter()
+_timers: dict[str, list[float]] = {}
+_active: ContextVar[tuple[Recording, ...]] = ContextVar("active_recordings", default=())
+_patches: list[tuple[Any, str, Any]] = []
+_MISSING = object()
+
+
+class TimerStats(NamedTuple):
+    calls: int
+    seconds: float
+
+
+class Snapshot(NamedTuple):
+    counters: dict[str, int]
+    timers: dict[str, TimerStats]
+
+
+class Recording:
+    """Counters and timers accumulated while a `recording()` context is active."""
+
+    def __init__(self) -> None:
+        self.counters: Counter[str] = Counter()
+        self.timers: dict[str, list[float]] = {}
+
+    def snapshot(self) -> Snapshot:
+        return _make_snapshot(self.counters, self.timers)
+
+
+def enable() -> None:
+    """Start counting and timing; calling it again has no effect."""
+    if STATE.enabled:
+        return
+    _install()
+    STATE.enabled = True
+
+
+def disable() -> None:
+    """Stop counting and timing, restoring the original functions; totals are kept."""
+    STATE.enabled = False
+    while _patches:
+        owner, attribute, original = _patches.pop()
+        if original is _MISSING:
+            delattr(owner, attribute)
+        else:
+            setattr(owner, attribute, original)
+
+
+def is_enabled() -> bool:
+    return STATE.enabled
+
+
+def reset() -> None:
+    """Clear the global totals (active recordings are unaffected)."""
+    _counters.clear()
+    _timers.clear()
+
+
+def snapshot() -> Snapshot:
+    """Copy of the totals since the last `reset()`."""
+    return _make_snapshot(_counters, _timers)
+
+
+@contextmanager
+def recording() -> Generator[Recording]:
+    """Account separately for everything recorded in this context (this thread or task only)."""
+    current = Recording()
+    token = _active.set((*_active.get(), current))
+    try:
+        yield current
+    finally:
+        _active.reset(token)
+
+
+def count(event: str, n: int = 1) -> None:
+    _counters[event] += n
+    for active in _active.get():
+        active.counters[event] += n
+
+
+def observe(name: str, seconds: float) -> None:
+    _add_time(_timers, name, seconds)
+    for active in _active.get():
+        _add_time(active.timers, name, seconds)
+
+
+def timed[F: Callable[..., Any]](name: str) -> Callable[[F], F]:
+    """Time every call of the decorated entry point while instrumentation is enabled.
+
+    When disabled, the only cost is one flag check per call.
+    """
+
+    def decorator(function: F) -> F:
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            if not STATE.enabled:
+                return function(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                observe(name, time.perf_counter() - start)
+
+        return wrapper  # type: ignore
+
+    return decorator
+
+
+def _add_time(timers: dict[str, list[float]], name: str, seconds: float) -> None:
+    stats = timers.setdefault(name, [0, 0.0])
+    stats[0] += 1
+    stats[1] += seconds
+
+
+def _make_snapshot(counters: Counter[str], timers: dict[str, list[float]]) -> Snapshot:
+    return Snapshot(
+        dict(counters),
+        {name: TimerStats(int(calls), seconds) for name, (calls, seconds) in timers.items()},
+    )
+
+
+def _patch(owner: Any, attribute: str, replacement: Any) -> None:
+    _patches.append((owner, attribute, vars(owner).get(attribute, _MISSING)))
+    setattr(owner, attribute, replacement)
+
+
+def _install() -> None:
+    for cls in (core.Date, core.Time, core.DateTime):
+        _patch(cls, "__init__", _counting_init(cls.__init__))
+        _patch(cls, "parse", classmethod(_counted(f"parse:{cls.__name__}", cls.parse.__func__)))
+    _patch(core, "validate_date", _counted("validate:Date", core.validate_date))
+    _patch(core, "validate_time", _counted("validate:Time", core.validate_time))
+
+    for cls in _subclasses(AbstractRange):
+        if "__iter__" in cls.__dict__:
+            _patch(cls, "__iter__", _counting_iter(cls.__dict__["__iter__"]))
+
+
+def _subclasses(cls: type) -> list[type]:
+    found = [cls]
+    for subclass in cls.__subclasses__():
+        found.extend(c for c in _subclasses(subclass) if c not in found)
+    return found
+
+
+def _counted[F: Callable[..., Any]](event: str, function: F) -> F:
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        count(event)
+        return function(*args, **kwargs)
+
+    return wrapper  # type: ignore
+
+
+def _counting_init(init: Callable[..., None]) -> Callable[..., None]:
+    @wraps(init)
+    def wrapper(self, *args, **kwargs):
+        count(f"construct:{type(self).__name__}")
+        init(self, *args, **kwargs)
+
+    return wrapper
+
+
+def _counting_iter(iterate: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    @wraps(iterate)
+    def wrapper(self):
+        count(f"iterate:{type(self).__name__}")
+        return iterate(self)
+
+    return wrapper
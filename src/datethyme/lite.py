@@ -0,0 +1,872 @@
+"""
+Slotted, immutable `Date`, `Time`, `DateTime`, spans and ranges without pydantic models.
+
+For pure computation, where constructing and holding pydantic models dominates run time and
+memory. The classes have the API and the string form of their counterparts in `datethyme.core`:
+construction, comparison, hashing, arithmetic and conversion to and from numbers are implemented
+here, and every other public attribute is looked up on the core counterpart (`to_model(self)`),
+with core values in its arguments and its result converted. They compare equal to their core
+counterparts. What differs:
+
+- constructors check their fields with the same validators as core, without building a model;
+  `parse`, `if_valid` and `model_validate` accept the same raw input
+- instances cannot be modified, so the span methods that work in place in core (`with_start`,
+  `round_minutes`, `forward_affine_transform`, ...) return a new span, and ranges keep no
+  iteration state (`TimeRange` and `DateTimeRange` iterate with a generator)
+- there are no fixed-unit range classes (`HourRange` etc.); pass `unit=` to the generic ranges
+
+`from_model` and `to_model` convert between the two families. As fields of pydantic models, the
+lite atoms validate like their core counterparts and serialize to the same strings:
+
+```python
+from datethyme import lite
+
+class Meeting(BaseModel):
+    start: lite.Time
+
+Meeting.model_validate({"start": "09:30"}).model_dump()  # {"start": "09:30"}
+```
+"""
+
+from __future__ import annotations
+
+import datetime as DATETIME
+from collections.abc import Callable, Iterator
+from functools import cache, wraps
+from types import FunctionType, MethodType
+from typing import Any, ClassVar, Self
+
+from pydantic import GetCoreSchemaHandler
+from pydantic_core import CoreSchema, core_schema
+
+from . import _abcs, core
+from .constants import Unit
+from .exceptions import DateValidationError, TimeValidationError
+from .utils import MAX_DAYS, validate_date, validate_time
+
+_set = object.__setattr__
+
+
+def _restore[T](cls: type[T], state: dict[str, Any]) -> T:
+    instance = object.__new__(cls)
+    for name, value in state.items():
+        _set(instance, name, value)
+    return instance
+
+
+@cache
+def _slot_names(cls: type) -> tuple[str, ...]:
+    return tuple(name for base in cls.__mro__ for name in vars(base).get("__slots__", ()))
+
+
+class _Counterpart(type):
+    """Look up public class attributes not defined here (e.g. `Date.today`) on the core class."""
+
+    def __getattr__(cls, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(f"type object {cls.__name__!r} has no attribute {name!r}")
+        return _lifted(getattr(cls._model, name))
+
+
+class _Immutable(metaclass=_Counterpart):
+    """Slotted and immutable; public attributes not defined here are those of `to_model(self)`."""
+
+    __slots__ = ()
+    _model: ClassVar[type]
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable; cannot set {name!r}")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable; cannot delete {name!r}")
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_") or name in _slot_names(type(self)):
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        return _lifted(getattr(to_model(self), name))  # type: ignore[arg-type]
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return _restore, (type(self), self._state())
+
+    def _state(self) -> dict[str, Any]:
+        return {name: getattr(self, name) for name in _slot_names(type(self))}
+
+
+def _delegated(name: str) -> Callable[..., Any]:
+    """Operator `name` (which Python looks up on the class only) of the core counterpart."""
+
+    def method(self: _Immutable, *args: Any) -> Any:
+        return _lifted(getattr(to_model(self), name)(*map(_lowered, args)))  # type: ignore
+
+    method.__name__ = name
+    return method
+
+
+# --- ELEMENTARY TYPES ---------------------------------------------------------------------------
+
+
+def _check_date(year: int, month: int, day: int) -> None:
+    """The checks of `validate_date` and the field constraints of `core.Date`, for numbers."""
+    if not (1970 < year <= 1_000_000 and month in MAX_DAYS and 0 < day <= MAX_DAYS[month]):
+        raise DateValidationError.from_value((year, month, day))
+
+
+def _check_time(hour: int, minute: int, second: float) -> None:
+    """The checks of `validate_time`, for numbers."""
+    if not (0 <= hour <= 24 and 0 <= minute < 60 and 0 <= second < 60):
+        raise TimeValidationError.from_value((hour, minute, second))
+
+
+class _Atom(_Immutable):
+    """Construction, validation and pydantic integration shared by `Date`, `Time`, `DateTime`."""
+
+    __slots__ = ()
+    _model: ClassVar[type[core.Date | core.Time | core.DateTime]]
+    _parse: ClassVar[Callable[[Any], dict[str, int | float]]]
+
+    @classmethod
+    def model_validate(cls, raw: Any) -> Self:
+        """Same input as the `model_validate` of the core type; instances pass through."""
+        if isinstance(raw, cls):
+            return raw
+        if isinstance(raw, cls._model):
+            return from_model(raw)  # type: ignore[return-value]
+        return cls(**cls._parse(raw))
+
+    @classmethod
+    def parse(cls, raw: str) -> Self:
+        return cls.model_validate(raw)
+
+    @classmethod
+    def if_valid(cls, raw: object) -> Self | None:
+        try:
+            return cls.model_validate(raw)
+        except Exception:
+            return None
+
+    def model_copy(self) -> Self:
+        return self
+
+    def model_dump(self) -> str:
+        return str(self)
+
+    def __bool__(self) -> bool:
+        return True
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self})"
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: GetCoreSchemaHandler) -> CoreSchema:
+        return core_schema.no_info_plain_validator_function(
+            cls.model_validate, serialization=core_schema.to_string_ser_schema(when_used="always")
+        )
+
+
+class Date(_Atom):
+    __slots__ = ("day", "month", "year")
+    _model = core.Date
+    _parse = staticmethod(validate_date)
+
+    year: int
+    month: int
+    day: int
+
+    def __init__(self, year: int, month: int, day: int) -> None:
+        _check_date(year, month, day)
+        _set(self, "year", int(year))
+        _set(self, "month", int(month))
+        _set(self, "day", int(day))
+
+    @classmethod
+    def from_ordinal(cls, ord: int) -> Self:
+        d = DATETIME.date.fromordinal(ord)
+        return cls(d.year, d.month, d.day)
+
+    @property
+    def stdlib(self) -> DATETIME.date:
+        return DATETIME.date(self.year, self.month, self.day)
+
+    @property
+    def ordinal(self) -> int:
+        return self.stdlib.toordinal()
+
+    def __str__(self) -> str:
+        return f"{self.year}-{self.month:0>2}-{self.day:0>2}"
+
+    def __add__(self, days: int) -> Date:
+        return Date.from_ordinal(self.ordinal + int(days))
+
+    def __sub__(self, subtrahend: Date | int) -> Date | int:
+        if isinstance(subtrahend, int):
+            return Date.from_ordinal(self.ordinal - subtrahend)
+        if not isinstance(subtrahend, Date | core.Date):
+            raise TypeError("Date or int required for method __sub__ of Date.")
+        return self.ordinal - subtrahend.ordinal
+
+    def __and__(self, time: Time | DateTime) -> DateTime:
+        if isinstance(time, Time | core.Time):
+            return DateTime(self.year, self.month, self.day, time.hour, time.minute, time.second)
+        return DateTime(self.year, self.month, self.day)
+
+    def __pow__(self, other: Date) -> DateRange:
+        return DateRange(self, other)
+
+    def __int__(self) -> int:
+        return self.ordinal
+
+    def __hash__(self) -> int:
+        return hash((self.year, self.month, self.day))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DATETIME.date | Date | core.Date):
+            raise TypeError("Unsupported comparison.")
+        return (self.year, self.month, self.day) == (other.year, other.month, other.day)
+
+    def __lt__(self, other: Date) -> bool:
+        return self.ordinal < _date_ordinal(other)
+
+    def __gt__(self, other: Date) -> bool:
+        return self.ordinal > _date_ordinal(other)
+
+    def __le__(self, other: Date) -> bool:
+        return self.ordinal <= _date_ordinal(other)
+
+    def __ge__(self, other: Date) -> bool:
+        return self.ordinal >= _date_ordinal(other)
+
+    def to_hours(self) -> float:
+        return self.ordinal * 24
+
+    def to_minutes(self) -> float:
+        return self.ordinal * 1440
+
+    def to_seconds(self) -> float:
+        return self.ordinal * Unit.DAY.seconds
+
+    def days_to(self, date2: Date) -> int:
+        return date2.ordinal - self.ordinal
+
+
+def _date_ordinal(other: Any) -> int:
+    if not isinstance(other, Date | core.Date):
+        raise TypeError("Unsupported comparison.")
+    return other.ordinal
+
+
+class Time(_Atom):
+    __slots__ = ("hour", "minute", "second")
+    _model = core.Time
+    _parse = staticmethod(validate_time)
+
+    hour: int
+    minute: int
+    second: float
+
+    def __init__(self, hour: int, minute: int = 0, second: float = 0.0) -> None:
+        _check_time(hour, minute, second)
+        _set(self, "hour", int(hour))
+        _set(self, "minute", int(minute))
+        _set(self, "second", float(second))
+
+    @classmethod
+    def from_unit(
+        cls, unit: Unit, n: int | float, places: int | None = 10, allow_wrap: bool = True
+    ) -> Self:
+        day, hour, minute, second = unit.cascade(n)
+        if day and not allow_wrap:
+            raise ValueError
+        return cls(hour, minute, round(second, places))
+
+    @classmethod
+    def from_hours(cls, n: int | float, places: int | None = 10, allow_wrap: bool = True) -> Self:
+        return cls.from_unit(Unit.HOUR, n, allow_wrap=allow_wrap)
+
+    @classmethod
+    def from_minutes(cls, n: int | float, places: int | None = 10, allow_wrap: bool = True) -> Self:
+        return cls.from_unit(Unit.MINUTE, n, allow_wrap=allow_wrap)
+
+    @classmethod
+    def from_seconds(cls, n: int | float, places: int | None = 10, allow_wrap: bool = True) -> Self:
+        return cls.from_unit(Unit.SECOND, n, allow_wrap=allow_wrap)
+
+    @property
+    def triplet(self) -> tuple[int, int, float]:
+        return self.hour, self.minute, self.second
+
+    def __str__(self) -> str:
+        if self.second:
+            return f"{self.hour:0>2}:{self.minute:0>2}:{self.second:06.3f}"
+        return f"{self.hour:0>2}:{self.minute:0>2}"
+
+    def __add__(self, mins: int | float) -> Time:
+        return Time.from_minutes(min(1440, max(0, self.to_minutes() + mins)))
+
+    def __sub__(self, subtrahend: Time | int | float) -> Time | core.TimeDelta:
+        if isinstance(subtrahend, Time | core.Time):
+            return core.TimeDelta(self.to_seconds() - subtrahend.to_seconds())
+        if isinstance(subtrahend, int | float):
+            return Time.from_minutes(min(1440, max(0, self.to_minutes() - subtrahend)))
+        raise TypeError
+
+    def __and__(self, date: Date) -> DateTime:
+        return DateTime(date.year, date.month, date.day, self.hour, self.minute, self.second)
+
+    def __rshift__(self, other: Time) -> TimeSpan:
+        return TimeSpan(self, other)
+
+    def to(self, other: Time) -> TimeSpan:
+        return TimeSpan(self, other)
+
+    def span(self, other: Time, name: str | None = None) -> TimeSpan:
+        return TimeSpan(self, other, name)
+
+    def __hash__(self) -> int:
+        return hash((self.hour, self.minute, self.second))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Time | core.Time):
+            return False
+        return self.to_seconds() == other.to_seconds()
+
+    def __lt__(self, other: Time) -> bool:
+        return self.to_minutes() < _time_minutes(other)
+
+    def __gt__(self, other: Time) -> bool:
+        return self.to_minutes() > _time_minutes(other)
+
+    def __le__(self, other: Time) -> bool:
+        return self.to_minutes() <= _time_minutes(other)
+
+    def __ge__(self, other: Time) -> bool:
+        return self.to_minutes() >= _time_minutes(other)
+
+    def to_hours(self, places: int | None = 10) -> float:
+        return round(self.hour + self.minute / 60 + self.second / Unit.HOUR.seconds, places or 1)
+
+    def to_minutes(self, places: int | None = 10) -> float:
+        return round(60.0 * self.hour + self.minute + self.second / 60.0, places or 1)
+
+    def to_seconds(self, places: int | None = 10) -> float:
+        raw = Unit.HOUR.seconds * self.hour + 60.0 * self.minute + self.second
+        return round(raw, places or 1)
+
+    def add_hours(self, n: int | float) -> Time:
+        return Time.from_hours(self.to_hours() + n)
+
+    def add_minutes(self, n: int | float) -> Time:
+        return Time.from_minutes(self.to_minutes() + n)
+
+    def add_seconds(self, n: int | float) -> Time:
+        return Time.from_seconds(self.to_seconds() + n)
+
+    def minutes_to(self, other: Time) -> float:
+        return other.to_minutes() - self.to_minutes()
+
+    def minutes_from(self, other: Time) -> float:
+        return self.to_minutes() - other.to_minutes()
+
+    def hours_to(self, other: Time) -> float:
+        return other.to_hours() - self.to_hours()
+
+    def hours_from(self, other: Time) -> float:
+        return self.to_hours() - other.to_hours()
+
+
+def _time_minutes(other: Any) -> float:
+    if not isinstance(other, Time | core.Time):
+        raise TypeError("Unsupported comparison.")
+    return other.to_minutes()
+
+
+class DateTime(_Atom):
+    __slots__ = ("day", "hour", "minute", "month", "second", "year")
+    _model = core.DateTime
+    _parse = staticmethod(core.DateTime.validate_datetime)
+
+    year: int
+    month: int
+    day: int
+    hour: int
+    minute: int
+    second: float
+
+    def __init__(
+        self,
+        year: int,
+        month: int,
+        day: int,
+        hour: int = 0,
+        minute: int = 0,
+        second: float = 0.0,
+    ) -> None:
+        _check_date(year, month, day)
+        _check_time(hour, minute, second)
+        _set(self, "year", int(year))
+        _set(self, "month", int(month))
+        _set(self, "day", int(day))
+        _set(self, "hour", int(hour))
+        _set(self, "minute", int(minute))
+        _set(self, "second", float(second))
+
+    @classmethod
+    def from_pair(cls, d: Date, t: Time) -> Self:
+        return cls(d.year, d.month, d.day, t.hour or 0, t.minute or 0, t.second or 0.0)
+
+    @property
+    def date(self) -> Date:
+        return Date(self.year, self.month, self.day)
+
+    @property
+    def time(self) -> Time:
+        return Time(self.hour, self.minute, self.second)
+
+    def __str__(self) -> str:
+        seconds = f":{self.second:0>6.3f}" if self.second else ""
+        return (
+            f"{self.year}-{self.month:0>2}-{self.day:0>2}"
+            f"_{self.hour:0>2}:{self.minute:0>2}{seconds}"
+        )
+
+    def __rshift__(self, other: DateTime) -> DateTimeSpan:
+        return DateTimeSpan(self, other)
+
+    def __hash__(self) -> int:
+        return hash(self._values())
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DateTime | core.DateTime):
+            return False
+        return self._values() == _six(other)
+
+    # the same (partial) order as `core.DateTime`
+    def __lt__(self, other: DateTime) -> bool:
+        other = _datetime(other)
+        return self.date < other.date and self.time < other.time
+
+    def __gt__(self, other: DateTime) -> bool:
+        other = _datetime(other)
+        return self.date > other.date and self.time > other.time
+
+    def __le__(self, other: DateTime) -> bool:
+        other = _datetime(other)
+        return self.date <= other.date and self.time <= other.time
+
+    def __ge__(self, other: DateTime) -> bool:
+        other = _datetime(other)
+        return self.date >= other.date and self.time >= other.time
+
+    def to_hours(self) -> float:
+        return self.date.to_hours() + self.time.to_hours()
+
+    def to_minutes(self) -> float:
+        return self.date.to_minutes() + self.time.to_minutes()
+
+    def to_seconds(self, places: int = 10) -> float:
+        return round(self.date.to_seconds() + self.time.to_seconds(), places)
+
+    def add_hours(self, n: int | float) -> DateTime:
+        days, hours = divmod(self.time.to_hours() + n, 24)
+        return (self.date + int(days)) & Time.from_hours(hours)
+
+    def add_minutes(self, n: int | float) -> DateTime:
+        days, minutes = divmod(int(self.time.to_minutes() + n), 1440)
+        return (self.date + days) & Time.from_minutes(minutes)
+
+    def add_seconds(self, n: int | float) -> DateTime:
+        days, seconds = divmod(int(self.time.to_seconds() + n), Unit.DAY.seconds)
+        return (self.date + days) & Time.from_seconds(seconds)
+
+    def minutes_to(self, other: DateTime) -> float:
+        return other.to_minutes() - self.to_minutes()
+
+    def minutes_from(self, other: DateTime) -> float:
+        return self.to_minutes() - other.to_minutes()
+
+    def _values(self) -> tuple[int, int, int, int, int, float]:
+        return _six(self)
+
+
+def _six(d: DateTime | core.DateTime) -> tuple[int, int, int, int, int, float]:
+    return d.year, d.month, d.day, d.hour, d.minute, d.second
+
+
+def _datetime(other: Any) -> DateTime | core.DateTime:
+    if not isinstance(other, DateTime | core.DateTime):
+        raise TypeError("Invalid comparison.")
+    return other
+
+
+# --- SPAN TYPES ---------------------------------------------------------------------------------
+
+
+class _Span[Atom: (Time, DateTime)](_Immutable):
+    """Bounds, identity, and immutable versions of the span methods that work in place in core."""
+
+    __slots__ = ("_end", "_name", "_start")
+
+    _start: Atom
+    _end: Atom
+    _name: str | None
+
+    def __init__(self, start: Atom, end: Atom, name: str | None = None) -> None:
+        _set(self, "_start", start)
+        _set(self, "_end", end)
+        _set(self, "_name", name)
+
+    @property
+    def start(self) -> Atom:
+        return self._start
+
+    @property
+    def end(self) -> Atom:
+        return self._end
+
+    @property
+    def span(self) -> Self:
+        return self
+
+    def __hash__(self) -> int:
+        return hash((self._start, self._end, self._name))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, _abcs.AbstractSpan):
+            return self.start == other.start and self.end == other.end
+        return False
+
+    def __bool__(self) -> bool:
+        return self.end > self.start
+
+    __contains__ = _delegated("__contains__")
+
+    def _with(self, start: Atom, end: Atom) -> Self:
+        return self.__class__(start, end, self._name)
+
+    def with_start(self, new_start: Atom) -> Self:
+        if new_start < self._start:
+            return self._with(new_start, self._end)
+        raise ValueError
+
+    def with_end(self, new_end: Atom) -> Self:
+        if new_end > self._start:
+            return self._with(self._start, new_end)
+        raise ValueError
+
+    def shift_start_rigid(self, new_start: Atom) -> Self:
+        shift = self._start.seconds_to(new_start)
+        return self._with(new_start, self._end.add_seconds(shift))
+
+    def shift_end_rigid(self, new_end: Atom) -> Self:
+        shift = self._end.seconds_to(new_end)
+        return self._with(self._start.add_seconds(shift), new_end)
+
+    def round_hours(self, round_to: int | float = 0, round_down: bool = False) -> Self:
+        return self._with(
+            self._start.round_hours(round_to=round_to, round_down=round_down),
+            self._end.round_hours(round_to=round_to, round_down=round_down),
+        )
+
+    def round_minutes(self, round_to: int | float = 0, round_down: bool = False) -> Self:
+        return self._with(
+            self._start.round_minutes(round_to=round_to, round_down=round_down),
+            self._end.round_minutes(round_to=round_to, round_down=round_down),
+        )
+
+    def round_seconds(self, round_to: float = 0, round_down: bool = False) -> Self:
+        return self._with(
+            self._start.round_seconds(round_to=round_to, round_down=round_down),
+            self._end.round_seconds(round_to=round_to, round_down=round_down),
+        )
+
+    def forward_affine_transform(
+        self,
+        *,
+        scale_factor: float,
+        new_start: Atom | None = None,
+        min_minutes: int | float = 5,
+    ) -> Self:
+        start = new_start or self._start
+        minutes = self._start.minutes_to(self._end)
+        return self._with(start, start.add_minutes(max(min_minutes, scale_factor * minutes)))
+
+    def backward_affine_transform(
+        self,
+        *,
+        scale_factor: float,
+        new_end: Atom | None = None,
+        min_minutes: int | float = 5,
+    ) -> Self:
+        end = new_end or self._end
+        minutes = self._start.minutes_to(self._end)
+        return self._with(end.add_minutes(-max(min_minutes, scale_factor * minutes)), end)
+
+
+class TimeSpan(_Span[Time]):
+    __slots__ = ()
+    _model = core.TimeSpan
+
+    @property
+    def name(self) -> str:
+        return self._name or f"TimeSpan[id{hash(self)}]"
+
+    @property
+    def id(self) -> str:
+        return self.name
+
+    @property
+    def days(self) -> float:
+        return self.minutes / 1440
+
+    @property
+    def hours(self) -> float:
+        return self.minutes / 60
+
+    @property
+    def minutes(self) -> float:
+        return self.end.to_minutes() - self.start.to_minutes()
+
+    @property
+    def seconds(self) -> float:
+        return self.end.to_seconds() - self.start.to_seconds()
+
+
+class DateTimeSpan(_Span[DateTime]):
+    __slots__ = ()
+    _model = core.DateTimeSpan
+
+
+# --- RANGE TYPES --------------------------------------------------------------------------------
+
+
+class _Range(_Immutable):
+    """Fields, identity and `with_end`/`without_end`; ranges keep no iteration state."""
+
+    __slots__ = ("inclusive", "start", "step", "stop")
+
+    def __eq__(self, other: object) -> bool:
+        return all((
+            self.start == other.start,  # type: ignore[attr-defined]
+            self.stop == other.stop,  # type: ignore[attr-defined]
+            self.step == other.step,  # type: ignore[attr-defined]
+            self.inclusive == other.inclusive,  # type: ignore[attr-defined]
+        ))
+
+    def __hash__(self) -> int:
+        return hash((hash(self.start), hash(self.stop), self.step, self.inclusive))
+
+    __len__ = _delegated("__len__")
+    __contains__ = _delegated("__contains__")
+    __getitem__ = _delegated("__getitem__")
+    __reversed__ = _delegated("__reversed__")
+
+    def _with_inclusive(self, inclusive: bool) -> Self:
+        return _restore(type(self), self._state() | {"inclusive": inclusive})
+
+    def with_end(self) -> Self:
+        return self._with_inclusive(True)
+
+    def without_end(self) -> Self:
+        return self._with_inclusive(False)
+
+
+class DateRange(_Range):
+    __slots__ = ()
+    _model = core.DateRange
+
+    start: Date
+    stop: Date
+    step: int
+    inclusive: bool
+
+    def __init__(self, start: Date, stop: Date, step: int = 1, inclusive: bool = False) -> None:
+        _set(self, "start", start)
+        _set(self, "stop", stop)
+        _set(self, "step", step)
+        _set(self, "inclusive", inclusive)
+
+    def __iter__(self) -> Iterator[Date]:
+        current = self.start
+        while (self.step > 0 and current < self.stop) or (self.step < 0 and current > self.stop):
+            yield current
+            current += self.step
+
+    __repr__ = _delegated("__repr__")
+
+
+class _TimeRange[T: (Time, DateTime), U: Unit](_Range):
+    __slots__ = ("allow_wraparound", "unit")
+
+    start: T
+    stop: T
+    step: int
+    inclusive: bool
+    unit: U
+    allow_wraparound: bool
+
+    def __init__(
+        self,
+        start: T,
+        stop: T,
+        *,
+        unit: U,
+        step: int = 1,
+        inclusive: bool = False,
+        allow_wraparound: bool = True,
+    ) -> None:
+        _set(self, "unit", unit)
+        _set(self, "start", start)
+        _set(self, "stop", stop)
+        _set(self, "step", step)
+        _set(self, "inclusive", inclusive)
+        _set(self, "allow_wraparound", allow_wraparound)
+
+    def __iter__(self) -> Iterator[T]:
+        seconds = self.step * self.unit.seconds
+        limit = self.stop.to_seconds()
+        current = self.start
+        while (position := current.to_seconds()) < limit or (self.inclusive and position == limit):
+            yield current
+            following = current.add_seconds(seconds)
+            if following.to_seconds() <= position:  # wrapped around midnight
+                return
+            current = following
+
+
+class TimeRange[U: Unit](_TimeRange[Time, U]):
+    __slots__ = ()
+    _model = core.TimeRange
+
+
+class DateTimeRange[U: Unit](_TimeRange[DateTime, U]):
+    __slots__ = ()
+    _model = core.DateTimeRange
+
+
+DAY_START = Time(hour=0)
+DAY_END = Time(hour=24)
+
+# the spans and ranges of core compare equal to any AbstractSpan/AbstractRange
+for _span in (TimeSpan, DateTimeSpan):
+    _abcs.AbstractSpan.register(_span)
+for _range in (DateRange, TimeRange, DateTimeRange):
+    _abcs.AbstractRange.register(_range)
+
+
+# --- CONVERSION ---------------------------------------------------------------------------------
+
+type LiteValue = (
+    Date | Time | DateTime | TimeSpan | DateTimeSpan | DateRange | TimeRange | DateTimeRange
+)
+type ModelValue = (
+    core.Date
+    | core.Time
+    | core.DateTime
+    | core.TimeSpan
+    | core.DateTimeSpan
+    | core.DateRange
+    | core.TimeRange
+    | core.DateTimeRange
+)
+
+_COUNTERPARTS: dict[type, type] = {
+    core.Date: Date,
+    core.Time: Time,
+    core.DateTime: DateTime,
+    core.TimeSpan: TimeSpan,
+    core.DateTimeSpan: DateTimeSpan,
+    core.DateRange: DateRange,
+    core.TimeRange: TimeRange,
+    core.DateTimeRange: DateTimeRange,
+}
+_MODELS = {lite: model for model, lite in _COUNTERPARTS.items()}
+
+
+def from_model(value: ModelValue) -> LiteValue:
+    """The lite counterpart of a core date, time, datetime, span or range.
+
+    Raises:
+        TypeError: if `value` is none of these
+    """
+    return _convert(value, _COUNTERPARTS)
+
+
+def to_model(value: LiteValue) -> ModelValue:
+    """The core (pydantic) counterpart of a lite date, time, datetime, span or range.
+
+    Raises:
+        TypeError: if `value` is none of these
+    """
+    return _convert(value, _MODELS)
+
+
+def _lifted(value: Any) -> Any:
+    """`value` with the core values in it made lite; methods are wrapped to do the same."""
+    if _counterpart(value, _COUNTERPARTS) is not None:
+        return from_model(value)
+    match value:
+        case MethodType() | FunctionType():
+            return _lifting(value)
+        case list():
+            return [_lifted(item) for item in value]
+        case tuple():
+            return tuple(_lifted(item) for item in value)
+        case Iterator():
+            return map(_lifted, value)
+    return value
+
+
+def _lowered(value: Any) -> Any:
+    """`value` with the lite values in it made core values."""
+    if _counterpart(value, _MODELS) is not None:
+        return to_model(value)
+    match value:
+        case list():
+            return [_lowered(item) for item in value]
+        case tuple():
+            return tuple(_lowered(item) for item in value)
+    return value
+
+
+def _lifting(method: Callable[..., Any]) -> Callable[..., Any]:
+    """Call a core `method` with lite arguments, returning lite values."""
+
+    @wraps(method)
+    def lifted(*args: Any, **kwargs: Any) -> Any:
+        lowered = {name: _lowered(argument) for name, argument in kwargs.items()}
+        return _lifted(method(*map(_lowered, args), **lowered))
+
+    return lifted
+
+
+def _counterpart(value: Any, counterparts: dict[type, type]) -> type | None:
+    return next((counterparts[cls] for cls in type(value).__mro__ if cls in counterparts), None)
+
+
+def _convert(value: Any, counterparts: dict[type, type]) -> Any:
+    target = _counterpart(value, counterparts)
+    if target is None:
+        raise TypeError(f"No counterpart for {type(value).__name__}.")
+    match value:
+        case core.Date() | core.Time() | core.DateTime():
+            return target(**{name: getattr(value, name) for name in type(value).model_fields})
+        case Date() | Time() | DateTime():
+            return target.model_construct(**value._state())
+        case core.TimeSpan() | core.DateTimeSpan() | TimeSpan() | DateTimeSpan():
+            start = _convert(value.start, counterparts)
+            return target(start, _convert(value.end, counterparts), value._name)
+        case core.DateRange() | DateRange():
+            return target(
+                _convert(value.start, counterparts),
+                _convert(value.stop, counterparts),
+                step=value.step,
+                inclusive=value.inclusive,
+            )
+        case _:
+            return target(
+                _convert(value.start, counterparts),
+                _convert(value.stop, counterparts),
+                unit=value.unit,
+                step=value.step,
+                inclusive=value.inclusive,
+                allow_wraparound=value.allow_wraparound,
+            )
@@ -1,14 +1,61 @@
+from typing import TYPE_CHECKING, Any
+
+from .._lazy import listing, load
 from ..protocols import EntryProtocol
-from .types import (
-    # EntryAdapter,
-    Calendar,
-    DateTimePartition,
-    Entries,
-    Entry,
-    SchedulingLog,
-    TimePartition,
-    make_entry_adapter,
-)
+
+if TYPE_CHECKING:
+    from . import algorithms as algorithms
+    from . import allocation as allocation
+    from . import backends as backends
+    from . import dependencies as dependencies
+    from . import freebusy as freebusy
+    from . import rollups as rollups
+    from . import types as types
+    from . import utils as utils
+    from .freebusy import find_slots, free_busy
+    from .rollups import rollup, rollup_by_period
+    from .types import (
+        # EntryAdapter,
+        Calendar,
+        DateTimePartition,
+        Entries,
+        Entry,
+        SchedulingLog,
+        TimePartition,
+        make_entry_adapter,
+    )
+
+# the calendar types pull in adiumentum and build pydantic models, so they load on first use
+__lazy__ = {
+    "Calendar": ".types",
+    "DateTimePartition": ".types",
+    "Entries": ".types",
+    "Entry": ".types",
+    "SchedulingLog": ".types",
+    "TimePartition": ".types",
+    "make_entry_adapter": ".types",
+    "find_slots": ".freebusy",
+    "free_busy": ".freebusy",
+    "rollup": ".rollups",
+    "rollup_by_period": ".rollups",
+    "algorithms": ".algorithms",
+    "allocation": ".allocation",
+    "backends": ".backends",
+    "dependencies": ".dependencies",
+    "freebusy": ".freebusy",
+    "rollups": ".rollups",
+    "types": ".types",
+    "utils": ".utils",
+}
+
+
+def __getattr__(name: str) -> Any:
+    return load(__name__, __lazy__, name)
+
+
+def __dir__() -> list[str]:
+    return listing(__name__, __lazy__)
+
 
 __all__ = (
     "Calendar",
@@ -18,6 +65,10 @@ __all__ = (
     "EntryProtocol",
     "SchedulingLog",
     "TimePartition",
+    "find_slots",
+    "free_busy",
     "make_entry_adapter",
+    "rollup",
+    "rollup_by_period",
     # "EntryAdapter",
 )
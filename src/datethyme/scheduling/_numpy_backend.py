@@ -0,0 +1,225 @@
+"""
+NumPy implementations of the algorithms in `datethyme.scheduling.algorithms`.
+
+Imported by the backend registry the first time the "numpy" backend is selected. Each function
+reads the span boundaries into arrays once, computes every new boundary in a few array
+operations and only then builds the resulting spans, so the per-span Python work is limited to
+the final copies. Results are always new spans; the inputs are never modified.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Literal
+
+import numpy as np
+
+from ..protocols import SpanProtocol, TimeProtocol
+from .algorithms import SpanList, SpanTuple, _point_at, with_bounds
+from .backends import implementation, register
+
+
+def _bounds[T: TimeProtocol](seq: Sequence[SpanProtocol[T]]) -> tuple[np.ndarray, np.ndarray]:
+    n = len(seq)
+    starts = np.fromiter((span.start.to_minutes() for span in seq), dtype=float, count=n)
+    ends = np.fromiter((span.end.to_minutes() for span in seq), dtype=float, count=n)
+    return starts, ends
+
+
+def _lengths[T: TimeProtocol](seq: Sequence[SpanProtocol[T]]) -> np.ndarray:
+    return np.fromiter((span.minutes for span in seq), dtype=float, count=len(seq))
+
+
+def _rebuild[T: TimeProtocol](
+    seq: Sequence[SpanProtocol[T]],
+    starts: np.ndarray,
+    ends: np.ndarray,
+    new_starts: np.ndarray,
+    new_ends: np.ndarray,
+) -> SpanList[T]:
+    changed = (new_starts != starts) | (new_ends != ends)
+    spans = list(seq)
+    for i in np.flatnonzero(changed).tolist():
+        span = spans[i]
+        spans[i] = with_bounds(
+            span, _point_at(span, float(new_starts[i])), _point_at(span, float(new_ends[i]))
+        )
+    return spans
+
+
+def _piece[T: TimeProtocol](span: SpanProtocol[T], start: float, end: float) -> SpanProtocol[T]:
+    if start == span.start.to_minutes() and end == span.end.to_minutes():
+        return span
+    return with_bounds(span, _point_at(span, start), _point_at(span, end))
+
+
+@register("get_relative_lengths", "numpy")
+def get_relative_lengths[T: TimeProtocol](seq: Sequence[SpanProtocol[T]]) -> list[float]:
+    lengths = _lengths(seq)
+    return (lengths / lengths.sum()).tolist()
+
+
+@register("get_total_length", "numpy")
+def get_total_length[T: TimeProtocol](seq: Sequence[SpanProtocol[T]]) -> float:
+    return float(_lengths(seq).sum())
+
+
+@register("squeeze_boundaries", "numpy")
+def squeeze_boundaries(
+    durations: Sequence[float],
+    *,
+    mode: Literal["PROPORTIONAL", "EQUAL"],
+    lower: float,
+    upper: float,
+    min_minutes: float = 0.0,
+) -> list[float]:
+    if mode == "PROPORTIONAL":
+        weights = np.asarray(durations, dtype=float)
+    elif mode == "EQUAL":
+        weights = np.ones(len(durations))
+    else:
+        raise ValueError(f"Invalid mode for method 'squeeze': '{mode}'")
+    lengths = _water_fill(weights, upper - lower, min_minutes)
+    return np.concatenate(([lower], lower + np.cumsum(lengths))).tolist()
+
+
+def _water_fill(lengths: np.ndarray, total: float, floor: float) -> np.ndarray:
+    """Array version of `algorithms.water_fill`: every candidate clamp count is tested at once."""
+    n = len(lengths)
+    if total < n * floor:
+        raise ValueError(f"Cannot fit {n} elements of at least {floor} minutes into {total}.")
+    if not n:
+        return lengths
+    order = np.argsort(lengths, kind="stable")
+    ascending = lengths[order]
+    # with the k shortest clamped: budget = total - k * floor, remaining = sum of the others
+    budget = total - floor * np.arange(n)
+    remaining = ascending.sum() - np.concatenate(([0.0], np.cumsum(ascending)[:-1]))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        fits = (remaining > 0) & (ascending * budget / remaining >= floor)
+    if not fits.any():
+        return np.full(n, floor + (total - n * floor) / n)
+    n_clamped = int(np.argmax(fits))
+    result = lengths * (budget[n_clamped] / remaining[n_clamped])
+    result[order[:n_clamped]] = floor
+    return result
+
+
+@register("stack_boundaries", "numpy")
+def stack_boundaries(
+    starts: Sequence[float],
+    ends: Sequence[float],
+    *,
+    mode: Literal["FORWARD", "OUTWARD", "BACKWARD"],
+    anchor: float | None = None,
+) -> list[float]:
+    starts_, ends_ = np.asarray(starts, dtype=float), np.asarray(ends, dtype=float)
+    durations = ends_ - starts_
+    if mode == "FORWARD":
+        offset = starts_.min() if anchor is None else anchor
+    elif mode == "BACKWARD":
+        offset = (ends_.max() if anchor is None else anchor) - durations.sum()
+    elif mode == "OUTWARD":
+        midpoint = (starts_.min() + ends_.max()) / 2
+        central = int(np.argmin(np.abs((starts_ + ends_) / 2 - midpoint)))
+        offset = starts_[central] - durations[:central].sum()
+    else:
+        raise ValueError(f"Invalid mode for method 'stack': '{mode}'")
+    return np.concatenate(([offset], offset + np.cumsum(durations))).tolist()
+
+
+@register("resolve_gaps", "numpy")
+def resolve_gaps[T: TimeProtocol](
+    seq: Sequence[SpanProtocol[T]],
+    mode: Literal["EQUAL", "PROPORTIONAL", "INVERSE", "SNAP_FORWARD", "SNAP_BACK"],
+) -> SpanTuple[T]:
+    """EQUAL and the SNAP modes move each border independently of the others and are
+    vectorized; the proportional modes depend on the previous pair's result and stay pure."""
+    if mode not in {"EQUAL", "SNAP_FORWARD", "SNAP_BACK"} or len(seq) < 2:
+        return implementation("resolve_gaps", "python")(seq, mode)
+    starts, ends = _bounds(seq)
+    left, right = ends[:-1], starts[1:]
+    borders = {"EQUAL": (left + right) / 2, "SNAP_FORWARD": right, "SNAP_BACK": left}[mode]
+    gap = left < right
+    new_starts, new_ends = starts.copy(), ends.copy()
+    new_ends[:-1] = np.where(gap, borders, left)
+    new_starts[1:] = np.where(gap, borders, right)
+    return tuple(_rebuild(seq, starts, ends, new_starts, new_ends))
+
+
+@register("resolve_overlaps", "numpy")
+def resolve_overlaps[T: TimeProtocol](
+    seq: Sequence[SpanProtocol[T]],
+    mode: Literal["EQUAL", "PROPORTIONAL", "INVERSE"],
+) -> SpanTuple[T]:
+    """EQUAL splits every overlap at its midpoint at once; other modes stay pure."""
+    if mode != "EQUAL" or len(seq) < 2:
+        return implementation("resolve_overlaps", "python")(seq, mode)
+    starts, ends = _bounds(seq)
+    left, right = ends[:-1], starts[1:]
+    overlap = left > right
+    borders = (left + right) / 2
+    new_starts, new_ends = starts.copy(), ends.copy()
+    new_ends[:-1] = np.where(overlap, borders, left)
+    new_starts[1:] = np.where(overlap, borders, right)
+    return tuple(_rebuild(seq, starts, ends, new_starts, new_ends))
+
+
+@register("truncate", "numpy")
+def truncate[T: TimeProtocol](
+    seq: Sequence[SpanProtocol[T]], earliest: T, latest: T
+) -> tuple[SpanList[T], SpanList[T], SpanList[T]]:
+    starts, ends = _bounds(seq)
+    lower, upper = earliest.to_minutes(), latest.to_minutes()
+    cut_low = np.clip(lower, starts, ends)
+    cut_high = np.clip(upper, cut_low, ends)
+    parts: tuple[SpanList[T], SpanList[T], SpanList[T]] = ([], [], [])
+    rows = zip(seq, starts.tolist(), cut_low.tolist(), cut_high.tolist(), ends.tolist())
+    for span, start, low, high, end in rows:
+        for part, a, b in zip(parts, (start, low, high), (low, high, end)):
+            if a < b:
+                part.append(_piece(span, a, b))
+    return parts
+
+
+@register("eclipse_forward", "numpy")
+def eclipse_forward[T: TimeProtocol](
+    seq: Sequence[SpanProtocol[T]],
+) -> tuple[SpanTuple[T], SpanTuple[T]]:
+    if not len(seq):
+        return (), ()
+    starts, ends = _bounds(seq)
+    cursor = np.concatenate(([-np.inf], np.maximum.accumulate(ends)[:-1]))
+    cuts = np.clip(cursor, starts, ends)
+    return _split_at(seq, starts, cuts, ends, kept_first=False)
+
+
+@register("eclipse_backward", "numpy")
+def eclipse_backward[T: TimeProtocol](
+    seq: Sequence[SpanProtocol[T]],
+) -> tuple[SpanTuple[T], SpanTuple[T]]:
+    if not len(seq):
+        return (), ()
+    starts, ends = _bounds(seq)
+    cursor = np.concatenate((np.minimum.accumulate(starts[::-1])[::-1][1:], [np.inf]))
+    cuts = np.clip(cursor, starts, ends)
+    kept, rejected = _split_at(seq, starts, cuts, ends, kept_first=True)
+    return kept[::-1], rejected[::-1]
+
+
+def _split_at[T: TimeProtocol](
+    seq: Sequence[SpanProtocol[T]],
+    starts: np.ndarray,
+    cuts: np.ndarray,
+    ends: np.ndarray,
+    kept_first: bool,
+) -> tuple[SpanTuple[T], SpanTuple[T]]:
+    kept: SpanList[T] = []
+    rejected: SpanList[T] = []
+    head, tail = (kept, rejected) if kept_first else (rejected, kept)
+    for span, start, cut, end in zip(seq, starts.tolist(), cuts.tolist(), ends.tolist()):
+        if start < cut:
+            head.append(_piece(span, start, cut))
+        if cut < end:
+            tail.append(_piece(span, cut, end))
+    return tuple(kept), tuple(rejected)
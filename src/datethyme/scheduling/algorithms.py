@@ -19,12 +19,19 @@ type PairCallback[TP: TimeProtocol] = Callable[
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable
+import copy
+import math
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from functools import partial
-from itertools import pairwise
-from typing import Literal, TypeVar, overload
+from heapq import heappop, heappush
+from itertools import accumulate, pairwise
+from typing import Literal, NamedTuple, TypeVar, overload
 
+from .. import instrumentation
 from ..protocols import SpanProtocol, TimeProtocol
+from .backends import dispatched
+from .utils import from_minutes
 
 T = TypeVar("T", bound=TimeProtocol)
 type SpanPair[TP: TimeProtocol] = tuple[SpanProtocol[TP], SpanProtocol[TP]]
@@ -36,6 +43,10 @@ type PairCallback[TP: TimeProtocol] = Callable[
     SpanPair[TP],
 ]
 """Transform one pair of spans into another pair of the same type."""
+type PipelineStep[TP: TimeProtocol] = Callable[[SpanIterable[TP]], SpanIterable[TP]]
+"""One stage of a lazy span pipeline, e.g. `partial(iter_truncate, earliest=..., latest=...)`."""
+type Backend = Literal["iterative", "vectorized"]
+"""Span-by-span through the span objects, or all boundaries at once on plain minutes."""
 
 
 def snap_forward[T: TimeProtocol](first: SpanProtocol[T], second: SpanProtocol[T]) -> SpanPair[T]:
@@ -43,7 +54,7 @@ def snap_forward[T: TimeProtocol](first: SpanProtocol[T], second: SpanProtocol[T
 
     if first.end >= second.start:
         return first, second
-    return first.with_end(second.start), second
+    return with_bounds(first, first.start, second.start), second
 
 
 def snap_back[T: TimeProtocol](first: SpanProtocol[T], second: SpanProtocol[T]) -> SpanPair[T]:
@@ -51,7 +62,7 @@ def snap_back[T: TimeProtocol](first: SpanProtocol[T], second: SpanProtocol[T])
 
     if first.end >= second.start:
         return first, second
-    return first, second.with_start(first.end)
+    return first, with_bounds(second, first.end, second.end)
 
 
 def snap_between[T: TimeProtocol](
@@ -114,6 +125,7 @@ def most_central[T: TimeProtocol](seq: Iterable[T] | SpanIterable[T]) -> T | Spa
     return min(seq, key=get_midpoint_distance)
 
 
+@dispatched
 def get_relative_lengths[T: TimeProtocol](seq: SpanIterable[T]) -> list[float]:
     """Please write me!"""
 
@@ -122,6 +134,7 @@ def get_relative_lengths[T: TimeProtocol](seq: SpanIterable[T]) -> list[float]:
     return [x / total for x in lengths]
 
 
+@dispatched
 def get_total_length[T: TimeProtocol](seq: SpanIterable[T]) -> float:
     """Please write me!"""
 
@@ -129,11 +142,39 @@ def get_total_length[T: TimeProtocol](seq: SpanIterable[T]) -> float:
     return sum(lengths)
 
 
+def water_fill(lengths: Sequence[float], total: float, floor: float = 0.0) -> list[float]:
+    """Scale `lengths` to sum to `total`, raising any below `floor` to it and shrinking the rest.
+
+    The lengths that end up at `floor` are exactly the shortest ones, so a single ascending sweep
+    finds the common scale factor of the others.
+    """
+    n = len(lengths)
+    if total < n * floor:
+        raise ValueError(f"Cannot fit {n} elements of at least {floor} minutes into {total}.")
+    order = sorted(range(n), key=lengths.__getitem__)
+    budget, remaining = float(total), float(sum(lengths))
+    n_clamped = 0
+    for i in order:
+        if remaining > 0 and lengths[i] * budget / remaining >= floor:
+            break
+        budget -= floor
+        remaining -= lengths[i]
+        n_clamped += 1
+
+    if n_clamped == n:
+        return [floor + budget / n] * n if n else []
+    scale = budget / remaining
+    result = [length * scale for length in lengths]
+    for i in order[:n_clamped]:
+        result[i] = floor
+    return result
+
+
 def stack_forward[T: TimeProtocol](seq: SpanIterable[T], anchor: T | None = None) -> SpanList[T]:
     """Please write me!"""
 
     spans: SpanList[T] = []
-    anchor = anchor or earliest_start(seq)
+    seq = list(seq)
     current: T = anchor or earliest_start(seq)
     for span in seq:
         spans.append(shifted := span.shift_start_rigid(current))
@@ -146,13 +187,13 @@ def stack_backward[T: TimeProtocol](seq: SpanIterable[T], anchor: T | None = Non
     """Please write me!"""
 
     spans: SpanList[T] = []
-    anchor = anchor or latest_end(seq)
-    current: T = anchor or earliest_start(seq)
-    for span in seq:
-        spans.insert(0, shifted := span.shift_end_rigid(current))
+    seq = list(seq)
+    current: T = anchor or latest_end(seq)
+    for span in reversed(seq):
+        spans.append(shifted := span.shift_end_rigid(current))
         current = shifted.start
 
-    return spans
+    return spans[::-1]
 
 
 def stack_from_middle[T: TimeProtocol](
@@ -176,27 +217,25 @@ def apply_pairwise[T: TimeProtocol](
     pair_callback: PairCallback,
     seq: SpanIterable[T],
 ) -> SpanList[T]:
-    """Please write me!"""
-
-    if not seq:
-        return []
-    if len(seq := list(seq)) == 1:
-        return seq
+    """Apply `pair_callback` to each consecutive pair, feeding its second output forward."""
 
-    spans: SpanList[T] = []
+    return list(iter_pairwise(pair_callback, seq))
 
-    if not (remaining := seq[1:]):
-        raise ValueError("Cannot call `apply_pairwise` on a sequence of length 1.")
-    span_a, span_b = seq[0], seq[1]
-    new_b = span_b
 
-    for span_b in remaining:
-        new_a, new_b = pair_callback(span_a, span_b)
-        spans.append(new_a)
-        span_a = new_b
-    spans.append(new_b)
+def iter_pairwise[T: TimeProtocol](
+    pair_callback: PairCallback,
+    seq: SpanIterable[T],
+) -> Iterator[SpanProtocol[T]]:
+    """Lazy `apply_pairwise`: each span is yielded as soon as its successor has been read."""
 
-    return spans
+    spans = iter(seq)
+    pending = next(spans, None)
+    if pending is None:
+        return
+    for span in spans:
+        done, pending = pair_callback(pending, span)
+        yield done
+    yield pending
 
 
 def split_overlap_equal[T: TimeProtocol](
@@ -206,11 +245,11 @@ def split_overlap_equal[T: TimeProtocol](
 
     if first.end <= second.start:
         return first, second
-    new_border = first.__class__(second.start, first.end).midpoint
+    new_border = first.__class__(second.start, first.end).interior_point(0.5)
 
     return (
-        first.with_end(new_border),
-        second.with_start(new_border),
+        with_bounds(first, first.start, new_border),
+        with_bounds(second, new_border, second.end),
     )
 
 
@@ -227,7 +266,7 @@ def split_overlap_proportional[T: TimeProtocol](
     first_proportion = length_first / (length_first + length_second)
     new_border = overlap.interior_point(first_proportion)
 
-    return first.with_end(new_border), second.with_start(new_border)
+    return with_bounds(first, first.start, new_border), with_bounds(second, new_border, second.end)
 
 
 def split_overlap_inverse_proportional[T: TimeProtocol](
@@ -243,7 +282,7 @@ def split_overlap_inverse_proportional[T: TimeProtocol](
     first_rel_share = length_second / (length_first + length_second)
     new_border = overlap.interior_point(first_rel_share)
 
-    return first.with_end(new_border), second.with_start(new_border)
+    return with_bounds(first, first.start, new_border), with_bounds(second, new_border, second.end)
 
 
 def split_gap_equal[T: TimeProtocol](
@@ -256,8 +295,8 @@ def split_gap_equal[T: TimeProtocol](
     gap = first.__class__(first.end, second.start)
 
     return (
-        first.with_end(new_border := gap.midpoint),
-        second.with_start(new_border),
+        with_bounds(first, first.start, new_border := gap.interior_point(0.5)),
+        with_bounds(second, new_border, second.end),
     )
 
 
@@ -273,8 +312,8 @@ def split_gap_proportional[T: TimeProtocol](
     first_proportion = length_first / (length_first + length_second)
     new_border = gap.interior_point(first_proportion)
 
-    new_first = first.with_end(new_border)
-    new_second = second.with_start(new_border)
+    new_first = with_bounds(first, first.start, new_border)
+    new_second = with_bounds(second, new_border, second.end)
     return new_first, new_second
 
 
@@ -290,38 +329,31 @@ def split_gap_inverse_proportional[T: TimeProtocol](
     first_rel_share = length_second / (length_first + length_second)
     new_border = gap.interior_point(first_rel_share)
 
-    new_first = first.with_end(new_border)
-    new_second = second.with_start(new_border)
+    new_first = with_bounds(first, first.start, new_border)
+    new_second = with_bounds(second, new_border, second.end)
     return new_first, new_second
 
 
+@instrumentation.timed("algorithms.truncate")
+@dispatched
 def truncate[T: TimeProtocol](
     seq: SpanIterable[T], earliest: T, latest: T
 ) -> tuple[SpanList[T], SpanList[T], SpanList[T]]:
-    """Please write me!"""
+    """Split `seq` into the parts before `earliest`, within `[earliest, latest]` and after.
 
-    before: SpanList[T] = []
-    kept: SpanList[T] = []
-    after: SpanList[T] = []
-    for span in seq:
-        if span.end <= earliest:
-            before.append(span)
-        elif span.contains(earliest):
-            outside, inside = span.split(earliest)
-            before.append(outside)
-            kept.append(inside)
-        elif earliest <= span <= latest:
-            kept.append(span)
-        elif span.contains(latest):
-            inside, outside = span.split(latest)
-            kept.append(inside)
-            after.append(outside)
-        elif span.start >= latest:
-            after.append(span)
-        else:
-            raise ValueError
+    A span crossing a bound is cut there; one spanning both bounds contributes to all three.
+    """
 
-    return before, kept, after
+    lower, upper = earliest.to_minutes(), latest.to_minutes()
+    parts: tuple[SpanList[T], SpanList[T], SpanList[T]] = ([], [], [])
+    for span in seq:
+        start, end = span.start.to_minutes(), span.end.to_minutes()
+        low = min(max(lower, start), end)
+        high = min(max(upper, low), end)
+        for part, a, b in zip(parts, (start, low, high), (low, high, end)):
+            if a < b:
+                part.append(span if (a, b) == (start, end) else _clip(span, a, b))
+    return parts
 
 
 def truncate_nodiscard[T: TimeProtocol](
@@ -342,6 +374,8 @@ def truncate_nodiscard[T: TimeProtocol](
     return list(filter(bool, truncated))
 
 
+@instrumentation.timed("algorithms.eclipse_forward")
+@dispatched
 def eclipse_forward[T: TimeProtocol](
     seq: SpanIterable[T],
 ) -> tuple[
@@ -358,7 +392,7 @@ def eclipse_forward[T: TimeProtocol](
     current = seq[0].end
 
     for span in seq[1:]:
-        rejected_span, kept_span = span.split(max(current, span.start))
+        rejected_span, kept_span = _split(span, min(max(current, span.start), span.end))
         if kept_span:
             spans.append(kept_span)
         if rejected_span:
@@ -368,6 +402,8 @@ def eclipse_forward[T: TimeProtocol](
     return tuple(spans), tuple(rejects)
 
 
+@instrumentation.timed("algorithms.eclipse_backward")
+@dispatched
 def eclipse_backward[T: TimeProtocol](
     seq: SpanIterable[T],
 ) -> tuple[SpanTuple[T], SpanTuple[T]]:
@@ -378,54 +414,364 @@ def eclipse_backward[T: TimeProtocol](
 
     spans: SpanList[T] = [(seq := list(seq))[-1]]
     rejects: SpanList[T] = []
-    current = seq[0].end
+    current = seq[-1].start
 
     for span in seq[-2::-1]:
-        kept_span, rejected_span = span.split(min(current, span.end))
+        kept_span, rejected_span = _split(span, max(min(current, span.end), span.start))
         if kept_span:
             spans.append(kept_span)
         if rejected_span:
             rejects.append(rejected_span)
-        current = min(current, kept_span.end)
+        current = min(current, kept_span.start)
 
     return tuple(spans), tuple(rejects)
 
 
+@instrumentation.timed("algorithms.resolve_overlaps")
+@dispatched
 def resolve_overlaps[T: TimeProtocol](
     seq: SpanIterable[T],
     mode: Literal["EQUAL", "PROPORTIONAL", "INVERSE"],
 ) -> SpanTuple[T]:
-    """Please write me!"""
+    """Split the overlap of each consecutive pair between the two spans, moving copies of the
+    spans; `seq` is left unchanged."""
 
-    if mode == "EQUAL":
-        return tuple(apply_pairwise(split_overlap_equal, seq))
-    elif mode == "PROPORTIONAL":
-        return tuple(apply_pairwise(split_overlap_proportional, seq))
-    elif mode == "INVERSE":
-        return tuple(apply_pairwise(split_overlap_inverse_proportional, seq))
-    else:
-        raise ValueError(f"Invalid mode for method 'resolve_overlaps': '{mode}'")
+    return tuple(iter_resolve_overlaps(seq, mode))
 
 
+@instrumentation.timed("algorithms.resolve_gaps")
+@dispatched
 def resolve_gaps[T: TimeProtocol](
     seq: SpanIterable[T],
-    mode=Literal["EQUAL", "PROPORTIONAL", "INVERSE", "SNAP_FORWARD", "SNAP_BACK"],
+    mode: Literal["EQUAL", "PROPORTIONAL", "INVERSE", "SNAP_FORWARD", "SNAP_BACK"],
 ) -> SpanTuple[T]:
-    """Please write me!"""
+    """Close the gap between each consecutive pair, moving copies of the spans; `seq` is left
+    unchanged."""
+
+    return tuple(iter_resolve_gaps(seq, mode))
+
+
+def iter_resolve_overlaps[T: TimeProtocol](
+    seq: SpanIterable[T],
+    mode: Literal["EQUAL", "PROPORTIONAL", "INVERSE"],
+) -> Iterator[SpanProtocol[T]]:
+    callback = _OVERLAP_CALLBACKS.get(mode)
+    if callback is None:
+        raise ValueError(f"Invalid mode for method 'resolve_overlaps': '{mode}'")
+    return iter_pairwise(callback, seq)
+
+
+def iter_resolve_gaps[T: TimeProtocol](
+    seq: SpanIterable[T],
+    mode: Literal["EQUAL", "PROPORTIONAL", "INVERSE", "SNAP_FORWARD", "SNAP_BACK"],
+) -> Iterator[SpanProtocol[T]]:
+    callback = _GAP_CALLBACKS.get(mode)
+    if callback is None:
+        raise ValueError(f"Invalid mode for method 'resolve_gaps': '{mode}'")
+    return iter_pairwise(callback, seq)
+
+
+def iter_truncate[T: TimeProtocol](
+    seq: SpanIterable[T], earliest: T, latest: T
+) -> Iterator[SpanProtocol[T]]:
+    """Lazily clip start-sorted spans to `[earliest, latest)`, dropping those outside.
+
+    Stops reading as soon as a span starts at or after `latest`, so it can bound an unbounded
+    stream.
+    """
+
+    lower, upper = earliest.to_minutes(), latest.to_minutes()
+    for span in seq:
+        start, end = span.start.to_minutes(), span.end.to_minutes()
+        if start >= upper:
+            return
+        if end <= lower:
+            continue
+        if start >= lower and end <= upper:
+            yield span
+        else:
+            yield with_bounds(
+                span,
+                earliest if start < lower else span.start,
+                latest if end > upper else span.end,
+            )
+
+
+def iter_eclipse_forward[T: TimeProtocol](seq: SpanIterable[T]) -> Iterator[SpanProtocol[T]]:
+    """Lazy `eclipse_forward` on start-sorted spans: earlier spans hide later ones.
+
+    Only the kept spans are yielded; fully hidden spans are dropped.
+    """
+
+    cursor = -math.inf
+    for span in seq:
+        start, end = span.start.to_minutes(), span.end.to_minutes()
+        if end <= cursor:
+            continue
+        yield span if start >= cursor else with_bounds(span, _point_at(span, cursor), span.end)
+        cursor = end
+
+
+@instrumentation.timed("algorithms.eclipse_by_priority")
+def eclipse_by_priority[T: TimeProtocol](
+    seq: SpanIterable[T],
+    priority: Callable[[SpanProtocol[T]], float] | None = None,
+) -> tuple[Iterator[SpanProtocol[T]], Iterator[SpanProtocol[T]]]:
+    """Layer spans so that at every instant only the highest-priority one is kept.
+
+    Spans may be unsorted and overlap to any depth. Ties, and all spans when `priority` is
+    None, go to the earlier-starting span, as in `eclipse_forward`. A span hidden in the middle
+    yields two kept pieces and one rejected piece. Zero-length spans are dropped.
+
+    Returns `(kept, rejected)` as lazy streams: kept pieces come in time order, rejected pieces
+    as soon as they are settled. Either stream may be consumed first; pieces meant for the other
+    one are buffered until it is read. Runs in O(n log n).
+    """
+
+    kept: deque[SpanProtocol[T]] = deque()
+    rejected: deque[SpanProtocol[T]] = deque()
+    pieces = _iter_eclipse_pieces(sorted(seq, key=lambda span: span.start.to_minutes()), priority)
+
+    def drain(own: deque[SpanProtocol[T]]) -> Iterator[SpanProtocol[T]]:
+        while True:
+            while own:
+                yield own.popleft()
+            piece = next(pieces, None)
+            if piece is None:
+                return
+            (kept if piece[0] else rejected).append(piece[1])
+
+    return drain(kept), drain(rejected)
+
+
+def _iter_eclipse_pieces[T: TimeProtocol](
+    spans: SpanList[T], priority: Callable[[SpanProtocol[T]], float] | None
+) -> Iterator[tuple[bool, SpanProtocol[T]]]:
+    """Sweep start-sorted spans, yielding `(is_kept, piece)`.
 
+    `active` is a max-heap on `(priority, -index)` with lazy deletion of ended spans, and
+    `ending` a min-heap on end time; `covered[i]` is how far span `i` has been handed out.
+    """
+
+    starts = [span.start.to_minutes() for span in spans]
+    ends = [span.end.to_minutes() for span in spans]
+    covered = starts.copy()
+    active: list[tuple[float, int]] = []
+    ending: list[tuple[float, int]] = []
+    ended = [False] * len(spans)
+    winner, since, upcoming = None, 0.0, 0
+
+    def piece(i: int, start: float, end: float) -> SpanProtocol[T]:
+        span = spans[i]
+        if start == starts[i] and end == ends[i]:
+            return span
+        return with_bounds(span, _point_at(span, start), _point_at(span, end))
+
+    while upcoming < len(spans) or ending:
+        now = starts[upcoming] if upcoming < len(spans) else math.inf
+        if ending:
+            now = min(now, ending[0][0])
+        closing = []
+        while ending and ending[0][0] <= now:
+            ended[(i := heappop(ending)[1])] = True
+            closing.append(i)
+        while upcoming < len(spans) and starts[upcoming] <= now:
+            heappush(active, (-(priority(spans[upcoming]) if priority else 0.0), upcoming))
+            heappush(ending, (ends[upcoming], upcoming))
+            upcoming += 1
+        while active and ended[active[0][1]]:
+            heappop(active)
+        new_winner = active[0][1] if active else None
+        if new_winner != winner:
+            if winner is not None and since < now:
+                if covered[winner] < since:
+                    yield False, piece(winner, covered[winner], since)
+                yield True, piece(winner, since, now)
+                covered[winner] = now
+            winner, since = new_winner, now
+        for i in closing:
+            if covered[i] < ends[i]:
+                yield False, piece(i, covered[i], ends[i])
+
+
+def coalesce[T: TimeProtocol](
+    seq: SpanIterable[T],
+    key: Callable[[SpanProtocol[T]], object] | None = None,
+) -> Iterator[SpanProtocol[T]]:
+    """Lazily merge consecutive spans that touch or overlap and share the same `key`.
+
+    By default spans are merged when they have the same name; pass `key=lambda _: None` to merge
+    regardless of name.
+    """
+
+    key = key or (lambda span: span.name)
+    spans = iter(seq)
+    pending = next(spans, None)
+    if pending is None:
+        return
+    pending_end = pending.end.to_minutes()
+    for span in spans:
+        end = span.end.to_minutes()
+        if span.start.to_minutes() <= pending_end and key(span) == key(pending):
+            if end > pending_end:
+                pending, pending_end = with_bounds(pending, pending.start, span.end), end
+            continue
+        yield pending
+        pending, pending_end = span, end
+    yield pending
+
+
+def compose[T: TimeProtocol](*steps: PipelineStep[T]) -> PipelineStep[T]:
+    """Chain pipeline steps into one; nothing is read until the result is iterated."""
+
+    def pipeline(seq: SpanIterable[T]) -> SpanIterable[T]:
+        for step in steps:
+            seq = step(seq)
+        return seq
+
+    return pipeline
+
+
+class OverlapCut[T: TimeProtocol](NamedTuple):
+    original: SpanProtocol[T]
+    resolved: SpanProtocol[T]
+    minutes: float
+    """Length removed from `original`."""
+
+
+@instrumentation.timed("algorithms.resolve_overlaps_global")
+def resolve_overlaps_global[T: TimeProtocol](
+    seq: SpanIterable[T],
+    mode: Literal["EQUAL", "PROPORTIONAL", "INVERSE"] = "EQUAL",
+) -> tuple[SpanTuple[T], list[OverlapCut[T]]]:
+    """Resolve overlaps of any depth among unsorted spans, reporting what was cut.
+
+    Every instant is shared among the spans covering it, in proportion to a weight per span:
+    1 (EQUAL), its length (PROPORTIONAL) or the inverse of its length (INVERSE). A sweep over the
+    sorted start and end events accumulates `A(t) = integral of dt / W(t)`, where `W` is the total
+    weight of the active spans, so span `i` is allotted `w_i * (A(end_i) - A(start_i))` minutes.
+    Within each group of transitively overlapping spans, the spans are then laid end to end in
+    start order with their allotted lengths, which exactly fills the group's extent.
+
+    Runs in O(n log n).
+    """
+
+    spans = list(seq)
+    if not spans:
+        return (), []
+    starts = [span.start.to_minutes() for span in spans]
+    ends = [span.end.to_minutes() for span in spans]
+    weights = _overlap_weights([b - a for a, b in zip(starts, ends)], mode)
+
+    allotted = _sweep_allotments(starts, ends, weights)
+    order = sorted(range(len(spans)), key=lambda i: (starts[i], ends[i]))
+    new_bounds = _lay_out_groups(order, starts, ends, allotted)
+
+    resolved: SpanList[T] = []
+    cuts: list[OverlapCut[T]] = []
+    for i in order:
+        span = spans[i]
+        start, end = new_bounds[i]
+        if (start, end) == (starts[i], ends[i]):
+            resolved.append(span)
+            continue
+        new_span = with_bounds(span, _point_at(span, start), _point_at(span, end))
+        resolved.append(new_span)
+        cuts.append(OverlapCut(span, new_span, (ends[i] - starts[i]) - (end - start)))
+    return tuple(resolved), cuts
+
+
+def _sweep_allotments(
+    starts: Sequence[float], ends: Sequence[float], weights: Sequence[float]
+) -> list[float]:
+    # ends sort before starts at the same instant, so touching spans do not share it
+    events = sorted(
+        [(t, 1, i) for i, t in enumerate(starts)] + [(t, 0, i) for i, t in enumerate(ends)]
+    )
+    accumulated_at_start = [0.0] * len(starts)
+    allotted = [0.0] * len(starts)
+    accumulated, total_weight, n_active = 0.0, 0.0, 0
+    previous = events[0][0]
+    for t, is_start, i in events:
+        if n_active and total_weight > 0:
+            accumulated += (t - previous) / total_weight
+        previous = t
+        if is_start:
+            accumulated_at_start[i] = accumulated
+            total_weight += weights[i]
+            n_active += 1
+        else:
+            allotted[i] = weights[i] * (accumulated - accumulated_at_start[i])
+            n_active -= 1
+            total_weight = total_weight - weights[i] if n_active else 0.0
+    return allotted
+
+
+def _lay_out_groups(
+    order: Sequence[int],
+    starts: Sequence[float],
+    ends: Sequence[float],
+    allotted: Sequence[float],
+) -> list[tuple[float, float]]:
+    """Lay each group of transitively overlapping spans end to end from the group's start."""
+    new_bounds: list[tuple[float, float]] = [(0.0, 0.0)] * len(starts)
+    group: list[int] = []
+    group_end = -math.inf
+    for i in [*order, None]:
+        if group and (i is None or starts[i] >= group_end):
+            cursor = starts[group[0]]
+            for j in group:
+                new_bounds[j] = (cursor, cursor + allotted[j])
+                cursor += allotted[j]
+            # absorb floating-point drift so the group ends exactly where it did
+            new_bounds[group[-1]] = (new_bounds[group[-1]][0], group_end)
+            group = []
+        if i is not None:
+            group_end = max(group_end, ends[i]) if group else ends[i]
+            group.append(i)
+    return new_bounds
+
+
+def _overlap_weights(
+    lengths: Sequence[float], mode: Literal["EQUAL", "PROPORTIONAL", "INVERSE"]
+) -> list[float]:
     if mode == "EQUAL":
-        return tuple(apply_pairwise(split_gap_equal, seq))
+        return [1.0] * len(lengths)
     if mode == "PROPORTIONAL":
-        return tuple(apply_pairwise(split_gap_proportional, seq))
+        return [float(length) for length in lengths]
     if mode == "INVERSE":
-        return tuple(apply_pairwise(split_gap_inverse_proportional, seq))
-    if mode == "SNAP_FORWARD":
-        return tuple(apply_pairwise(snap_forward, seq))
-    if mode == "SNAP_BACK":
-        return tuple(apply_pairwise(snap_back, seq))
-    raise ValueError(f"Invalid mode for method 'resolve_gaps': '{mode}'")
+        return [1 / length if length > 0 else 0.0 for length in lengths]
+    raise ValueError(f"Invalid mode for method 'resolve_overlaps_global': '{mode}'")
+
+
+def _point_at[T: TimeProtocol](span: SpanProtocol[T], minutes: float) -> T:
+    return from_minutes(span.start, minutes)
+
+
+def _split[T: TimeProtocol](span: SpanProtocol[T], cut_point: T) -> SpanPair[T]:
+    """Like `span.split`, but both halves keep the name and other fields of `span`."""
+    return with_bounds(span, span.start, cut_point), with_bounds(span, cut_point, span.end)
+
+
+def _clip[T: TimeProtocol](span: SpanProtocol[T], start: float, end: float) -> SpanProtocol[T]:
+    return with_bounds(span, _point_at(span, start), _point_at(span, end))
+
 
+_OVERLAP_CALLBACKS: dict[str, PairCallback] = {
+    "EQUAL": split_overlap_equal,
+    "PROPORTIONAL": split_overlap_proportional,
+    "INVERSE": split_overlap_inverse_proportional,
+}
+_GAP_CALLBACKS: dict[str, PairCallback] = {
+    "EQUAL": split_gap_equal,
+    "PROPORTIONAL": split_gap_proportional,
+    "INVERSE": split_gap_inverse_proportional,
+    "SNAP_FORWARD": snap_forward,
+    "SNAP_BACK": snap_back,
+}
 
+
+@instrumentation.timed("algorithms.squeeze")
 def squeeze[T: TimeProtocol](
     seq: SpanIterable[T],
     *,
@@ -435,28 +781,49 @@ def squeeze[T: TimeProtocol](
     min_minutes: int | float = 5,
     gap_resolver: Callable[[SpanProtocol[T]], SpanProtocol[T]] | None = None,
     overlap_resolver: Callable[[SpanProtocol[T]], SpanProtocol[T]] | None = None,
+    backend: Backend = "iterative",
 ) -> SpanTuple[T]:
-    """Squeeze all elements of `seq` to fit between `earliest` and `latest`."""
-    spans: SpanList[T] = []
-    # earliest: Atom = earliest or earliest_start(seq)
-    # latest: Atom = latest or latest_end(seq)
+    """Squeeze all elements of `seq` to fit between `earliest` and `latest`.
+
+    The "vectorized" backend computes every new boundary at once (see `squeeze_boundaries`) and
+    returns new spans, leaving `seq` untouched; it keeps the total exactly by shrinking the longer
+    spans when some are held at `min_minutes`, whereas the iterative one lets the spans run past
+    `latest`. The results differ in that case, so it is only used when asked for.
+    """
+    seq = list(seq)
+    if mode not in {"PROPORTIONAL", "EQUAL"}:
+        raise ValueError(f"Invalid mode for method 'squeeze': '{mode}'")
+    if not seq:
+        return ()
+    earliest_: T = earliest or earliest_start(seq)
+    latest_: T = latest or latest_end(seq)
+
+    if backend == "vectorized":
+        boundaries = squeeze_boundaries(
+            [span.start.minutes_to(span.end) for span in seq],
+            mode=mode,
+            lower=earliest_.to_minutes(),
+            upper=latest_.to_minutes(),
+            min_minutes=min_minutes,
+        )
+        return tuple(respan(seq, boundaries, like=earliest_))
+    if backend != "iterative":
+        raise ValueError(f"Invalid backend for method 'squeeze': '{backend}'")
+
     if mode == "PROPORTIONAL":
         relative_lengths = get_relative_lengths(seq)
-    elif mode == "EQUAL":
-        seq = list(seq)
-        relative_lengths = [x / len(seq) for x in range(len(seq))]
     else:
-        raise ValueError(f"Invalid mode for method 'squeeze': '{mode}'")
+        relative_lengths = [1 / len(seq)] * len(seq)
 
-    earliest_: T = earliest or earliest_start(seq)
-    latest_: T = latest or latest_end(seq)
+    spans: SpanList[T] = []
     new_total: float = earliest_.minutes_to(latest_)
     current = earliest_
     squeezed: SpanProtocol[T]
     for span, rel_length in zip(seq, relative_lengths):
+        old_length = span.start.minutes_to(span.end)
         spans.append(
             squeezed := span.forward_affine_transform(
-                scale_factor=rel_length * new_total,
+                scale_factor=rel_length * new_total / old_length if old_length else 0.0,
                 new_start=current,
                 min_minutes=min_minutes,
             )
@@ -465,6 +832,7 @@ def squeeze[T: TimeProtocol](
     return tuple(spans)
 
 
+@instrumentation.timed("algorithms.squeeze_with_rollover")
 def squeeze_with_rollover[T: TimeProtocol](
     seq: SpanIterable[T],
     *,
@@ -489,12 +857,32 @@ def squeeze_with_rollover[T: TimeProtocol](
     )
 
 
+@instrumentation.timed("algorithms.stack")
 def stack[T: TimeProtocol](
     seq: SpanIterable[T],
     mode: Literal["FORWARD", "OUTWARD", "BACKWARD"],
     anchor=None,
+    backend: Backend = "iterative",
 ) -> SpanTuple[T]:
-    """Please write me!"""
+    """Lay the elements of `seq` end to end, in order, keeping their lengths.
+
+    FORWARD starts at `anchor` (default: earliest start), BACKWARD ends at `anchor` (default:
+    latest end) and OUTWARD keeps the most central element in place. The "vectorized" backend
+    returns new spans (computed by `stack_boundaries`) rather than moving those of `seq`.
+    """
+    seq = list(seq)
+    if backend == "vectorized":
+        if not seq:
+            return ()
+        boundaries = stack_boundaries(
+            [span.start.to_minutes() for span in seq],
+            [span.end.to_minutes() for span in seq],
+            mode=mode,
+            anchor=None if anchor is None else anchor.to_minutes(),
+        )
+        return tuple(respan(seq, boundaries))
+    if backend != "iterative":
+        raise ValueError(f"Invalid backend for method 'stack': '{backend}'")
 
     lookup: dict[
         Literal["FORWARD", "OUTWARD", "BACKWARD"],
@@ -510,6 +898,71 @@ def stack[T: TimeProtocol](
     return tuple(func(seq, anchor))
 
 
+@dispatched
+def squeeze_boundaries(
+    durations: Sequence[float],
+    *,
+    mode: Literal["PROPORTIONAL", "EQUAL"],
+    lower: float,
+    upper: float,
+    min_minutes: float = 0.0,
+) -> list[float]:
+    """All `n + 1` boundaries (in minutes) of `durations` squeezed into `[lower, upper]`."""
+    if mode == "PROPORTIONAL":
+        weights: Sequence[float] = durations
+    elif mode == "EQUAL":
+        weights = [1.0] * len(durations)
+    else:
+        raise ValueError(f"Invalid mode for method 'squeeze': '{mode}'")
+    lengths = water_fill(weights, upper - lower, min_minutes)
+    return list(accumulate(lengths, initial=lower))
+
+
+@dispatched
+def stack_boundaries(
+    starts: Sequence[float],
+    ends: Sequence[float],
+    *,
+    mode: Literal["FORWARD", "OUTWARD", "BACKWARD"],
+    anchor: float | None = None,
+) -> list[float]:
+    """All `n + 1` boundaries (in minutes) of the elements laid end to end.
+
+    Every mode is the same cumulative sum of durations; only the offset it starts from differs.
+    """
+    durations = [end - start for start, end in zip(starts, ends)]
+    if mode == "FORWARD":
+        offset = min(starts) if anchor is None else anchor
+    elif mode == "BACKWARD":
+        offset = (max(ends) if anchor is None else anchor) - sum(durations)
+    elif mode == "OUTWARD":
+        midpoint = (min(starts) + max(ends)) / 2
+        central = min(range(len(starts)), key=lambda i: abs((starts[i] + ends[i]) / 2 - midpoint))
+        offset = starts[central] - sum(durations[:central])
+    else:
+        raise ValueError(f"Invalid mode for method 'stack': '{mode}'")
+    return list(accumulate(durations, initial=offset))
+
+
+def respan[T: TimeProtocol](
+    seq: Sequence[SpanProtocol[T]], boundaries: Sequence[float], like: T | None = None
+) -> Iterator[SpanProtocol[T]]:
+    """Copies of the elements of `seq` moved onto consecutive `boundaries` (in minutes)."""
+    point = seq[0].start if like is None else like
+    for span, (start, end) in zip(seq, pairwise(boundaries)):
+        yield with_bounds(span, from_minutes(point, start), from_minutes(point, end))
+
+
+def with_bounds[T: TimeProtocol](span: SpanProtocol[T], start: T, end: T) -> SpanProtocol[T]:
+    """Copy of `span` with new bounds, keeping its class, explicit name and any other attributes
+    (the spans' own `with_start` and `with_end` change them in place)."""
+    if hasattr(span, "model_copy"):
+        return span.model_copy(update={"start": start, "end": end})
+    rebound = copy.copy(span)
+    rebound._start, rebound._end = start, end  # type: ignore[attr-defined]
+    return rebound
+
+
 def is_contiguous[T: TimeProtocol](seq: SpanIterable[T]) -> bool:
     """Please write me!"""
 
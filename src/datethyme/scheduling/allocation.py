@@ -0,0 +1,507 @@
+"""
+Index structures for allocating entries into the gaps of day schedules.
+
+`GapIndex` holds the free time of one day in minute coordinates (see `scheduling.utils`). Each gap
+is cut at the boundaries of the day's context slots, and the pieces are grouped by the slots that
+cover them; every group is kept sorted by length, so the shortest piece that fits an entry is one
+bisection per group. `DayIndex` is a max segment tree over the longest piece of each day, so the
+first day with room for an entry is found in O(log days) rather than by visiting every day.
+
+Allocating `n` entries into `g` gaps thus takes O((n + g) log g), plus O(log days) per entry to
+pick its day, as long as the day found also has a slot receiving the entry's contexts.
+"""
+
+from __future__ import annotations
+
+import math
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from heapq import heappop, heappush
+from itertools import count, pairwise, starmap
+
+from ..constants import AddResult
+from ..exceptions import TemporalLogicError
+from ..protocols import DateProtocol, EntryProtocol
+from .dependencies import DependencyGraph
+from .types.slots import Context, TimeSlotMixin
+
+type Interval = tuple[float, float]
+type Piece = tuple[float, float, float]  # (length, start, end)
+type SlotKey = tuple[int, ...]
+type Place = Callable[[int, EntryProtocol], tuple[AddResult, float, list[EntryProtocol]]]
+type Unplace = Callable[[int, EntryProtocol], float]
+type Outcome = tuple[EntryProtocol, int | None, AddResult, list[EntryProtocol]]
+type DayGaps = tuple[list[Interval], list[TimeSlotMixin]]
+
+
+def date_key(date: DateProtocol) -> tuple[int, int, int]:
+    return (date.year, date.month, date.day)
+
+
+def entry_order(entry: EntryProtocol) -> tuple:
+    """Sort key for allocation: highest priority first, then earliest due date, then earliest
+    `earliest_date`; entries without a date go last and first respectively."""
+    due = (math.inf,) if entry.due_date is None else date_key(entry.due_date)
+    earliest = (-math.inf,) if entry.earliest_date is None else date_key(entry.earliest_date)
+    return (-entry.priority, due, earliest, entry.name)
+
+
+def entry_window(dates: Sequence[DateProtocol], entry: EntryProtocol) -> tuple[int, int]:
+    """Positions of the first and last of the sorted `dates` that `entry` may be placed on, from
+    its `earliest_date` to its `due_date` (the first is after the last if there are none)."""
+    first, last = 0, len(dates) - 1
+    if entry.earliest_date is not None:
+        first = bisect_left(dates, date_key(entry.earliest_date), key=date_key)
+    if entry.due_date is not None:
+        last = bisect_right(dates, date_key(entry.due_date), key=date_key) - 1
+    return first, last
+
+
+def independent_groups(
+    windows: Sequence[tuple[int, int]], min_days: int = 1
+) -> list[tuple[int, int, list[int]]]:
+    """Split the days covered by `windows` into runs of days that no window crosses.
+
+    Consecutive runs are merged until each spans at least `min_days` days (except possibly the
+    last). Empty windows belong to no run.
+
+    Returns:
+        the first and last day of each run, with the positions of the windows inside it
+    """
+    runs: list[tuple[int, int, list[int]]] = []
+    for i in sorted(range(len(windows)), key=windows.__getitem__):
+        first, last = windows[i]
+        if first > last:
+            continue
+        if runs and first <= runs[-1][1]:
+            runs[-1][2].append(i)
+            runs[-1] = (runs[-1][0], max(runs[-1][1], last), runs[-1][2])
+        else:
+            runs.append((first, last, [i]))
+
+    groups: list[tuple[int, int, list[int]]] = []
+    for first, last, members in runs:
+        if groups and groups[-1][1] - groups[-1][0] + 1 < min_days:
+            groups[-1] = (groups[-1][0], last, groups[-1][2] + members)
+        else:
+            groups.append((first, last, members))
+    return groups
+
+
+def fit_result(entry: EntryProtocol, minutes: float) -> AddResult:
+    return AddResult.ADDED if minutes == entry.ideal_time else AddResult.ADDED_MODIFIED
+
+
+def entry_contexts(entry: EntryProtocol) -> set[Context]:
+    """Contexts of `entry` in the form expected by `TimeSlotMixin.can_receive`."""
+    return {context for context in entry.contexts if context is not None}
+
+
+class GapIndex:
+    """Free time of one day, cut at slot boundaries and indexed by piece length.
+
+    Without slots, every gap is a single piece that receives any entry. With slots, only the
+    parts of the gaps covered by at least one slot are indexed, and a piece receives an entry if
+    any of its covering slots can receive the entry's contexts (as in `freebusy.find_slots`).
+    """
+
+    __slots__ = ("_ends", "_groups", "_slots", "_starts")
+
+    def __init__(self, gaps: Iterable[Interval], slots: Iterable[TimeSlotMixin] = ()) -> None:
+        self._slots = [(s.start.to_minutes(), s.end.to_minutes(), s) for s in slots]
+        self._starts: list[float] = []
+        self._ends: list[float] = []
+        self._groups: dict[SlotKey, list[Piece]] = {}
+        for start, end in gaps:
+            self._starts.append(start)
+            self._ends.append(end)
+            self._add_pieces(start, end)
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    @property
+    def gaps(self) -> list[Interval]:
+        return list(zip(self._starts, self._ends, strict=True))
+
+    def largest(self) -> float:
+        """Length of the longest piece, regardless of the contexts its slots receive."""
+        return max((group[-1][0] for group in self._groups.values() if group), default=0.0)
+
+    def find(
+        self, minutes: float, contexts: set[Context], *, longest: bool = False
+    ) -> Interval | None:
+        """Return the shortest piece of at least `minutes` that can receive `contexts` (or the
+        longest one if `longest`), preferring the earliest of equally long pieces.
+
+        Returns None if no such piece exists.
+        """
+        best: Piece | None = None
+        for key, group in self._groups.items():
+            if not group or group[-1][0] < minutes:
+                continue
+            if key and not any(self._slots[i][2].can_receive(contexts) for i in key):
+                continue
+            if longest:
+                piece = group[bisect_left(group, (group[-1][0],))]
+                if best is None or (piece[0], -piece[1]) > (best[0], -best[1]):
+                    best = piece
+            else:
+                piece = group[bisect_left(group, (minutes,))]
+                if best is None or piece < best:
+                    best = piece
+        return None if best is None else (best[1], best[2])
+
+    def fit(self, entry: EntryProtocol, contexts: set[Context]) -> tuple[float, float] | None:
+        """Start and length for `entry`: the start of the shortest piece holding its ideal time,
+        else the whole of the longest piece holding its `min_time` (None if there is neither)."""
+        found = self.find(entry.ideal_time, contexts) or self.find(
+            entry.min_time, contexts, longest=True
+        )
+        if found is None:
+            return None
+        start, end = found
+        return start, min(entry.ideal_time, end - start)
+
+    def can_receive(self, start: float, end: float, contexts: set[Context]) -> bool:
+        """Whether a slot covering all of [start, end] can receive `contexts` (always true if the
+        day has no slots)."""
+        if not self._slots:
+            return True
+        return any(
+            s <= start and end <= e and slot.can_receive(contexts) for s, e, slot in self._slots
+        )
+
+    def is_free(self, start: float, end: float) -> bool:
+        position = bisect_right(self._starts, start) - 1
+        return position >= 0 and end <= self._ends[position]
+
+    def free_around(self, start: float, end: float) -> Interval:
+        """The gap that [start, end] would be part of if it was released."""
+        position = bisect_left(self._starts, start)
+        if position > 0 and self._ends[position - 1] == start:
+            start = self._starts[position - 1]
+        if position < len(self._starts) and self._starts[position] == end:
+            end = self._ends[position]
+        return start, end
+
+    def occupy(self, start: float, end: float) -> tuple[int, list[Interval]]:
+        """Take [start, end] out of the gap containing it.
+
+        Returns:
+            the position of that gap and the (zero to two) gaps that replace it
+
+        Raises:
+            TemporalLogicError: if [start, end] is not free
+        """
+        position = bisect_right(self._starts, start) - 1
+        if position < 0 or self._ends[position] < end:
+            msg = f"Interval [{start}, {end}] is not free."
+            raise TemporalLogicError(msg)
+        gap_start, gap_end = self._starts[position], self._ends[position]
+        self._remove_pieces(gap_start, gap_end)
+        parts = [(a, b) for a, b in ((gap_start, start), (end, gap_end)) if b > a]
+        self._starts[position : position + 1] = [a for a, _ in parts]
+        self._ends[position : position + 1] = [b for _, b in parts]
+        for a, b in parts:
+            self._add_pieces(a, b)
+        return position, parts
+
+    def release(self, start: float, end: float) -> tuple[int, int, Interval]:
+        """Return [start, end] to the free time, merging it with the gaps it touches.
+
+        Returns:
+            the positions `lo:hi` of the replaced gaps and the merged gap replacing them
+        """
+        lo = hi = bisect_left(self._starts, start)
+        if lo > 0 and self._ends[lo - 1] == start:
+            lo -= 1
+            start = self._starts[lo]
+        if hi < len(self._starts) and self._starts[hi] == end:
+            end = self._ends[hi]
+            hi += 1
+        for position in range(lo, hi):
+            self._remove_pieces(self._starts[position], self._ends[position])
+        self._starts[lo:hi] = [start]
+        self._ends[lo:hi] = [end]
+        self._add_pieces(start, end)
+        return lo, hi, (start, end)
+
+    def _pieces(self, start: float, end: float) -> Iterator[tuple[SlotKey, Piece]]:
+        if not self._slots:
+            if end > start:
+                yield (), (end - start, start, end)
+            return
+        inner = (x for s, e, _ in self._slots for x in (s, e) if start < x < end)
+        for a, b in pairwise(sorted({start, end, *inner})):
+            key = tuple(i for i, (s, e, _) in enumerate(self._slots) if s <= a and b <= e)
+            if key:
+                yield key, (b - a, a, b)
+
+    def _add_pieces(self, start: float, end: float) -> None:
+        for key, piece in self._pieces(start, end):
+            insort(self._groups.setdefault(key, []), piece)
+
+    def _remove_pieces(self, start: float, end: float) -> None:
+        for key, piece in self._pieces(start, end):
+            group = self._groups[key]
+            del group[bisect_left(group, piece)]
+
+
+class DayIndex:
+    """Max segment tree over one value per day (the longest free piece of each day)."""
+
+    __slots__ = ("_size", "_tree")
+
+    def __init__(self, values: Sequence[float]) -> None:
+        self._size = 1
+        while self._size < len(values):
+            self._size *= 2
+        self._tree = [-math.inf] * (2 * self._size)
+        self._tree[self._size : self._size + len(values)] = values
+        for node in range(self._size - 1, 0, -1):
+            self._tree[node] = max(self._tree[2 * node], self._tree[2 * node + 1])
+
+    def __getitem__(self, position: int) -> float:
+        return self._tree[self._size + position]
+
+    def update(self, position: int, value: float) -> None:
+        node = self._size + position
+        self._tree[node] = value
+        while node > 1:
+            node //= 2
+            self._tree[node] = max(self._tree[2 * node], self._tree[2 * node + 1])
+
+    def first_at_least(self, value: float, lo: int, hi: int) -> int | None:
+        """Return the first position in [lo, hi] whose value is at least `value`, or None."""
+        if lo > hi:
+            return None
+        return self._first(1, 0, self._size - 1, value, lo, hi)
+
+    def _first(
+        self, node: int, left: int, right: int, value: float, lo: int, hi: int
+    ) -> int | None:
+        if right < lo or hi < left or self._tree[node] < value:
+            return None
+        if left == right:
+            return left
+        middle = (left + right) // 2
+        found = self._first(2 * node, left, middle, value, lo, hi)
+        if found is None:
+            found = self._first(2 * node + 1, middle + 1, right, value, lo, hi)
+        return found
+
+
+def allocate(
+    entries: Iterable[EntryProtocol],
+    dates: Sequence[DateProtocol],
+    largest: Sequence[float],
+    place: Place,
+    *,
+    graph: DependencyGraph | None = None,
+    unplace: Unplace | None = None,
+    displace: bool = False,
+) -> Iterator[Outcome]:
+    """Allocate `entries` in `entry_order`, each to the first day of its window with room for it.
+
+    Args:
+        entries: the entries to allocate.
+        dates: the sorted dates of the days.
+        largest: the longest free piece of each day.
+        place: tries to place an entry on the day at a position, returning the result, the new
+            longest free piece of that day and the entries it displaced (which are requeued).
+        graph: the dependencies between `entries`. An entry is only allocated once all of its
+            prerequisites are, to a later day, and not at all if one of them cannot be placed;
+            prerequisites are taken in the order of their most urgent dependent.
+        unplace: removes an entry from the day at a position, returning the new longest free
+            piece of that day. It is called (with a `graph`) for the entries that depend on a
+            displaced one, which go back into the queue behind it.
+        displace: if no day of the window has room, also try the days without room in order, so
+            that `place` may displace entries there.
+
+    Yields:
+        each entry with the position of its day (None if not placed), the result and the
+        entries it displaced
+    """
+    free = DayIndex(largest)
+    queue = _Queue(list(entries), dates, graph)
+    while (i := queue.pop()) is not None:
+        entry = queue.entries[i]
+        first, last = queue.window(i)
+        position = free.first_at_least(entry.min_time, first, last)
+        while position is not None:
+            result, longest, displaced = place(position, entry)
+            free.update(position, longest)
+            if result is not AddResult.NOT_ADDED:
+                break
+            position = free.first_at_least(entry.min_time, position + 1, last)
+        if position is None and displace:
+            for day in range(first, last + 1):
+                if free[day] >= entry.min_time:
+                    continue  # tried above
+                result, longest, displaced = place(day, entry)
+                free.update(day, longest)
+                if result is not AddResult.NOT_ADDED:
+                    position = day
+                    break
+        if position is None:
+            yield entry, None, AddResult.NOT_ADDED, []
+            for j in queue.block(i):
+                yield queue.entries[j], None, AddResult.NOT_ADDED, []
+            continue
+        queue.place(i, position)
+        yield entry, position, result, displaced
+        for incumbent in displaced:
+            for j, day in queue.requeue(incumbent):
+                free.update(day, unplace(day, queue.entries[j]))  # type: ignore[misc]
+
+
+class _Queue:
+    """The order of `allocate`: `entry_order`, holding entries back until their prerequisites
+    are placed. Entries are kept by position, and displaced entries from outside are appended."""
+
+    __slots__ = (
+        "_dates",
+        "_heap",
+        "_ids",
+        "_keys",
+        "_positions",
+        "_queued",
+        "_tiebreak",
+        "_waiting",
+        "_windows",
+        "entries",
+        "graph",
+    )
+
+    def __init__(
+        self,
+        entries: list[EntryProtocol],
+        dates: Sequence[DateProtocol],
+        graph: DependencyGraph | None,
+    ) -> None:
+        self.entries = entries
+        self.graph = graph
+        self._dates = dates
+        self._windows = [entry_window(dates, entry) for entry in entries]
+        self._keys = [entry_order(entry) for entry in entries]
+        self._waiting = [0] * len(entries)
+        if graph is not None:
+            self._windows = graph.propagate(self._windows)
+            priorities = graph.inherited([entry.priority for entry in entries])
+            self._keys = [(-p, *key[1:]) for p, key in zip(priorities, self._keys, strict=True)]
+            self._waiting = [len(graph.prerequisites(i)) for i in range(len(entries))]
+        self._ids = {entry.name: i for i, entry in enumerate(entries)}
+        self._positions: list[int | None] = [None] * len(entries)
+        self._queued = [False] * len(entries)
+        self._tiebreak = count()
+        self._heap: list[tuple[tuple, int, int]] = []
+        for i, waiting in enumerate(self._waiting):
+            if waiting == 0:
+                self._push(i)
+
+    def pop(self) -> int | None:
+        """The next entry whose prerequisites are all placed, or None if there is none."""
+        while self._heap:
+            *_, i = heappop(self._heap)
+            self._queued[i] = False
+            if self._waiting[i] == 0:
+                return i
+        return None
+
+    def window(self, i: int) -> tuple[int, int]:
+        """The days the entry may go to, starting after those of its placed prerequisites."""
+        first, last = self._windows[i]
+        if self.graph is not None and i < len(self.graph):
+            for j in self.graph.prerequisites(i):
+                first = max(first, self._positions[j] + 1)  # type: ignore[operator]
+        return first, last
+
+    def place(self, i: int, position: int) -> None:
+        self._positions[i] = position
+        for j in self._dependents(i):
+            if self._waiting[j] > 0:  # not blocked
+                self._waiting[j] -= 1
+                if self._waiting[j] == 0:
+                    self._push(j)
+
+    def block(self, i: int) -> list[int]:
+        """The entries depending on `i`, directly or not, which cannot be placed without it."""
+        blocked, stack = [], list(self._dependents(i))
+        while stack:
+            j = stack.pop()
+            if self._waiting[j] >= 0:
+                self._waiting[j] = -1  # never queued again
+                blocked.append(j)
+                stack.extend(self._dependents(j))
+        return sorted(blocked)
+
+    def requeue(self, entry: EntryProtocol) -> list[tuple[int, int]]:
+        """Queue a displaced entry again, along with the entries depending on it.
+
+        Returns:
+            the placed entries that depend on it, directly or not, with their day positions
+        """
+        i = self._ids.get(entry.name)
+        if i is None:
+            i = self._ids[entry.name] = len(self.entries)
+            self.entries.append(entry)
+            self._windows.append(entry_window(self._dates, entry))
+            self._keys.append(entry_order(entry))
+            self._waiting.append(0)
+            self._positions.append(None)
+            self._queued.append(False)
+        self._positions[i] = None
+        unplaced, stack = [], [i]
+        while stack:
+            for j in self._dependents(stack.pop()):
+                if self._waiting[j] < 0:
+                    continue
+                self._waiting[j] += 1
+                if (position := self._positions[j]) is not None:
+                    self._positions[j] = None
+                    unplaced.append((j, position))
+                    stack.append(j)
+        self._push(i)
+        return unplaced
+
+    def _dependents(self, i: int) -> list[int]:
+        return [] if self.graph is None or i >= len(self.graph) else self.graph.dependents(i)
+
+    def _push(self, i: int) -> None:
+        if not self._queued[i]:
+            self._queued[i] = True
+            heappush(self._heap, (self._keys[i], next(self._tiebreak), i))
+
+
+def allocate_gaps(
+    task: tuple[list[DateProtocol], list[DayGaps], list[EntryProtocol]],
+) -> list[tuple[str, int | None, AddResult, float, float]]:
+    """Process-pool task: `allocate` into plain gap lists, which are cheap to send to a worker.
+
+    Nothing is displaced, since the entries placed on the days before are not sent along.
+
+    Returns:
+        the name, day position (None if not placed), result, start and length of each entry
+    """
+    dates, days, entries = task
+    indexes = list(starmap(GapIndex, days))
+    placements: dict[str, tuple[float, float]] = {}
+
+    def place(position: int, entry: EntryProtocol) -> tuple[AddResult, float, list[EntryProtocol]]:
+        index = indexes[position]
+        found = index.fit(entry, entry_contexts(entry))
+        if found is None:
+            return AddResult.NOT_ADDED, index.largest(), []
+        start, minutes = found
+        index.occupy(start, start + minutes)
+        placements[entry.name] = found
+        return fit_result(entry, minutes), index.largest(), []
+
+    results = []
+    for entry, position, result, _ in allocate(
+        entries, dates, [i.largest() for i in indexes], place
+    ):
+        start, minutes = placements.get(entry.name, (0.0, 0.0))
+        results.append((entry.name, position, result, start, minutes))
+    return results
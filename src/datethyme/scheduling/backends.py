@@ -0,0 +1,114 @@
+"""
+Backend registry for `datethyme.scheduling.algorithms`.
+
+Every dispatched algorithm has a pure-Python implementation (the function defined in
+`algorithms`) and may have others registered under a backend name. By default the backend is
+picked per call: NumPy for NumPy arrays and for inputs of at least `NUMPY_MIN_SIZE` elements
+(when NumPy is installed), pure Python otherwise, which keeps small inputs free of conversion
+overhead. Use `use_backend` to force one:
+
+```python
+with use_backend("python"):
+    stack(spans, "FORWARD")
+```
+
+NumPy is optional; its implementations live in `_numpy_backend` and are only imported the first
+time they are selected.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Generator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import cache, wraps
+from importlib import import_module
+from importlib.util import find_spec
+from typing import Any, Literal
+
+type BackendName = Literal["python", "numpy"] | str
+
+NUMPY_MIN_SIZE = 1024
+"""Inputs with at least this many elements go to NumPy when no backend is forced."""
+
+_forced: ContextVar[BackendName | None] = ContextVar("forced_backend", default=None)
+_implementations: dict[str, dict[BackendName, Callable[..., Any]]] = {}
+_lazy_backends: dict[BackendName, str] = {"numpy": "datethyme.scheduling._numpy_backend"}
+
+
+@cache
+def numpy_available() -> bool:
+    return find_spec("numpy") is not None
+
+
+def available_backends() -> tuple[BackendName, ...]:
+    names = {"python", *(b for impls in _implementations.values() for b in impls)}
+    if numpy_available():
+        names.add("numpy")
+    return tuple(sorted(names))
+
+
+def register[F: Callable[..., Any]](name: str, backend: BackendName) -> Callable[[F], F]:
+    """Register the decorated function as the `backend` implementation of algorithm `name`."""
+
+    def decorator(function: F) -> F:
+        _implementations.setdefault(name, {})[backend] = function
+        return function
+
+    return decorator
+
+
+def dispatched[F: Callable[..., Any]](function: F) -> F:
+    """Make `function` the pure-Python implementation of an algorithm dispatched on its first
+    argument (an iterable of spans or of minutes)."""
+
+    name = function.__name__
+    register(name, "python")(function)
+
+    @wraps(function)
+    def wrapper(seq, *args, **kwargs):
+        if not isinstance(seq, Sequence) and not _is_numpy_array(seq):
+            seq = list(seq)
+        return implementation(name, select_backend(seq))(seq, *args, **kwargs)
+
+    return wrapper  # type: ignore
+
+
+def select_backend(seq: Sequence[Any]) -> BackendName:
+    """The backend for one call on `seq`: the forced one, else chosen by type and size."""
+    if (forced := _forced.get()) is not None:
+        return forced
+    if _is_numpy_array(seq) or (len(seq) >= NUMPY_MIN_SIZE and numpy_available()):
+        return "numpy"
+    return "python"
+
+
+def implementation(name: str, backend: BackendName) -> Callable[..., Any]:
+    """The `backend` implementation of algorithm `name`, falling back to pure Python."""
+    implementations = _implementations[name]
+    if backend not in implementations and backend in _lazy_backends:
+        import_module(_lazy_backends.pop(backend))
+    return implementations.get(backend, implementations["python"])
+
+
+@contextmanager
+def use_backend(backend: BackendName | None) -> Generator[None]:
+    """Force `backend` for every dispatched call in this context; None restores automatic choice.
+
+    Raises:
+        ValueError: if `backend` is unknown or its library is not installed.
+    """
+    if backend is not None and backend not in available_backends():
+        raise ValueError(
+            f"Backend '{backend}' is not available; choose from {available_backends()}"
+        )
+    token = _forced.set(backend)
+    try:
+        yield
+    finally:
+        _forced.reset(token)
+
+
+def _is_numpy_array(obj: object) -> bool:
+    # checked by name so that NumPy is never imported just to find out it is not in use
+    return type(obj).__module__ == "numpy" and type(obj).__name__ == "ndarray"
@@ -1,15 +1,502 @@
-from collections.abc import Iterable
+"""
+Greedy scheduling, kept up to date incrementally as entries change, and an anytime optimizer that
+improves the greedy schedule by local search.
+"""
 
-from ..constants import Recipe
+from __future__ import annotations
+
+import math
+import random
+from bisect import bisect_right
+from collections.abc import Iterable, Mapping
+from copy import deepcopy
+from itertools import pairwise
+from time import perf_counter
+from typing import NamedTuple
+
+from .. import instrumentation
+from ..constants import AddResult, Recipe
+from ..core import DAY_START, Date, Time
+from ..exceptions import TemporalLogicError
 from ..protocols import EntryProtocol
-from .types import Calendar
+from .allocation import GapIndex, entry_contexts, entry_window, independent_groups
+from .dependencies import DependencyGraph
+from .types import Calendar, Entries, SchedulingLog
+from .types.log import LogRecord
+from .types.schedules import ContextHierarchy
+from .types.slots import TimeSlotMixin
+from .utils import from_minutes
+
+type Placement = tuple[int, float, float]  # (day position, start minute, minutes)
+type Changes = dict[int, Placement | None]  # entry position -> new placement, None to unplace
+
+
+class Weights(NamedTuple):
+    """Weights of the terms of the cost minimized by `optimize_schedule`."""
+
+    unplaced: float = 1.0  # per minute of ideal time left unplaced, times (1 + priority)
+    lateness: float = 60.0  # per calendar day that an entry is placed after its due date
+    deviation: float = 1.0  # per minute between the placed length and the ideal time
+    switches: float = 15.0  # per change of contexts between consecutive entries of a day
+
+
+class OptimizedSchedule(NamedTuple):
+    calendar: Calendar
+    remaining: Entries
+    cost: float
+    iterations: int
 
 
 def schedule_entries(
     entries: Iterable[EntryProtocol], preexisting: Calendar | None, recipe: Recipe
 ) -> Calendar:
-    return Calendar()
+    """Allocate `entries` greedily into a copy of `preexisting` (see `allocate_entries`)."""
+    calendar = Calendar() if preexisting is None else deepcopy(preexisting)
+    calendar.allocate_entries(entries, context_hierarchy=ContextHierarchy())
+    return calendar
 
 
 def lint_calendar(cal: Calendar) -> None:
     return None
+
+
+class IncrementalSchedule:
+    """A greedy schedule (as `schedule_entries` makes it) that `update` keeps current as entries
+    are added, changed or removed, reallocating only the days that the change can affect.
+
+    Each entry may only land on the days of its window, from its `earliest_date` to its
+    `due_date`. The days split into groups that no window crosses (see `independent_groups`), and
+    an allocation in one group never affects another, so an update only reallocates the groups
+    holding the day the entry was on and its new window, leaving the rest as they are (entries
+    linked by dependencies count as one group). The result is the same as scheduling from
+    scratch; entries without dates span every day, though, so changing one of those
+    reallocates the whole calendar.
+    """
+
+    def __init__(
+        self,
+        entries: Iterable[EntryProtocol],
+        preexisting: Calendar,
+        *,
+        slots: Iterable[TimeSlotMixin[Time]] | None = None,
+    ) -> None:
+        self.base = deepcopy(preexisting)
+        if slots is not None:
+            slots = list(slots)
+            for day in self.base.values():
+                day.schedule.set_slots(slots)
+        self.calendar = deepcopy(self.base)
+        self.dates = sorted(self.base.keys())
+        self.positions = {date: day for day, date in enumerate(self.dates)}
+        self.entries: dict[str, EntryProtocol] = {}
+        self.windows: dict[str, tuple[int, int]] = {}
+        self.placed: dict[str, Date] = {}
+        self.records: list[LogRecord] = []
+        self.update(entries)
+
+    @property
+    def remaining(self) -> Entries:
+        return Entries({
+            name: entry for name, entry in self.entries.items() if name not in self.placed
+        })
+
+    @property
+    def log(self) -> SchedulingLog:
+        """The records of the allocations still in place, from the oldest to the newest."""
+        return SchedulingLog(list(self.records))
+
+    @instrumentation.timed("IncrementalSchedule.update")
+    def update(
+        self, changed: Iterable[EntryProtocol] = (), removed: Iterable[str] = ()
+    ) -> list[Date]:
+        """Add or replace the `changed` entries (by name), drop the `removed` ones and reallocate
+        the days they affect.
+
+        Returns:
+            the dates that were reallocated
+        """
+        changed, stale = list(changed), set(removed)
+        stale.update(entry.name for entry in changed)
+        linked = self._linked(stale)
+        touched: set[int] = set()
+        for name in stale:
+            touched.update(self._forget(name))
+        for entry in changed:
+            self.windows[entry.name] = entry_window(self.dates, entry)
+            self.entries[entry.name] = entry
+
+        days, members = self._affected(touched, linked | stale)
+        dates = [self.dates[day] for day in sorted(days)]
+        for date in dates:
+            self.calendar[date] = deepcopy(self.base[date])
+        stale.update(entry.name for entry in members)
+        self.records = [record for record in self.records if record.name not in stale]
+        _, log = Calendar({date: self.calendar[date] for date in dates}).allocate_entries(
+            members, context_hierarchy=ContextHierarchy()
+        )
+        self.records.extend(log.records)
+        for record in log.records:
+            if record.date is None:
+                self.placed.pop(record.name, None)
+            else:
+                self.placed[record.name] = record.date
+        return dates
+
+    def _forget(self, name: str) -> list[int]:
+        """Drop the entry named `name`, returning the position of the day it was placed on."""
+        self.entries.pop(name, None)
+        self.windows.pop(name, None)
+        date = self.placed.pop(name, None)
+        return [] if date is None else [self.positions[date]]
+
+    def _linked(self, names: set[str]) -> set[str]:
+        """The entries that the entries named `names` depend on, or that depend on them."""
+        linked = {
+            name
+            for name, entry in self.entries.items()
+            if not names.isdisjoint(entry.dependencies or ())
+        }
+        for name in names & self.entries.keys():
+            linked.update(self.entries[name].dependencies or ())
+        return linked
+
+    def _affected(
+        self, touched: set[int], changed: set[str]
+    ) -> tuple[set[int], list[EntryProtocol]]:
+        """The entries sharing days with the `touched` days or the `changed` entries, through
+        their windows or their dependencies, with the days of their windows (and the touched
+        days)."""
+        names = list(self.windows)
+        groups = independent_groups([self.windows[name] for name in names])
+        graph = DependencyGraph(self.entries[name] for name in names)
+        roots = list(range(len(names)))
+        for _, _, group in groups:
+            for i in group[1:]:
+                _union(roots, group[0], i)
+        for i in range(len(graph)):
+            for j in graph.prerequisites(i):
+                _union(roots, i, j)
+
+        dirty = {_find(roots, graph.index[name]) for name in changed if name in graph.index}
+        firsts = [first for first, _, _ in groups]
+        for day in touched:
+            k = bisect_right(firsts, day) - 1
+            if k >= 0 and day <= groups[k][1]:
+                dirty.add(_find(roots, groups[k][2][0]))
+        days = set(touched)
+        for first, last, group in groups:
+            if _find(roots, group[0]) in dirty:
+                days.update(range(first, last + 1))
+        members = [self.entries[names[i]] for i in range(len(names)) if _find(roots, i) in dirty]
+        return days, members
+
+
+def _find(roots: list[int], i: int) -> int:
+    while roots[i] != i:
+        roots[i] = roots[roots[i]]
+        i = roots[i]
+    return i
+
+
+def _union(roots: list[int], i: int, j: int) -> None:
+    roots[_find(roots, i)] = _find(roots, j)
+
+
+@instrumentation.timed("scheduling.optimize_schedule")
+def optimize_schedule(
+    entries: Iterable[EntryProtocol],
+    preexisting: Calendar,
+    *,
+    budget: float = 1.0,
+    weights: Weights | None = None,
+    temperature: tuple[float, float] = (50.0, 0.5),
+    seed: int | None = None,
+) -> OptimizedSchedule:
+    """Schedule `entries` into a copy of `preexisting`, starting from `schedule_entries` and
+    improving on it by simulated annealing until `budget` seconds have passed since the call.
+
+    Each step proposes one move: relocate an entry to the best gap of another day, shift it
+    within its gap, resize it between `min_time` and `max_time`, swap two entries, or let an
+    unplaced entry displace a lower-priority one. Unlike the greedy allocation, the search may
+    place entries after their due date, at a cost (see `Weights`); moves that would put an
+    entry on the day of one of its prerequisites or before it are not made.
+
+    Args:
+        entries: the entries to schedule, as a mapping by name or an iterable.
+        preexisting: calendar with the fixed blocks; it is not modified.
+        budget: wall-clock seconds for the whole call; the greedy start always completes.
+        weights: weights of the cost terms.
+        temperature: initial and final temperature, decreasing geometrically over the budget.
+        seed: seed of the random moves, for reproducible results with the same iteration count.
+
+    Returns:
+        the best schedule found (never worse than the greedy one), the entries left unplaced,
+        its cost and the number of moves tried
+    """
+    started = perf_counter()
+    entries = list(entries.values() if isinstance(entries, Mapping) else entries)
+    greedy = schedule_entries(entries, preexisting, Recipe.DEFAULT)
+    search = _Search.from_greedy(entries, greedy, weights or Weights(), random.Random(seed))
+    calendar = deepcopy(preexisting)
+    # placing an entry in the result costs about as much as a greedy attempt did, and only the
+    # placed entries are added, so keep in hand their share of the time taken so far
+    placed = sum(placement is not None for placement in search.placement)
+    deadline = started + budget - (perf_counter() - started) * placed / max(len(entries), 1)
+    best, cost, iterations = _anneal(search, deadline, temperature)
+    remaining = _place(calendar, search.dates, entries, best)
+    return OptimizedSchedule(calendar, remaining, cost, iterations)
+
+
+def _place(
+    calendar: Calendar,
+    dates: list[Date],
+    entries: list[EntryProtocol],
+    placements: list[Placement | None],
+) -> Entries:
+    """Add `entries` to `calendar` at their `placements`; return those left unplaced."""
+    remaining = Entries()
+    for entry, placement in zip(entries, placements, strict=True):
+        if placement is not None:
+            day, start, minutes = placement
+            calendar_day = calendar[dates[day]]
+            result = calendar_day.schedule.add_flex_at(
+                entry, from_minutes(DAY_START, start), from_minutes(DAY_START, start + minutes)
+            )[0]
+            if result is not AddResult.NOT_ADDED:
+                calendar_day.entries[entry.name] = entry
+                continue
+        remaining[entry.name] = entry
+    return remaining
+
+
+def _anneal(
+    search: _Search, deadline: float, temperature: tuple[float, float]
+) -> tuple[list[Placement | None], float, int]:
+    """Run moves until `deadline`; return the best placements seen, their cost and the number
+    of moves tried."""
+    best, best_cost = list(search.placement), search.cost
+    start, (hot, cold) = perf_counter(), temperature
+    current = hot
+    iterations = 0
+    while search.entries and search.dates:
+        if iterations % 32 == 0:
+            now = perf_counter()
+            if now >= deadline:
+                break
+            current = hot * (cold / hot) ** ((now - start) / max(deadline - start, 1e-9))
+        iterations += 1
+        changes = search.propose()
+        delta = None if changes is None else search.apply(changes)
+        if delta is None:
+            continue
+        if delta > 0 and search.rng.random() >= math.exp(-delta / current):
+            search.undo()
+        elif search.cost < best_cost - 1e-9:
+            best, best_cost = list(search.placement), search.cost
+    return best, best_cost, iterations
+
+
+class _Search:
+    """State of the local search: one placement per entry, on one `GapIndex` per day."""
+
+    def __init__(
+        self,
+        entries: list[EntryProtocol],
+        dates: list[Date],
+        weights: Weights,
+        rng: random.Random,
+    ) -> None:
+        self.entries = entries
+        self.dates = dates
+        self.weights = weights
+        self.rng = rng
+        self.ndays = len(dates)
+        self.gaps: list[GapIndex] = [GapIndex(()) for _ in dates]
+        self.contexts = [frozenset(entry_contexts(entry)) for entry in entries]
+        self.graph = DependencyGraph(entries)
+        windows = [entry_window(dates, entry) for entry in entries]
+        self.first = [first for first, _ in windows]
+        self.due = [last for _, last in windows]
+        self.placement: list[Placement | None] = [None] * len(entries)
+        self.by_day: list[dict[int, float]] = [{} for _ in dates]  # entry position -> start
+        self.switches = [0] * len(dates)
+        self.cost = 0.0
+        self._undo: Changes = {}
+
+    @classmethod
+    def from_greedy(
+        cls,
+        entries: list[EntryProtocol],
+        greedy: Calendar,
+        weights: Weights,
+        rng: random.Random,
+    ) -> _Search:
+        """Start from the flex blocks that `greedy` allocated for `entries`."""
+        search = cls(entries, sorted(greedy.keys()), weights, rng)
+        position = {entry.name: i for i, entry in enumerate(entries)}
+        for day, date in enumerate(search.dates):
+            schedule = greedy[date].schedule
+            search.gaps[day] = schedule.gap_index
+            for block in schedule.flex:
+                if block.name in schedule.placed and block.name in position:
+                    start = block.start.to_minutes()
+                    search.assign(
+                        position[block.name], (day, start, block.end.to_minutes() - start)
+                    )
+        search.refresh()
+        return search
+
+    def assign(self, i: int, placement: Placement) -> None:
+        """Record a placement that is already occupied in the gap indexes."""
+        self.placement[i] = placement
+        self.by_day[placement[0]][i] = placement[1]
+
+    def refresh(self) -> None:
+        self.switches = [self.day_switches(day) for day in range(self.ndays)]
+        self.cost = sum(map(self.entry_cost, range(len(self.entries)))) + (
+            self.weights.switches * sum(self.switches)
+        )
+
+    def entry_cost(self, i: int) -> float:
+        entry, placement = self.entries[i], self.placement[i]
+        if placement is None:
+            return self.weights.unplaced * (1 + entry.priority) * entry.ideal_time
+        day, _, minutes = placement
+        return self.weights.lateness * max(0, day - self.due[i]) + self.weights.deviation * abs(
+            minutes - entry.ideal_time
+        )
+
+    def day_switches(self, day: int) -> int:
+        starts = self.by_day[day]
+        order = sorted(starts, key=starts.__getitem__)
+        return sum(self.contexts[a] != self.contexts[b] for a, b in pairwise(order))
+
+    def apply(self, changes: Changes) -> float | None:
+        """Apply `changes` and return the change in cost, or None (and change nothing) if one of
+        the new placements is not free or would come before a prerequisite."""
+        if self.graph.edges and not self._ordered(changes):
+            return None
+        old: Changes = {i: self.placement[i] for i in changes}
+        days = {p[0] for p in (*old.values(), *changes.values()) if p is not None}
+        before = sum(map(self.entry_cost, changes)) + self.weights.switches * sum(
+            self.switches[day] for day in days
+        )
+        if not self._move(old, changes):
+            self._move(changes, old)
+            return None
+        for day in days:
+            self.switches[day] = self.day_switches(day)
+        after = sum(map(self.entry_cost, changes)) + self.weights.switches * sum(
+            self.switches[day] for day in days
+        )
+        self.cost += after - before
+        self._undo = old
+        return after - before
+
+    def undo(self) -> None:
+        self.apply(self._undo)
+
+    def _move(self, old: Changes, new: Changes) -> bool:
+        """Release the `old` placements and occupy the `new` ones, stopping at the first one that
+        is not free (the placements made so far stay, so that `_move(new, old)` reverts)."""
+        for i, placement in old.items():
+            if placement is not None and self.placement[i] == placement:
+                day, start, minutes = placement
+                self.gaps[day].release(start, start + minutes)
+                del self.by_day[day][i]
+                self.placement[i] = None
+        for i, placement in new.items():
+            if placement is None:
+                continue
+            day, start, minutes = placement
+            index = self.gaps[day]
+            if not index.can_receive(start, start + minutes, self.contexts[i]):
+                return False
+            try:
+                index.occupy(start, start + minutes)
+            except TemporalLogicError:
+                return False
+            self.assign(i, placement)
+        return True
+
+    def _ordered(self, changes: Changes) -> bool:
+        """Whether every entry would still be on a later day than its prerequisites."""
+
+        def day(i: int) -> int | None:
+            placement = changes[i] if i in changes else self.placement[i]
+            return None if placement is None else placement[0]
+
+        for i in changes:
+            own = day(i)
+            if own is None:
+                if any(day(j) is not None for j in self.graph.dependents(i)):
+                    return False
+                continue
+            before = [day(j) for j in self.graph.prerequisites(i)]
+            after = [day(j) for j in self.graph.dependents(i)]
+            if any(d is None or d >= own for d in before) or any(
+                d is not None and d <= own for d in after
+            ):
+                return False
+        return True
+
+    def propose(self) -> Changes | None:
+        """A random move, or None if the one drawn does not apply."""
+        i = self.rng.randrange(len(self.entries))
+        if self.placement[i] is None:
+            return self._displace(i) if self.rng.random() < 0.5 else self._relocate(i)
+        move = self.rng.choice((self._relocate, self._shift, self._resize, self._swap))
+        return move(i)
+
+    def _relocate(self, i: int) -> Changes | None:
+        if self.first[i] >= self.ndays:
+            return None
+        entry, contexts = self.entries[i], self.contexts[i]
+        day = self.rng.randrange(self.first[i], self.ndays)
+        found = self.gaps[day].fit(entry, contexts)
+        return None if found is None else {i: (day, *found)}
+
+    def _shift(self, i: int) -> Changes | None:
+        day, start, minutes = self.placement[i]  # type: ignore[misc]
+        lo, hi = self.gaps[day].free_around(start, start + minutes)
+        room = int(hi - minutes - lo)
+        if room <= 0:
+            return None
+        return {i: (day, lo + self.rng.randrange(room + 1), minutes)}
+
+    def _resize(self, i: int) -> Changes | None:
+        entry = self.entries[i]
+        day, start, minutes = self.placement[i]  # type: ignore[misc]
+        _, hi = self.gaps[day].free_around(start, start + minutes)
+        longest = min(entry.max_time, hi - start)
+        if longest < entry.min_time:
+            return None
+        return {i: (day, start, self.rng.randint(entry.min_time, int(longest)))}
+
+    def _swap(self, i: int) -> Changes | None:
+        j = self.rng.randrange(len(self.entries))
+        first, second = self.placement[i], self.placement[j]
+        if i == j or first is None or second is None:
+            return None
+        if second[0] < self.first[i] or first[0] < self.first[j]:
+            return None
+        return {
+            i: (second[0], second[1], self._clamp(i, second[2])),
+            j: (first[0], first[1], self._clamp(j, first[2])),
+        }
+
+    def _displace(self, i: int) -> Changes | None:
+        entry = self.entries[i]
+        j = self.rng.randrange(len(self.entries))
+        other = self.placement[j]
+        if other is None or self.entries[j].priority >= entry.priority or other[0] < self.first[i]:
+            return None
+        day, start, minutes = other
+        lo, hi = self.gaps[day].free_around(start, start + minutes)
+        if hi - lo < entry.min_time:
+            return None
+        return {j: None, i: (day, lo, min(entry.ideal_time, hi - lo))}
+
+    def _clamp(self, i: int, minutes: float) -> float:
+        entry = self.entries[i]
+        return min(max(minutes, entry.min_time), entry.max_time)
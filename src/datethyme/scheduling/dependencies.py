@@ -0,0 +1,139 @@
+"""
+Dependency graphs over entries.
+
+`DependencyGraph` compiles the `dependencies` of a sequence of entries once into index arrays: the
+prerequisites and the dependents of entry `i` are the slices `[offsets[i]:offsets[i + 1]]` of one
+flat list each (compressed sparse rows), and a topological order is stored alongside. Every pass
+over the graph (propagation, priority inheritance, critical path) is then a single O(n + e) loop
+over plain lists, with no name lookups.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+
+from ..exceptions import TemporalLogicError
+from ..protocols import EntryProtocol
+
+
+class DependencyGraph:
+    """The dependencies between `entries`, by position in `entries`.
+
+    Dependencies on names that are not among the entries are ignored (they are taken as done).
+
+    Raises:
+        TemporalLogicError: if the dependencies have a cycle.
+    """
+
+    __slots__ = ("_dependents", "_prerequisites", "index", "names", "order")
+
+    def __init__(self, entries: Iterable[EntryProtocol]) -> None:
+        entries = list(entries)
+        self.names = [entry.name for entry in entries]
+        self.index = {name: i for i, name in enumerate(self.names)}
+        edges = [
+            (self.index[name], i)
+            for i, entry in enumerate(entries)
+            for name in sorted(entry.dependencies or ())
+            if name in self.index
+        ]
+        self._prerequisites = _compile(len(entries), [(after, before) for before, after in edges])
+        self._dependents = _compile(len(entries), edges)
+        self.order = self._topological_order()
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @property
+    def edges(self) -> int:
+        return len(self._dependents[1])
+
+    def prerequisites(self, i: int) -> list[int]:
+        offsets, targets = self._prerequisites
+        return targets[offsets[i] : offsets[i + 1]]
+
+    def dependents(self, i: int) -> list[int]:
+        offsets, targets = self._dependents
+        return targets[offsets[i] : offsets[i + 1]]
+
+    def propagate(self, windows: Sequence[tuple[int, int]]) -> list[tuple[int, int]]:
+        """Narrow the `windows` of days so that each entry starts a day after the earliest start
+        of each of its prerequisites (the latest days are left as they are, so that an entry due
+        too early to follow its prerequisites does not hold them back)."""
+        first = [window[0] for window in windows]
+        for i in self.order:
+            for j in self.prerequisites(i):
+                first[i] = max(first[i], first[j] + 1)
+        return [(start, last) for start, (_, last) in zip(first, windows, strict=True)]
+
+    def inherited(self, values: Sequence[float]) -> list[float]:
+        """The largest of each entry's value and the values of the entries that depend on it,
+        directly or not (e.g. the priority it takes from the work waiting on it)."""
+        result = list(values)
+        for i in reversed(self.order):
+            for j in self.dependents(i):
+                result[i] = max(result[i], result[j])
+        return result
+
+    def critical_path(self, durations: Sequence[float]) -> tuple[float, list[int]]:
+        """The chain of dependencies with the largest total duration.
+
+        Returns:
+            the total duration and the positions of the chain's entries, prerequisites first
+        """
+        total = list(durations)
+        previous: list[int | None] = [None] * len(self)
+        for i in self.order:
+            for j in self.prerequisites(i):
+                if total[j] + durations[i] > total[i]:
+                    total[i], previous[i] = total[j] + durations[i], j
+        if not total:
+            return 0.0, []
+        node: int | None = max(range(len(self)), key=total.__getitem__)
+        longest, path = total[node], []
+        while node is not None:
+            path.append(node)
+            node = previous[node]
+        return longest, path[::-1]
+
+    def _topological_order(self) -> list[int]:
+        waiting = [len(self.prerequisites(i)) for i in range(len(self))]
+        order = [i for i, count in enumerate(waiting) if count == 0]
+        for i in order:  # the list grows while it is iterated over
+            for j in self.dependents(i):
+                waiting[j] -= 1
+                if waiting[j] == 0:
+                    order.append(j)
+        if len(order) < len(self):
+            cycle = " -> ".join(self.names[i] for i in self._cycle(waiting))
+            msg = f"Dependency cycle: {cycle}"
+            raise TemporalLogicError(msg)
+        return order
+
+    def _cycle(self, waiting: list[int]) -> list[int]:
+        """A cycle among the entries that the topological sort left `waiting`."""
+        # every entry left waiting has a prerequisite left waiting, so following them must loop
+        node = next(i for i, count in enumerate(waiting) if count > 0)
+        seen: dict[int, int] = {}
+        path: list[int] = []
+        while node not in seen:
+            seen[node] = len(path)
+            path.append(node)
+            node = next(j for j in self.prerequisites(node) if waiting[j] > 0)
+        cycle = path[seen[node] :]  # each entry followed by one of its prerequisites
+        return [node, *cycle[:0:-1], node]
+
+
+def _compile(size: int, edges: list[tuple[int, int]]) -> tuple[list[int], list[int]]:
+    """Offsets and targets of the edges from each of `size` nodes (compressed sparse rows)."""
+    offsets = [0] * (size + 1)
+    for source, _ in edges:
+        offsets[source + 1] += 1
+    for i in range(size):
+        offsets[i + 1] += offsets[i]
+    targets = [0] * len(edges)
+    cursor = offsets[:-1]
+    for source, target in edges:
+        targets[cursor[source]] = target
+        cursor[source] += 1
+    return offsets, targets
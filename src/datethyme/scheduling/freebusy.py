@@ -0,0 +1,273 @@
+"""
+Free/busy computation across many calendars.
+
+All interval arithmetic is done on plain minute coordinates (see `scheduling.utils.to_minutes`),
+so that the per-calendar busy lists can be merged with `heapq.merge` and shipped cheaply to
+worker processes. `DateTimeSpan` objects are only created for the final result.
+
+Every stage is a generator, so that `find_slots` only reads as many days as it needs.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from heapq import merge
+from itertools import chain, islice
+
+from .. import instrumentation
+from ..core import Date, DateRange, DateTime, DateTimeSpan, Time, TimeSpan
+from .types import Calendar
+from .types.slots import Context, TimeSlotMixin
+from .utils import MINUTES_PER_DAY, date_to_minutes, datetime_from_minutes
+
+type Interval = tuple[float, float]
+
+DAY_SPAN = TimeSpan(start=Time(hour=0), end=Time(hour=24))
+
+
+def iter_busy_intervals(calendar: Calendar, dates: Iterable[Date]) -> Iterator[Interval]:
+    """Yield the busy (fixed or flex) intervals of `calendar` on the sorted `dates`."""
+    for date in dates:
+        if date not in calendar:
+            continue
+        offset = date_to_minutes(date)
+        for block in calendar[date].schedule.busy:
+            start, end = block.start.to_minutes(), block.end.to_minutes()
+            if end > start:
+                yield (offset + start, offset + end)
+
+
+def busy_intervals(calendar: Calendar, dates: Iterable[Date] | None = None) -> list[Interval]:
+    """Return the busy (fixed or flex) intervals of `calendar` as sorted minute coordinates."""
+    selected = sorted(calendar.keys()) if dates is None else sorted(dates)
+    return list(iter_busy_intervals(calendar, selected))
+
+
+def iter_working_intervals(
+    dates: Iterable[Date],
+    working_hours: TimeSpan | Iterable[TimeSpan] | None = None,
+) -> Iterator[Interval]:
+    """Expand a daily working-hours mask over the sorted `dates`, coalescing windows that touch."""
+    mask = _normalize_mask(working_hours)
+    pending: Interval | None = None
+    for date in dates:
+        offset = date_to_minutes(date)
+        for start, end in mask:
+            if pending and pending[1] >= offset + start:
+                pending = (pending[0], max(pending[1], offset + end))
+                continue
+            if pending:
+                yield pending
+            pending = (offset + start, offset + end)
+    if pending:
+        yield pending
+
+
+def working_intervals(
+    dates: Iterable[Date],
+    working_hours: TimeSpan | Iterable[TimeSpan] | None = None,
+) -> list[Interval]:
+    return list(iter_working_intervals(sorted(set(dates)), working_hours))
+
+
+def merge_busy(busy_lists: Iterable[Iterable[Interval]]) -> Iterator[Interval]:
+    """K-way merge of sorted busy lists, yielding the union as disjoint sorted intervals."""
+    current: Interval | None = None
+    for start, end in merge(*busy_lists):
+        if current is None:
+            current = (start, end)
+        elif start <= current[1]:
+            current = (current[0], max(current[1], end))
+        else:
+            yield current
+            current = (start, end)
+    if current is not None:
+        yield current
+
+
+def iter_free_intervals(
+    busy_lists: Iterable[Iterable[Interval]],
+    windows: Iterable[Interval],
+    min_minutes: int | float = 0,
+) -> Iterator[Interval]:
+    """Complement of the merged busy intervals within `windows`, dropping short leftovers."""
+    busy = merge_busy(busy_lists)
+    pending = next(busy, None)
+    for window_start, window_end in windows:
+        cursor = window_start
+        while pending is not None and pending[0] < window_end:
+            busy_start, busy_end = pending
+            if busy_start > cursor and busy_start - cursor >= min_minutes:
+                yield (cursor, busy_start)
+            cursor = max(cursor, busy_end)
+            if busy_end > window_end:
+                break
+            pending = next(busy, None)
+        if window_end > cursor and window_end - cursor >= min_minutes:
+            yield (cursor, window_end)
+
+
+def free_intervals(
+    busy_lists: Sequence[Sequence[Interval]],
+    windows: Sequence[Interval],
+    min_minutes: int | float = 0,
+) -> list[Interval]:
+    return list(iter_free_intervals(busy_lists, windows, min_minutes))
+
+
+@instrumentation.timed("freebusy.free_busy")
+def free_busy(
+    calendars: Iterable[Calendar],
+    *,
+    working_hours: TimeSpan | Iterable[TimeSpan] | None = None,
+    min_minutes: int | float = 0,
+    dates: Iterable[Date] | None = None,
+    max_workers: int | None = None,
+    block_days: int = 7,
+) -> list[DateTimeSpan]:
+    """Compute the spans during which every calendar in `calendars` is free.
+
+    Args:
+        calendars: calendars whose busy (fixed and flex) blocks are combined.
+        working_hours: daily mask restricting the result; the whole day if None.
+        min_minutes: minimum length of a returned free span.
+        dates: dates to consider; defaults to the union of all calendar dates.
+        max_workers: if given, fan out over a process pool, one task per block of dates.
+        block_days: number of consecutive dates per process-pool task.
+    """
+    calendars = list(calendars)
+    if dates is None:
+        dates = set(chain.from_iterable(cal.keys() for cal in calendars))
+    selected = sorted(set(dates))
+    if not selected:
+        return []
+
+    if max_workers is None:
+        busy_lists = [iter_busy_intervals(cal, selected) for cal in calendars]
+        windows = iter_working_intervals(selected, working_hours)
+        intervals = list(iter_free_intervals(busy_lists, windows, min_minutes))
+    else:
+        blocks = [selected[i : i + block_days] for i in range(0, len(selected), block_days)]
+        tasks = [
+            (
+                [busy_intervals(cal, block) for cal in calendars],
+                working_intervals(block, working_hours),
+            )
+            for block in blocks
+        ]
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            results = pool.map(_free_intervals_task, tasks)
+        joined = _join_touching(chain.from_iterable(results))
+        intervals = [(a, b) for a, b in joined if b - a >= min_minutes]
+
+    return [_to_span(interval) for interval in intervals]
+
+
+@instrumentation.timed("freebusy.find_slots")
+def find_slots(
+    calendars: Iterable[Calendar],
+    duration: int | float,
+    k: int,
+    earliest: DateTime,
+    latest: DateTime,
+    contexts: Context | set[Context] | None = None,
+    *,
+    slots: Iterable[TimeSlotMixin[Time]] | None = None,
+    step: int | float | None = None,
+) -> list[DateTimeSpan]:
+    """Return the `k` earliest spans of `duration` minutes that are free in every calendar.
+
+    The search stops as soon as `k` slots have been found, so only the days up to the last
+    returned slot are read.
+
+    Args:
+        calendars: calendars that must all be free.
+        duration: length of each slot, in minutes.
+        k: maximum number of slots to return.
+        earliest: lower bound of the search window.
+        latest: upper bound of the search window.
+        contexts: contexts of the item being placed, checked against each slot's
+            `require_all`/`require_any`/`require_none` rules.
+        slots: daily time slots the item may be placed in; the whole day if None.
+        step: if given, also offer later starts within the same free span, `step` minutes apart;
+            otherwise each free span yields at most one slot.
+
+    Raises:
+        ValueError: if `contexts` is given without `slots` to check them against.
+    """
+    if contexts is not None and slots is None:
+        raise ValueError("contexts are checked against slots, but no slots were given.")
+    if k <= 0:
+        return []
+    mask: list[TimeSpan] | None = None
+    if slots is not None:
+        receiving = set() if contexts is None else contexts
+        mask = [TimeSpan(s.start, s.end) for s in slots if s.can_receive(receiving)]
+        if not mask:
+            return []
+
+    dates = list(DateRange(earliest.date, latest.date + 1))
+    busy_lists = [iter_busy_intervals(cal, dates) for cal in calendars]
+    windows = _clip(
+        iter_working_intervals(dates, mask),
+        earliest.to_minutes(),
+        latest.to_minutes(),
+    )
+    free = iter_free_intervals(busy_lists, windows, min_minutes=duration)
+
+    return [_to_span(interval) for interval in islice(_iter_starts(free, duration, step), k)]
+
+
+def _iter_starts(
+    free: Iterable[Interval], duration: int | float, step: int | float | None
+) -> Iterator[Interval]:
+    for start, end in free:
+        if step is None:
+            yield (start, start + duration)
+            continue
+        current = start
+        while current + duration <= end:
+            yield (current, current + duration)
+            current += step
+
+
+def _clip(windows: Iterable[Interval], lower: float, upper: float) -> Iterator[Interval]:
+    for start, end in windows:
+        if end <= lower:
+            continue
+        if start >= upper:
+            return
+        yield (max(start, lower), min(end, upper))
+
+
+def _free_intervals_task(task: tuple[list[list[Interval]], list[Interval]]) -> list[Interval]:
+    # the minimum length is applied after joining, since a span may continue into the next block
+    busy_lists, windows = task
+    return free_intervals(busy_lists, windows)
+
+
+def _join_touching(intervals: Iterable[Interval]) -> list[Interval]:
+    joined: list[Interval] = []
+    for start, end in intervals:
+        if joined and joined[-1][1] == start:
+            joined[-1] = (joined[-1][0], end)
+        else:
+            joined.append((start, end))
+    return joined
+
+
+def _normalize_mask(working_hours: TimeSpan | Iterable[TimeSpan] | None) -> list[Interval]:
+    if working_hours is None:
+        spans: Iterable[TimeSpan] = (DAY_SPAN,)
+    elif isinstance(working_hours, TimeSpan):
+        spans = (working_hours,)
+    else:
+        spans = working_hours
+    mask = sorted((s.start.to_minutes(), s.end.to_minutes()) for s in spans)
+    return [(max(0.0, a), min(MINUTES_PER_DAY, b)) for a, b in mask if b > a]
+
+
+def _to_span(interval: Interval) -> DateTimeSpan:
+    start, end = interval
+    return DateTimeSpan(start=datetime_from_minutes(start), end=datetime_from_minutes(end))
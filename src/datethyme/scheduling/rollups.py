@@ -0,0 +1,91 @@
+"""
+Time-use rollups: total minutes per name, context or project over a window of a `Calendar`.
+
+Every `DayPartition` caches its own per-label totals (see `DayPartition.rollup`), so a weekly or
+monthly summary only recomputes the days whose blocks changed and otherwise just adds up the
+cached per-day dictionaries.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Mapping
+from typing import Literal
+
+from .. import instrumentation
+from ..core import Date
+from ..protocols import SpanProtocol
+from .types import Calendar
+from .types._abcs import RollupKey
+
+type Period = Literal["day", "week", "month"]
+
+
+def by_name(block: SpanProtocol) -> Iterable[str]:
+    name = getattr(block, "name", None)
+    return (name,) if name else ()
+
+
+def by_context(block: SpanProtocol) -> Iterable[str]:
+    """Count a block towards each of its contexts; blocks without contexts are not counted."""
+    return getattr(block, "contexts", None) or ()
+
+
+def by_mapping(mapping: Mapping[str, str], default: str | None = None) -> RollupKey:
+    """Label blocks by looking up their name in `mapping`, e.g. from entry name to project.
+
+    The returned key is cached by the rollups like any other, so build it once and reuse it.
+    """
+
+    def key(block: SpanProtocol) -> Iterable[str]:
+        label = mapping.get(getattr(block, "name", None) or "", default)
+        return (label,) if label else ()
+
+    return key
+
+
+@instrumentation.timed("rollups.rollup")
+def rollup(
+    calendar: Calendar,
+    key: RollupKey = by_name,
+    start: Date | None = None,
+    end: Date | None = None,
+) -> dict[str, float]:
+    """Total busy minutes per label over the dates in `[start, end)` (all dates by default)."""
+    totals: dict[str, float] = {}
+    for date in _dates_in_window(calendar, start, end):
+        _add_into(totals, calendar[date].schedule.rollup(key))
+    return totals
+
+
+@instrumentation.timed("rollups.rollup_by_period")
+def rollup_by_period(
+    calendar: Calendar,
+    key: RollupKey = by_name,
+    period: Period = "week",
+    start: Date | None = None,
+    end: Date | None = None,
+) -> dict[Date, dict[str, float]]:
+    """Like `rollup`, but grouped by day, ISO week or month (keyed by the period's first day)."""
+    period_start = _PERIOD_STARTS[period]
+    grouped: dict[Date, dict[str, float]] = {}
+    for date in _dates_in_window(calendar, start, end):
+        _add_into(grouped.setdefault(period_start(date), {}), calendar[date].schedule.rollup(key))
+    return grouped
+
+
+def _dates_in_window(calendar: Calendar, start: Date | None, end: Date | None) -> list[Date]:
+    lower = -1 if start is None else start.ordinal
+    upper = float("inf") if end is None else end.ordinal
+    return sorted(date for date in calendar.keys() if lower <= date.ordinal < upper)
+
+
+def _add_into(totals: dict[str, float], other: Mapping[str, float]) -> None:
+    for label, minutes in other.items():
+        totals[label] = totals.get(label, 0.0) + minutes
+
+
+_PERIOD_STARTS: dict[Period, Callable[[Date], Date]] = {
+    "day": lambda date: date,
+    "week": lambda date: date - date.weekday_ordinal,
+    "month": lambda date: Date.ymd(date.year, date.month, 1),
+}
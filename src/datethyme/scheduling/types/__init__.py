@@ -1,18 +1,52 @@
-from .adapters import (
-    make_entries_adapter,
-    make_entry_adapter,
-)
-from .entries import Entries, Entry
-from .log import SchedulingLog
-from .partitions import DatePartition, DateTimePartition, TimePartition
-from .schedules import (
-    Calendar,
-    CalendarDay,
-    DayPartition,
-    EmptyBlock,
-    FixedBlock,
-    FlexBlock,
-)
+from typing import TYPE_CHECKING, Any
+
+from ..._lazy import listing, load
+
+if TYPE_CHECKING:
+    from .adapters import (
+        make_entries_adapter,
+        make_entry_adapter,
+    )
+    from .entries import Entries, Entry
+    from .log import SchedulingLog
+    from .partitions import DatePartition, DateTimePartition, TimePartition
+    from .persistent import PersistentPartition
+    from .schedules import (
+        Calendar,
+        CalendarDay,
+        DayPartition,
+        EmptyBlock,
+        FixedBlock,
+        FlexBlock,
+    )
+
+# partitions do not need the adiumentum-based schedule models, so each module loads on first use
+__lazy__ = {
+    "make_entries_adapter": ".adapters",
+    "make_entry_adapter": ".adapters",
+    "Entries": ".entries",
+    "Entry": ".entries",
+    "SchedulingLog": ".log",
+    "DatePartition": ".partitions",
+    "DateTimePartition": ".partitions",
+    "TimePartition": ".partitions",
+    "PersistentPartition": ".persistent",
+    "Calendar": ".schedules",
+    "CalendarDay": ".schedules",
+    "DayPartition": ".schedules",
+    "EmptyBlock": ".schedules",
+    "FixedBlock": ".schedules",
+    "FlexBlock": ".schedules",
+}
+
+
+def __getattr__(name: str) -> Any:
+    return load(__name__, __lazy__, name)
+
+
+def __dir__() -> list[str]:
+    return listing(__name__, __lazy__)
+
 
 __all__ = (
     "Calendar",
@@ -25,6 +59,7 @@ __all__ = (
     "Entry",
     "FixedBlock",
     "FlexBlock",
+    "PersistentPartition",
     "SchedulingLog",
     "TimePartition",
     "make_entries_adapter",
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+import math
 from abc import ABC, abstractmethod
-from collections.abc import Callable, Iterable, Iterator
+from bisect import bisect_right
+from collections.abc import Callable, Iterable, Iterator, MutableSequence, Sequence
 from functools import lru_cache
-from itertools import pairwise
-from typing import Self
+from itertools import accumulate, pairwise
+from typing import Literal, Self
 
+from ... import instrumentation
 from ..._abcs import AbstractSpan
 from ...constants import Unit
+from ...core import DateTime, DateTimeSpan, TimeSpan
 from ...exceptions import TemporalLogicError
 from ...protocols import (
     DeltaProtocol,
@@ -19,10 +23,17 @@ from ...protocols import (
 )
 from ...utils import truthy_falsy
 from ..algorithms import (
+    PipelineStep,
     is_contiguous,
     stack_forward,
+    water_fill,
+    with_bounds,
 )
-from ..utils import is_partitioned
+from ..utils import MINUTES_PER_DAY, from_minutes, is_partitioned
+from .persistent import PersistentPartition
+
+type RollupKey = Callable[[SpanProtocol], Iterable[str]]
+"""Map a span or block to the labels (names, contexts, projects, ...) its minutes count towards."""
 
 
 class AbstractPartition[T: TimeProtocol](PartitionProtocol, ABC):
@@ -31,20 +42,21 @@ class AbstractPartition[T: TimeProtocol](PartitionProtocol, ABC):
         spans: Iterable[SpanProtocol[T]],
         names: Iterable[str | None] | None = None,
     ) -> None:
-        if not is_contiguous(spans):
-            raise ValueError
-
-        self._spans = list(spans)
+        self._spans = self._materialize(spans)
         self._names = list(names) if names else names
+        self._boundary_cache: list[float] | None = None
+        self._name_cache: dict[str, int] | None = None
+        self._version = 0
+        self._rollup_cache: dict[RollupKey, tuple[tuple, dict[str, float]]] = {}
 
         if names and not (len(self.spans) == len(self.names)):
             raise ValueError
 
     def __getitem__(self, idx: str) -> SpanProtocol[T]:
-        for span in self._spans:
-            if span.name == idx:
-                return span
-        raise IndexError
+        position = self.name_index.get(idx)
+        if position is None:
+            raise IndexError
+        return self._spans[position]
 
     @property
     @lru_cache
@@ -96,6 +108,26 @@ class AbstractPartition[T: TimeProtocol](PartitionProtocol, ABC):
     def ends(self) -> tuple[T, ...]:
         return tuple(map(lambda t: t.end, self.spans))
 
+    @property
+    def boundaries(self) -> list[float]:
+        """Sorted span boundaries in minutes (`n + 1` values for `n` spans), computed lazily."""
+        if self._boundary_cache is None:
+            bounds = [span.start.to_minutes() for span in self._spans]
+            if self._spans:
+                bounds.append(self._spans[-1].end.to_minutes())
+            self._boundary_cache = bounds
+        return self._boundary_cache
+
+    @property
+    def name_index(self) -> dict[str, int]:
+        """Map from span name to the index of its first occurrence, computed lazily."""
+        if self._name_cache is None:
+            index: dict[str, int] = {}
+            for i, span in enumerate(self._spans):
+                index.setdefault(span.name, i)
+            self._name_cache = index
+        return self._name_cache
+
     @property
     def days(self) -> float:
         return self.span.days
@@ -166,10 +198,16 @@ class AbstractPartition[T: TimeProtocol](PartitionProtocol, ABC):
     def from_pipeline(
         cls,
         segments: Iterable[SpanProtocol[T]],
-        pipeline: Iterable[Callable[[Iterable[SpanProtocol[T]]], Iterable[SpanProtocol[T]]]],
+        pipeline: PipelineStep[T] | Iterable[PipelineStep[T]],
         names: Iterable[str | None] | None = None,
     ) -> Self:
-        for step in pipeline:
+        """Run `segments` through a pipeline (one step, e.g. from `compose`, or several).
+
+        Lazy steps such as `iter_resolve_gaps` or `coalesce` are consumed in a single pass while
+        the partition is validated.
+        """
+        steps = (pipeline,) if callable(pipeline) else pipeline
+        for step in steps:
             segments = step(segments)
         return cls.from_partition(segments, names=names)
 
@@ -179,18 +217,31 @@ class AbstractPartition[T: TimeProtocol](PartitionProtocol, ABC):
         times: Iterable[T],
         names: Iterable[str | None] | None = None,
     ) -> Self:
-        names = names or (None,) * (len(times := tuple(times)) - 1)
-        spans = (a.span(b) for (a, b), name in zip(pairwise(times), names))
-        return cls(spans=spans, names=names)
+        times = tuple(times)
+        return cls._from_boundary_array(times[0], [t.to_minutes() for t in times], names)
 
     @classmethod
     def from_partition(
         cls,
         segments: Iterable[SpanProtocol[T]],
         names: Iterable[str | None] | None = None,
+        *,
+        validate: bool = True,
     ) -> Self:
+        if not validate:
+            return cls._from_validated(segments)
         return cls(spans=segments, names=names)
 
+    @classmethod
+    def _from_validated(cls, spans: Iterable[SpanProtocol[T]]) -> Self:
+        """Build a partition from spans already known to be contiguous, skipping the check."""
+        partition = cls.__new__(cls)
+        partition._names = None
+        partition._version = 0
+        partition._rollup_cache = {}
+        partition._set_spans(list(spans))
+        return partition
+
     @classmethod
     def from_minutes(
         cls,
@@ -200,17 +251,10 @@ class AbstractPartition[T: TimeProtocol](PartitionProtocol, ABC):
         end: T | None = None,
         names: Iterable[str | None] | None = None,
     ) -> Self:
-        anchor_start = truthy_falsy(start, end)[0]
-        if not anchor_start:
-            total = sum(minute_durations)
-            assert end
-            start = end.add_minutes(-total)
-        spans = []
-        assert start
-        current: T = start
-        for duration in minute_durations:
-            spans.append(current.span(current.add_minutes(duration)))
-        return cls(spans)
+        durations = list(minute_durations)
+        anchored_at_start, (anchor, _) = truthy_falsy(start, end)
+        offset = anchor.to_minutes() - (0 if anchored_at_start else sum(durations))
+        return cls._from_boundary_array(anchor, list(accumulate(durations, initial=offset)), names)
 
     @classmethod
     def from_deltas(
@@ -237,15 +281,42 @@ class AbstractPartition[T: TimeProtocol](PartitionProtocol, ABC):
         segments: Iterable[float],
         names: Iterable[str | None] | None = None,
     ) -> Self:
-        total_weight = sum(segments)
-        total_minutes = start.minutes_to(end)
-        minute_durations = [seg * total_minutes / total_weight for seg in segments]
-        return cls.from_minutes(
-            minute_durations=minute_durations,
-            start=start,
-            end=end,
-            names=names,
-        )
+        weights = list(segments)
+        total_weight = sum(weights)
+        offset, total_minutes = start.to_minutes(), start.minutes_to(end)
+        # scaling the running sum (rather than summing scaled lengths) lands exactly on `end`
+        boundaries = [
+            offset + total_minutes * cumulative / total_weight
+            for cumulative in accumulate(weights, initial=0.0)
+        ]
+        return cls._from_boundary_array(start, boundaries, names)
+
+    @classmethod
+    def _from_boundary_array(
+        cls,
+        like: T,
+        boundaries: list[float],
+        names: Iterable[str | None] | None = None,
+    ) -> Self:
+        """Build a partition backed by `boundaries` (in minutes); spans are created on access.
+
+        Raises:
+            ValueError: if the boundaries decrease, or those of times fall outside the day.
+        """
+        if any(b < a for a, b in pairwise(boundaries)):
+            raise ValueError("Boundaries must be non-decreasing.")
+        _check_within_day(like, boundaries)
+        names_ = list(names) if names is not None else None
+        if names_ is not None and len(names_) != len(boundaries) - 1:
+            raise ValueError
+        partition = cls.__new__(cls)
+        partition._names = None
+        partition._spans = _LazySpans(like, boundaries, names_)
+        partition._boundary_cache = list(boundaries)
+        partition._name_cache = None
+        partition._version = 0
+        partition._rollup_cache = {}
+        return partition
 
     def partition_element(
         self,
@@ -320,7 +391,7 @@ class AbstractPartition[T: TimeProtocol](PartitionProtocol, ABC):
                 end=span.end.add_seconds(n),
             )
             new_spans.append(new_span)
-        self._spans = new_spans
+        self._set_spans(new_spans)
         return self
 
     def shift_start_rigid(self, new_start: T) -> Self:
@@ -337,32 +408,31 @@ class AbstractPartition[T: TimeProtocol](PartitionProtocol, ABC):
         return self
 
     def split(self, cut_point: T) -> tuple[PartitionProtocol[T], PartitionProtocol[T]]:
-        if not self.start <= cut_point <= self.end:
+        bounds = self.boundaries
+        point = cut_point.to_minutes()
+        if not self._spans or not bounds[0] <= point <= bounds[-1]:
             raise TemporalLogicError
-        first = []
-        second = []
-        trouble = []
-        for span in self.spans:
-            if span.end <= cut_point:
-                first.append(span)
-            elif span.start <= cut_point:
-                second.append(span)
-            else:
-                trouble.append(span)
-        if trouble:
-            if len(trouble) > 1:
-                raise TemporalLogicError
-            span_to_cut = trouble[0]
-            first.append(span_to_cut.start.span(cut_point))
-            second.insert(0, cut_point.span(span_to_cut.end))
+        idx = bisect_right(bounds, point) - 1
+        if idx >= len(self._spans) or bounds[idx] == point:
+            return (
+                self._from_validated(self._spans[:idx]),
+                self._from_validated(self._spans[idx:]),
+            )
 
-        return self.__class__(first), self.__class__(second)
+        head, tail = self._spans[idx].split(cut_point)
+        return (
+            self._from_validated([*self._spans[:idx], head]),
+            self._from_validated([tail, *self._spans[idx + 1 :]]),
+        )
 
     def span_containing(self, point: T) -> SpanProtocol[T] | None:
-        for span in self._spans:
-            if span.contains(point):
-                return span
-        return None
+        """The span with `start <= point < end`, or None.
+
+        Spans are half-open, as in `index_from_time`: a boundary shared by two spans belongs to
+        the later one, and the end of the partition to none.
+        """
+        idx = self.index_from_time(point)
+        return None if idx is None else self._spans[idx]
 
     # def insert(
     #     self,
@@ -373,38 +443,166 @@ class AbstractPartition[T: TimeProtocol](PartitionProtocol, ABC):
     # ) -> PartitionProtocol[T]:
 
     def index_from_name(self, name: str) -> int | None:
-        for i, span in enumerate(self.spans):
-            if span.name == name:
-                return i
-        return None
+        return self.name_index.get(name)
 
     def index_from_time(self, point: T) -> int | None:
-        for i, span in enumerate(self.spans):
-            if span.start <= point < span.end:
-                return i
+        return self._index_from_minutes(point.to_minutes())
+
+    def index_from_times(self, points: Iterable[T]) -> list[int | None]:
+        """Look up many points at once; equivalent to mapping `index_from_time` over `points`."""
+        minutes = [point.to_minutes() for point in points]
+        bounds = self.boundaries
+        n_spans = len(self._spans)
+        indices: list[int | None] = [None] * len(minutes)
+        lo = 0
+        for pos in sorted(range(len(minutes)), key=minutes.__getitem__):
+            lo = bisect_right(bounds, minutes[pos], lo=lo)
+            if 0 < lo <= n_spans:
+                indices[pos] = lo - 1
+        return indices
+
+    def _index_from_minutes(self, minutes: float) -> int | None:
+        idx = bisect_right(self.boundaries, minutes) - 1
+        if 0 <= idx < len(self._spans):
+            return idx
         return None
 
+    def insert(self, index: int, span: SpanProtocol[T]) -> Self:
+        """Insert `span` before position `index`, checking contiguity with its neighbours only.
+
+        Neighbouring spans are left as they are, so `span` must end where the following span
+        starts and start where the previous one ends: only spans at either end of the partition,
+        or zero-length spans inside it, fit. Use `replace` to split an interior span instead.
+        """
+        index = min(max(index, 0), len(self._spans))
+        previous = self._spans[index - 1] if index > 0 else None
+        following = self._spans[index] if index < len(self._spans) else None
+        if (previous is not None and not previous.end == span.start) or (
+            following is not None and not span.end == following.start
+        ):
+            raise TemporalLogicError(f"Span {span!r} does not fit at position {index}.")
+
+        self._spans.insert(index, span)
+        if self._boundary_cache is not None:
+            if len(self._spans) == 1:
+                self._boundary_cache = [span.start.to_minutes(), span.end.to_minutes()]
+            elif following is None:
+                self._boundary_cache.append(span.end.to_minutes())
+            else:
+                self._boundary_cache.insert(index, span.start.to_minutes())
+        self._name_cache = None
+        self._version += 1
+        return self
+
+    def replace(self, index: int, *spans: SpanProtocol[T]) -> Self:
+        """Replace the span at `index` by `spans`, which must cover exactly the same period."""
+        incumbent = self._spans[index]
+        replacements = self._materialize(spans)
+        if not replacements or not (
+            replacements[0].start == incumbent.start and replacements[-1].end == incumbent.end
+        ):
+            raise TemporalLogicError(f"Replacement does not cover {incumbent!r}.")
+
+        self._spans[index : index + 1] = replacements
+        if self._boundary_cache is not None:
+            inner = [span.start.to_minutes() for span in replacements[1:]]
+            self._boundary_cache[index + 1 : index + 1] = inner
+        self._name_cache = None
+        self._version += 1
+        return self
+
+    def remove(self, index: int, absorb: Literal["previous", "next"] | None = None) -> Self:
+        """Remove the span at `index`.
+
+        Removing an interior span requires a neighbour to `absorb` the freed period, so that the
+        partition stays contiguous; only that neighbour is rebuilt.
+        """
+        n_spans = len(self._spans)
+        index = index + n_spans if index < 0 else index
+        removed = self._spans[index]
+        if absorb is None:
+            if 0 < index < n_spans - 1:
+                raise TemporalLogicError("Removing an interior span requires `absorb`.")
+            del self._spans[index]
+            if self._boundary_cache is not None:
+                del self._boundary_cache[index + (index == n_spans - 1)]
+                if not self._spans:
+                    self._boundary_cache = []
+        elif absorb == "previous" and index > 0:
+            previous = self._spans[index - 1]
+            self._spans[index - 1 : index + 1] = [
+                with_bounds(previous, previous.start, removed.end)
+            ]
+            if self._boundary_cache is not None:
+                del self._boundary_cache[index]
+        elif absorb == "next" and index < n_spans - 1:
+            following = self._spans[index + 1]
+            self._spans[index : index + 2] = [with_bounds(following, removed.start, following.end)]
+            if self._boundary_cache is not None:
+                del self._boundary_cache[index + 1]
+        else:
+            raise TemporalLogicError(f"No {absorb} span to absorb position {index}.")
+        self._name_cache = None
+        self._version += 1
+        return self
+
+    def resize_boundary(self, index: int, new_time: T) -> Self:
+        """Move boundary `index` (the start of span `index`) and rebuild the two spans sharing it.
+
+        Boundary 0 is the start of the partition and boundary `len(spans)` its end.
+        """
+        n_spans = len(self._spans)
+        before = self._spans[index - 1] if index > 0 else None
+        after = self._spans[index] if index < n_spans else None
+        point = new_time.to_minutes()
+        if (before is not None and not before.start.to_minutes() < point) or (
+            after is not None and not point < after.end.to_minutes()
+        ):
+            raise TemporalLogicError(f"Boundary {index} cannot move to {new_time}.")
+
+        if before is not None:
+            self._spans[index - 1] = with_bounds(before, before.start, new_time)
+        if after is not None:
+            self._spans[index] = with_bounds(after, new_time, after.end)
+        if self._boundary_cache is not None:
+            self._boundary_cache[index] = point
+        self._version += 1
+        return self
+
+    @staticmethod
+    def _materialize(spans: Iterable[SpanProtocol[T]]) -> list[SpanProtocol[T]]:
+        """Collect `spans` into a list, checking contiguity in the same single pass."""
+        materialized: list[SpanProtocol[T]] = []
+        previous: SpanProtocol[T] | None = None
+        for span in spans:
+            if previous is not None and not previous.end == span.start:
+                raise ValueError(f"Spans are not contiguous: {previous!r}, {span!r}")
+            materialized.append(span)
+            previous = span
+        return materialized
+
+    def _set_spans(self, spans: Sequence[SpanProtocol[T]]) -> None:
+        if instrumentation.STATE.enabled:
+            instrumentation.count(f"rebuild:{type(self).__name__}")
+        self._spans = list(spans)
+        self._boundary_cache = None
+        self._name_cache = None
+        self._version += 1
+
     def forward_affine_transform(
         self,
         scale_factor: float,
         new_start: T | None = None,
         min_minutes: int | float = 5,
     ) -> Self:
-        new_spans = []
-        current = new_start or self.start
-        for span in self._spans:
-            new_span = span.forward_affine_transform(
-                scale_factor=scale_factor,
-                new_start=current,
-                min_minutes=min_minutes,
-            )
-            new_spans.append(new_span)
-            current = new_span.end
-        self._spans = new_spans
-
-        if self.minutes < min_minutes:
-            raise ValueError
-
+        """Scale the partition by `scale_factor` and anchor it at `new_start`.
+
+        Spans that would end up shorter than `min_minutes` are held at that length and the others
+        shrink to compensate (see `algorithms.water_fill`), so the total is exactly scaled.
+        """
+        lengths = self._scaled_lengths(scale_factor, min_minutes)
+        anchor = self.start if new_start is None else new_start
+        self._set_boundaries(anchor, list(accumulate(lengths, initial=anchor.to_minutes())))
         return self
 
     def backward_affine_transform(
@@ -413,26 +611,99 @@ class AbstractPartition[T: TimeProtocol](PartitionProtocol, ABC):
         new_end: T | None = None,
         min_minutes: int | float = 5,
     ) -> Self:
-        new_spans = []
-        current = new_end or self.start
-        for span in self._spans[::-1]:
-            new_span = span.forward_affine_transform(
-                scale_factor=scale_factor,
-                new_start=current,
-                min_minutes=min_minutes,
-            )
-            new_spans.append(new_span)
-            current = new_span.end
-        self._spans = new_spans
+        """Like `forward_affine_transform`, but anchored at `new_end` (by default, the end)."""
+        lengths = self._scaled_lengths(scale_factor, min_minutes)
+        anchor = self.end if new_end is None else new_end
+        offset = anchor.to_minutes() - sum(lengths)
+        self._set_boundaries(anchor, list(accumulate(lengths, initial=offset)))
+        return self
 
-        if self.minutes < min_minutes:
-            raise ValueError
+    def _scaled_lengths(self, scale_factor: float, min_minutes: int | float) -> list[float]:
+        if not self._spans:
+            raise ValueError("Cannot transform an empty partition.")
+        bounds = self.boundaries
+        lengths = [b - a for a, b in pairwise(bounds)]
+        return water_fill(lengths, scale_factor * (bounds[-1] - bounds[0]), min_minutes)
+
+    def _set_boundaries(self, like: T, boundaries: list[float]) -> None:
+        """Move every element onto `boundaries`, keeping names, span classes and nested partitions.
+
+        Raises:
+            ValueError: if a partition of times would move outside the day.
+        """
+        _check_within_day(like, boundaries)
+        spans = self._spans
+        templates = spans.templates() if isinstance(spans, _LazySpans) else list(spans)
+        if not any(isinstance(element, AbstractPartition) for element in templates):
+            self._spans = _LazySpans(like, boundaries, self._raw_names(), templates)
+            self._boundary_cache = boundaries
+            self._name_cache = None
+            self._version += 1
+            return
+
+        elements: list[SpanProtocol[T]] = []
+        for element, (start, end) in zip(self._spans, pairwise(boundaries)):
+            if isinstance(element, AbstractPartition):
+                old_length = element.boundaries[-1] - element.boundaries[0]
+                element.forward_affine_transform(
+                    scale_factor=(end - start) / old_length if old_length else 0.0,
+                    new_start=from_minutes(like, start),
+                    min_minutes=0,
+                )
+                elements.append(element)
+            else:
+                elements.append(
+                    with_bounds(element, from_minutes(like, start), from_minutes(like, end))
+                )
+        self._set_spans(elements)
+
+    def _raw_names(self) -> list[str | None]:
+        """Explicitly given names, without the generated fallbacks (or materializing spans)."""
+        if isinstance(self._spans, _LazySpans):
+            return self._spans.raw_names()
+        return [getattr(element, "_name", None) for element in self._spans]
+
+    def rollup(self, key: RollupKey) -> dict[str, float]:
+        """Total minutes per label, where `key` maps each innermost span to its labels.
+
+        Results are cached per partition and reused until this partition or one of its nested
+        partitions is edited, so only the changed part of a hierarchy is re-walked.
+        """
+        stamp = self._stamp()
+        cached = self._rollup_cache.get(key)
+        if cached is not None and cached[0] == stamp:
+            if instrumentation.STATE.enabled:
+                instrumentation.count("cache_hit:partition_rollup")
+            return cached[1]
+        if instrumentation.STATE.enabled:
+            instrumentation.count("cache_miss:partition_rollup")
+
+        totals: dict[str, float] = {}
+        for element in self._spans:
+            if isinstance(element, AbstractPartition):
+                for label, minutes in element.rollup(key).items():
+                    totals[label] = totals.get(label, 0.0) + minutes
+                continue
+            minutes = element.end.to_minutes() - element.start.to_minutes()
+            for label in key(element):
+                totals[label] = totals.get(label, 0.0) + minutes
+        self._rollup_cache[key] = (stamp, totals)
+        return totals
+
+    def _stamp(self) -> tuple:
+        # nested partitions are few compared to their spans, so this stays cheap
+        return (
+            self._version,
+            *(e._stamp() for e in self._spans if isinstance(e, AbstractPartition)),
+        )
 
-        return self
+    def persistent(self) -> PersistentPartition[T]:
+        """Return a structurally shared, immutable copy for cheap candidate edits."""
+        return PersistentPartition.from_spans(self._spans)
 
     def reordered(self, orderer: Callable[[SpanProtocol[T]], int | float | str | T]) -> Self:
         reordered = sorted(self.spans, key=orderer)
-        return self.__class__.from_partition(stack_forward(reordered))
+        return self._from_validated(stack_forward(reordered))
 
     # FROM TimePartition -------------------------------------------------
 
@@ -457,39 +728,76 @@ class AbstractPartition[T: TimeProtocol](PartitionProtocol, ABC):
     #     return max(self.ends)
     # --------------------------------------------------------------------------------------------
 
-    def iter_nested(self) -> Iterator[tuple[int, SpanProtocol[T]]]:
-        denested = []
-        for span in self._spans:
-            if isinstance(span, AbstractPartition):
-                denested.extend(list(span.iter_nested()))
-            else:
-                denested.append(span)
-        return iter(denested)
+    def iter_nested(
+        self,
+        max_depth: int | None = None,
+        window: SpanProtocol[T] | None = None,
+    ) -> Iterator[tuple[int, SpanProtocol[T]]]:
+        """Lazily walk the hierarchy in pre-order, yielding `(depth, element)` pairs.
+
+        Nested partitions are yielded before their own elements. The walk keeps an explicit stack
+        of iterators, so arbitrarily deep hierarchies never hit the recursion limit.
+
+        Args:
+            max_depth: deepest level to descend into; top-level elements have depth 0.
+            window: if given, elements (and whole subtrees) not intersecting it are skipped.
+        """
+        if window is None:
+            lower, upper = -math.inf, math.inf
+        else:
+            lower, upper = window.start.to_minutes(), window.end.to_minutes()
+
+        stack: list[tuple[int, Iterator[SpanProtocol[T]]]] = [(0, iter(self._spans))]
+        while stack:
+            depth, elements = stack[-1]
+            element = next(elements, None)
+            if element is None:
+                stack.pop()
+                continue
+            if element.start.to_minutes() >= upper:
+                # elements are sorted, so the rest of this level lies past the window as well
+                stack.pop()
+                continue
+            if element.end.to_minutes() <= lower:
+                continue
+            yield depth, element
+            if isinstance(element, AbstractPartition) and (max_depth is None or depth < max_depth):
+                stack.append((depth + 1, iter(element._spans)))
+
+    def iter_leaves(self, window: SpanProtocol[T] | None = None) -> Iterator[SpanProtocol[T]]:
+        """Lazily yield the innermost spans of the hierarchy in order."""
+        for _, element in self.iter_nested(window=window):
+            if not isinstance(element, AbstractPartition):
+                yield element
 
     def __str__(self) -> str:
         return "PLACEHOLDER"  # {self}"
 
     def __repr__(self) -> str:
-        # change _spans to spans later
-        return (
-            f"TimePartition(\n    "
-            f"{'\n    '.join(map(self.format_span, self.spans))}"
-            f"\n    {self.end} - <END>\n)"
-        )
-
-    def ALT__repr__(self):
-        for level, event in self.iter_nested():
-            indent = " " * level
-            print(f"{indent:<12} {event.start} — {event.name.title()}")
-
-        def format_span(span: SpanProtocol):
-            return f"{span.start} - {span.name}"
+        return "\n".join(self._iter_repr_lines())
+
+    def _iter_repr_lines(self, indent: int = 0) -> Iterator[str]:
+        step = 4
+        yield f"{' ' * indent}{self.__class__.__name__}("
+        open_partitions: list[tuple[int, AbstractPartition[T]]] = [(-1, self)]
+        for depth, element in self.iter_nested():
+            while open_partitions[-1][0] >= depth:
+                yield from self._close_repr(*open_partitions.pop(), indent, step)
+            prefix = " " * (indent + step * (depth + 1))
+            if isinstance(element, AbstractPartition):
+                yield f"{prefix}{element.__class__.__name__}("
+                open_partitions.append((depth, element))
+            else:
+                yield self.format_span(element, indent=len(prefix))
+        while open_partitions:
+            yield from self._close_repr(*open_partitions.pop(), indent, step)
 
-        return (
-            "TimePartition(\n    "
-            f"{'\n    '.join(map(format_span, self.spans))}"
-            f"\n    {self.end} - <END>\n)"
-        )
+    @staticmethod
+    def _close_repr(
+        depth: int, partition: AbstractPartition[T], indent: int, step: int
+    ) -> Iterator[str]:
+        yield f"{' ' * (indent + step * (depth + 2))}{partition.end} - <END>"
+        yield f"{' ' * (indent + step * (depth + 1))})"
 
     # def repr_indented(self, span: PartitionProtocol[T], indent: int) -> str:
     #     prefix = indent * " "
@@ -502,11 +810,108 @@ class AbstractPartition[T: TimeProtocol](PartitionProtocol, ABC):
         prefix = indent * " "
         if isinstance(span, SpanProtocol):
             return f"{prefix}{span.start} - {id(span)}"
+        elif isinstance(span, AbstractPartition):
+            return "\n".join(span._iter_repr_lines(indent))
         elif isinstance(span, PartitionProtocol):
             return repr(span).replace("\n", "\n" + prefix)
         raise ValueError
 
 
+class _LazySpans[T: TimeProtocol](MutableSequence[SpanProtocol[T]]):
+    """Span sequence backed by a boundary array, creating (and memoizing) spans on access.
+
+    Spans are copies of the matching `templates` (keeping their class and other attributes) where
+    given, and plain spans otherwise. Any mutation first materializes every span, after which it
+    behaves like a plain list.
+    """
+
+    __slots__ = ("_boundaries", "_items", "_like", "_names", "_span_class", "_templates")
+
+    def __init__(
+        self,
+        like: T,
+        boundaries: Sequence[float],
+        names: Sequence[str | None] | None,
+        templates: Sequence[SpanProtocol[T] | None] | None = None,
+    ) -> None:
+        self._like = like
+        self._boundaries = tuple(boundaries)
+        self._names = names
+        self._templates = templates
+        self._span_class = DateTimeSpan if isinstance(like, DateTime) else TimeSpan
+        self._items: list[SpanProtocol[T] | None] = [None] * max(0, len(boundaries) - 1)
+
+    def _make(self, index: int) -> SpanProtocol[T]:
+        span = self._items[index]
+        if span is None:
+            start = from_minutes(self._like, self._boundaries[index])
+            end = from_minutes(self._like, self._boundaries[index + 1])
+            template = self._templates[index] if self._templates is not None else None
+            if template is not None:
+                span = with_bounds(template, start, end)
+            else:
+                name = self._names[index] if self._names is not None else None
+                span = self._span_class(start=start, end=end, name=name)
+            self._items[index] = span
+        return span
+
+    def templates(self) -> list[SpanProtocol[T] | None]:
+        """The spans created so far, or what they would be copied from (without creating any)."""
+        if not self._boundaries:
+            return list(self._items)
+        templates = self._templates or [None] * len(self)
+        return [
+            item if item is not None else template for item, template in zip(self._items, templates)
+        ]
+
+    def raw_names(self) -> list[str | None]:
+        if self._boundaries:
+            return list(self._names) if self._names is not None else [None] * len(self)
+        return [getattr(span, "_name", None) for span in self._items]
+
+    def _force(self) -> list[SpanProtocol[T]]:
+        if self._boundaries:
+            if instrumentation.STATE.enabled:
+                instrumentation.count("materialize:partition")
+            for index in range(len(self._items)):
+                self._make(index)
+            self._boundaries = ()
+        return self._items  # type: ignore
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, index):  # type: ignore
+        if isinstance(index, slice):
+            return [self._make(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return self._make(index)
+
+    def __iter__(self) -> Iterator[SpanProtocol[T]]:
+        return map(self._make, range(len(self)))
+
+    def __setitem__(self, index, value) -> None:  # type: ignore
+        self._force()[index] = value
+
+    def __delitem__(self, index) -> None:  # type: ignore
+        del self._force()[index]
+
+    def insert(self, index: int, value: SpanProtocol[T]) -> None:
+        self._force().insert(index, value)
+
+
+def _check_within_day(like: TimeProtocol, boundaries: list[float]) -> None:
+    """Raise ValueError if `boundaries` (in minutes) of times like `like` fall outside the day,
+    where they would be clamped to its start or end."""
+    if boundaries and not isinstance(like, DateTime):
+        if boundaries[0] < 0 or boundaries[-1] > MINUTES_PER_DAY:
+            msg = f"Boundaries {boundaries[0]} - {boundaries[-1]} fall outside the day."
+            raise ValueError(msg)
+
+
 class AbstractBlock[T: TimeProtocol](AbstractSpan, ABC):
     def __init__(
         self,
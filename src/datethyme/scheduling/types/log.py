@@ -1 +1,23 @@
-class SchedulingLog: ...
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import NamedTuple
+
+from ...constants import AddResult
+from ...protocols import DateProtocol
+
+
+class LogRecord(NamedTuple):
+    name: str
+    date: DateProtocol | None  # None if the entry was not placed
+    result: AddResult
+
+
+@dataclass
+class SchedulingLog:
+    """Outcome of each placement attempt, in the order in which they were made."""
+
+    records: list[LogRecord] = field(default_factory=list)
+
+    def record(self, name: str, date: DateProtocol | None, result: AddResult) -> None:
+        self.records.append(LogRecord(name, date, result))
@@ -54,7 +54,7 @@ class DateTimePartition(AbstractPartition[DateTime]):
         if isinstance(span, DateTimeSpan):
             return f"{prefix}{span.start} - {id(span)}"
         elif isinstance(span, DateTimePartition):
-            return repr(DateTimePartition).replace("\n", "\n" + prefix)
+            return "\n".join(span._iter_repr_lines(indent))
         raise ValueError
 
 
@@ -101,7 +101,7 @@ class TimePartition(AbstractPartition[Time]):
         if isinstance(span, TimeSpan):
             return f"{prefix}{span.start} - {id(span)}"
         elif isinstance(span, TimePartition):
-            return repr(TimePartition).replace("\n", "\n" + prefix)
+            return "\n".join(span._iter_repr_lines(indent))
         raise ValueError
 
     @property
@@ -0,0 +1,297 @@
+"""
+Persistent (immutable, structurally shared) partitions.
+
+A `PersistentPartition` stores its spans as durations in an implicit treap, so that every edit
+copies only the O(log n) nodes on the path to the change and shares everything else with the
+previous version. Absolute boundaries are never stored: they follow from the start point and the
+running sum of durations, which is why resizing one span moves all later spans for free.
+"""
+
+from __future__ import annotations
+
+import random
+from collections.abc import Callable, Iterable, Iterator
+from typing import Self
+
+from ...core import DateTime, DateTimeSpan, TimeSpan
+from ...exceptions import TemporalLogicError
+from ...protocols import SpanProtocol, TimeProtocol
+from ..utils import explicit_name, from_minutes
+
+_random = random.Random(0)
+
+
+class _Node:
+    __slots__ = ("left", "minutes", "name", "priority", "right", "size", "total")
+
+    def __init__(
+        self,
+        name: str | None,
+        minutes: float,
+        priority: float,
+        left: _Node | None = None,
+        right: _Node | None = None,
+    ) -> None:
+        self.name = name
+        self.minutes = minutes
+        self.priority = priority
+        self.left = left
+        self.right = right
+        self.size = 1 + _size(left) + _size(right)
+        self.total = minutes + _total(left) + _total(right)
+
+    def with_children(self, left: _Node | None, right: _Node | None) -> _Node:
+        return _Node(self.name, self.minutes, self.priority, left, right)
+
+
+def _size(node: _Node | None) -> int:
+    return node.size if node else 0
+
+
+def _total(node: _Node | None) -> float:
+    return node.total if node else 0.0
+
+
+def _merge(a: _Node | None, b: _Node | None) -> _Node | None:
+    if a is None:
+        return b
+    if b is None:
+        return a
+    if a.priority > b.priority:
+        return a.with_children(a.left, _merge(a.right, b))
+    return b.with_children(_merge(a, b.left), b.right)
+
+
+def _split(node: _Node | None, index: int) -> tuple[_Node | None, _Node | None]:
+    """Split into the first `index` elements and the rest."""
+    if node is None:
+        return None, None
+    left_size = _size(node.left)
+    if index <= left_size:
+        a, b = _split(node.left, index)
+        return a, node.with_children(b, node.right)
+    a, b = _split(node.right, index - left_size - 1)
+    return node.with_children(node.left, a), b
+
+
+def _build(items: Iterable[tuple[str | None, float]]) -> _Node | None:
+    """Build a treap from an ordered sequence in linear time (Cartesian tree construction)."""
+    stack: list[tuple[str | None, float, float, _Node | None]] = []
+
+    def fold(entry: tuple[str | None, float, float, _Node | None], right: _Node | None) -> _Node:
+        name, minutes, priority, left = entry
+        return _Node(name, minutes, priority, left, right)
+
+    for name, minutes in items:
+        priority = _random.random()
+        left: _Node | None = None
+        while stack and stack[-1][2] < priority:
+            left = fold(stack.pop(), left)
+        stack.append((name, minutes, priority, left))
+
+    right: _Node | None = None
+    while stack:
+        right = fold(stack.pop(), right)
+    return right
+
+
+def _locate(node: _Node | None, minutes: float) -> tuple[int, float]:
+    """Return the index of the element containing offset `minutes` and that element's offset."""
+    index, offset = 0, 0.0
+    while node is not None:
+        left_total = _total(node.left)
+        if minutes < offset + left_total:
+            node = node.left
+        elif minutes < offset + left_total + node.minutes or node.right is None:
+            return index + _size(node.left), offset + left_total
+        else:
+            index += _size(node.left) + 1
+            offset += left_total + node.minutes
+            node = node.right
+    return index, offset
+
+
+def _iter_nodes(node: _Node | None) -> Iterator[_Node]:
+    stack: list[_Node] = []
+    while stack or node is not None:
+        while node is not None:
+            stack.append(node)
+            node = node.left
+        node = stack.pop()
+        yield node
+        node = node.right
+
+
+class PersistentPartition[T: TimeProtocol]:
+    """Immutable contiguous partition; every edit returns a new version in O(log n)."""
+
+    __slots__ = ("_root", "_span_class", "_start")
+
+    def __init__(
+        self,
+        start: T,
+        root: _Node | None = None,
+        span_class: Callable[..., SpanProtocol[T]] | None = None,
+    ) -> None:
+        self._start = start
+        self._root = root
+        self._span_class = span_class or (DateTimeSpan if isinstance(start, DateTime) else TimeSpan)
+
+    @classmethod
+    def from_spans(cls, spans: Iterable[SpanProtocol[T]]) -> Self:
+        spans = list(spans)
+        if not spans:
+            raise ValueError("Cannot build a partition from an empty sequence without a start.")
+        items = [(explicit_name(span), span.start.minutes_to(span.end)) for span in spans]
+        return cls(spans[0].start, _build(items))
+
+    @classmethod
+    def from_minutes(
+        cls,
+        start: T,
+        minute_durations: Iterable[int | float],
+        names: Iterable[str | None] | None = None,
+    ) -> Self:
+        durations = list(minute_durations)
+        names_ = list(names) if names is not None else [None] * len(durations)
+        if len(names_) != len(durations):
+            raise ValueError
+        return cls(start, _build(zip(names_, map(float, durations))))
+
+    def _derive(self, root: _Node | None, start: T | None = None) -> Self:
+        return self.__class__(self._start if start is None else start, root, self._span_class)
+
+    def _make_span(self, start: float, end: float, name: str | None) -> SpanProtocol[T]:
+        return self._span_class(
+            start=from_minutes(self._start, start),
+            end=from_minutes(self._start, end),
+            name=name,
+        )
+
+    def __len__(self) -> int:
+        return _size(self._root)
+
+    def __bool__(self) -> bool:
+        return self._root is not None
+
+    def __iter__(self) -> Iterator[SpanProtocol[T]]:
+        current = self._start.to_minutes()
+        for node in _iter_nodes(self._root):
+            yield self._make_span(current, current + node.minutes, node.name)
+            current += node.minutes
+
+    def __getitem__(self, index: int) -> SpanProtocol[T]:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError
+        node, offset = self._root, self._start.to_minutes()
+        while node is not None:
+            left_size = _size(node.left)
+            if index < left_size:
+                node = node.left
+            elif index == left_size:
+                offset += _total(node.left)
+                return self._make_span(offset, offset + node.minutes, node.name)
+            else:
+                offset += _total(node.left) + node.minutes
+                index -= left_size + 1
+                node = node.right
+        raise IndexError
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.start!s}-{self.end!s}, n={len(self)})"
+
+    @property
+    def spans(self) -> tuple[SpanProtocol[T], ...]:
+        return tuple(self)
+
+    @property
+    def names(self) -> tuple[str | None, ...]:
+        return tuple(node.name for node in _iter_nodes(self._root))
+
+    @property
+    def durations(self) -> tuple[float, ...]:
+        return tuple(node.minutes for node in _iter_nodes(self._root))
+
+    @property
+    def start(self) -> T:
+        return self._start
+
+    @property
+    def end(self) -> T:
+        return from_minutes(self._start, self._start.to_minutes() + self.minutes)
+
+    @property
+    def minutes(self) -> float:
+        return _total(self._root)
+
+    def index_from_time(self, point: T) -> int | None:
+        offset = self._start.minutes_to(point)
+        if not self._root or not 0 <= offset < self.minutes:
+            return None
+        return _locate(self._root, offset)[0]
+
+    def insert(self, index: int, minutes: int | float, name: str | None = None) -> Self:
+        """Insert a new span before position `index`, pushing later spans back."""
+        left, right = _split(self._root, index)
+        node = _Node(name, float(minutes), _random.random())
+        return self._derive(_merge(_merge(left, node), right))
+
+    def append(self, minutes: int | float, name: str | None = None) -> Self:
+        return self.insert(len(self), minutes, name)
+
+    def remove(self, index: int) -> Self:
+        """Remove the span at `index`, pulling later spans forward."""
+        left, rest = _split(self._root, index)
+        _, right = _split(rest, 1)
+        return self._derive(_merge(left, right))
+
+    def replace(
+        self, index: int, minutes: int | float | None = None, name: str | None = None
+    ) -> Self:
+        """Replace the duration and/or name of the span at `index`."""
+        left, rest = _split(self._root, index)
+        middle, right = _split(rest, 1)
+        if middle is None:
+            raise IndexError
+        node = _Node(
+            middle.name if name is None else name,
+            middle.minutes if minutes is None else float(minutes),
+            middle.priority,
+        )
+        return self._derive(_merge(_merge(left, node), right))
+
+    def resize(self, index: int, minutes: int | float) -> Self:
+        return self.replace(index, minutes=minutes)
+
+    def shift(self, new_start: T) -> Self:
+        """Move the whole partition rigidly; O(1) since only the anchor changes."""
+        return self._derive(self._root, new_start)
+
+    def concat(self, other: PersistentPartition[T]) -> Self:
+        """Append the spans of `other`; its own start point is ignored."""
+        return self._derive(_merge(self._root, other._root))
+
+    def split(self, cut_point: T) -> tuple[Self, Self]:
+        """Split at `cut_point`, cutting the span that contains it in two."""
+        offset = self._start.minutes_to(cut_point)
+        if not 0 <= offset <= self.minutes:
+            raise TemporalLogicError
+        if offset == self.minutes:
+            return self, self._derive(None, cut_point)
+
+        index, span_offset = _locate(self._root, offset)
+        left, rest = _split(self._root, index)
+        middle, right = _split(rest, 1)
+        assert middle is not None
+        if span_offset == offset:
+            return self._derive(left), self._derive(_merge(middle, right), cut_point)
+
+        head = _Node(middle.name, offset - span_offset, middle.priority)
+        tail = _Node(middle.name, middle.minutes - head.minutes, _random.random())
+        return self._derive(_merge(left, head)), self._derive(_merge(tail, right), cut_point)
+
+    def to_partition[P](self, cls: Callable[[list[SpanProtocol[T]]], P]) -> P:
+        """Materialize into a mutable partition class such as `TimePartition`."""
+        return cls(list(self))
@@ -1,17 +1,19 @@
 from __future__ import annotations
 
 import json
-from collections.abc import Iterable, Sequence
-from itertools import pairwise
+from collections.abc import Iterable, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from itertools import pairwise, starmap
 from pathlib import Path
 from typing import Literal, Self, overload
 
 from adiumentum.pydantic import BaseDict, BaseModelRW
-from pydantic import Field, model_validator
+from pydantic import Field, PrivateAttr, model_validator
 
+from ... import instrumentation
 from ..._abcs import TimeProtocol
 from ...constants import AddResult
-from ...core import Date, Time, TimeSpan
+from ...core import DAY_START, Date, Time, TimeSpan
 from ...exceptions import TemporalLogicError
 from ...protocols import (
     EntriesProtocol,
@@ -21,10 +23,22 @@ from ...protocols import (
     SpanProtocol,
     TimeBlockProtocol,
 )
-from ..utils import is_partitioned
+from ..allocation import (
+    GapIndex,
+    allocate,
+    allocate_gaps,
+    entry_contexts,
+    entry_window,
+    fit_result,
+    independent_groups,
+)
+from ..dependencies import DependencyGraph
+from ..utils import from_minutes, is_partitioned
+from ._abcs import RollupKey
 from .entries import Entries, SerializedEntries
 from .log import SchedulingLog
 from .new_abstract_block import AbstractBlock
+from .slots import Context, TimeSlotMixin
 
 DEFAULT_DATE = Date.parse("2000-01-01")
 
@@ -134,6 +148,16 @@ class DayPartition(BaseModelRW):
     flex: list[FlexBlock[Time]] = Field(default_factory=list)
     gaps: list[EmptyBlock[Time]] = Field(default_factory=list)
 
+    _block_cache: list[AbstractBlock[Time]] | None = PrivateAttr(default=None)
+    _name_cache: dict[str, int] | None = PrivateAttr(default=None)
+    _cache_key: tuple[int, ...] = PrivateAttr(default=())
+    _version: int = PrivateAttr(default=0)  # bumped by every method that changes the blocks
+    _rollup_cache: dict[RollupKey, dict[str, float]] = PrivateAttr(default_factory=dict)
+    _slots: list[TimeSlotMixin[Time]] = PrivateAttr(default_factory=list)
+    _placed: dict[str, EntryProtocol] = PrivateAttr(default_factory=dict)
+    _gap_index: GapIndex | None = PrivateAttr(default=None)
+    _gap_key: tuple[int, int] = PrivateAttr(default=(0, 0))
+
     @model_validator(mode="after")
     def infer_gaps(self) -> Self:
         """TODO: add fixed entries to entries lookup?"""
@@ -174,58 +198,287 @@ class DayPartition(BaseModelRW):
             raise TemporalLogicError
 
     def add_fixed(self, entry: EntryProtocol, earliest: Time, latest: Time) -> ResultTriple[Self]:
-        """Cases:
+        """Place `entry` as a fixed block starting at `earliest` and ending by `latest`.
+
+        The block lasts `ideal_time` minutes, or as long as the window allows if that is shorter
+        (but at least `min_time`). Flex blocks of allocated entries in the way are evicted; other
+        flex blocks and fixed blocks are conflicts.
+
+        Cases:
 
         - fits in gap
-            -> return (AddResult.ADDED,          [],                    self)
+            -> return (AddResult.ADDED,          self, [])
         - fits in gap with stretching or squeezing
-            -> return (AddResult.ADDED_MUTATED,  [],                    self)
-        - conflict with fixed
-            -> return (AddResult.NOT_ADDED,      [Entry],               self)
+            -> return (AddResult.ADDED_MODIFIED, self, [])
+        - conflict with fixed, window too short or no slot can receive it
+            -> return (AddResult.NOT_ADDED,      self, [entry])
         - displaces incumbent flex entries
-            -> return (AddResult.DISPLACE,       [<displaced entries>], Self)
+            -> return (AddResult.DISPLACED,      self, [<displaced entries>])
 
         """
-        success = AddResult.ADDED
-        popped: list[EntryProtocol] = []
-        return success, self, popped
+        start = earliest.to_minutes()
+        minutes = min(entry.ideal_time, latest.to_minutes() - start)
+        end = start + minutes
+        contexts = entry_contexts(entry)
+        if minutes < entry.min_time or not self.gap_index.can_receive(start, end, contexts):
+            return AddResult.NOT_ADDED, self, [entry]
+
+        in_the_way = [
+            block
+            for block in (*self.fixed, *self.flex)
+            if block.start.to_minutes() < end and start < block.end.to_minutes()
+        ]
+        if any(not self._is_displaceable(block) for block in in_the_way):
+            return AddResult.NOT_ADDED, self, [entry]
+
+        displaced = [self._evict(block) for block in in_the_way]
+        self._occupy(start, end)
+        self.fixed.append(
+            FixedBlock.model_construct(
+                start=earliest,
+                end=from_minutes(DAY_START, end),
+                name=entry.name,
+                contexts=contexts,
+                subentries=[],
+            )
+        )
+        self._touch()
+        if displaced:
+            return AddResult.DISPLACED, self, displaced
+        return fit_result(entry, minutes), self, []
 
-    def add_flex(self, entry: EntryProtocol) -> ResultTriple[Self]:
-        """Cases:
+    def add_flex(
+        self, entry: EntryProtocol, *, priorities: Mapping[str, float] | None = None
+    ) -> ResultTriple[Self]:
+        """Place `entry` at the start of the shortest gap that holds its `ideal_time`.
+
+        If no gap is that long, the entry is squeezed into the longest gap holding its `min_time`
+        and fills it. If no gap fits, the entry may displace a single flex entry of lower
+        priority: each candidate is tried alone, lowest priority first, and put back if its
+        freed span (joined with the gaps around it) is still too short. Entries named in
+        `priorities` rank by the priority given there instead of their own.
+
+        Cases:
 
         - fits in gap
-            -> return (AddResult.ADDED,          [],                    self)
+            -> return (AddResult.ADDED,          self, [])
         - fits in gap with stretching or squeezing
-            -> return (AddResult.ADDED_MUTATED,  [],                    self)
+            -> return (AddResult.ADDED_MODIFIED, self, [])
         - does not fit in any suitable gap
-            -> return (AddResult.NOT_ADDED,      [Entry],               self)
-        - displaces incumbent flex entries (via priority)
-            -> return (AddResult.DISPLACE,       [<displaced entries>], Self)
+            -> return (AddResult.NOT_ADDED,      self, [entry])
+        - displaces an incumbent flex entry (via priority)
+            -> return (AddResult.DISPLACED,      self, [<displaced entry>])
 
         """
-        result = AddResult.NOT_ADDED
-        popped: list[EntryProtocol] = []
-        return result, self, popped
+        contexts = entry_contexts(entry)
+        result = self._place_flex(entry, contexts)
+        if result is not None:
+            return result, self, []
+
+        def rank(other: EntryProtocol) -> float:
+            return (priorities or {}).get(other.name, other.priority)
+
+        candidates = sorted(
+            (rank(self._placed[block.name]), block.start.to_minutes(), i)
+            for i, block in enumerate(self.flex)
+            if self._is_displaceable(block) and rank(self._placed[block.name]) < rank(entry)
+        )
+        for block in [self.flex[i] for *_, i in candidates]:
+            incumbent = self._evict(block)
+            if self._place_flex(entry, contexts) is not None:
+                return AddResult.DISPLACED, self, [incumbent]
+            self._occupy(block.start.to_minutes(), block.end.to_minutes())
+            self.flex.append(block)
+            self._placed[incumbent.name] = incumbent
+            self._touch()
+        return AddResult.NOT_ADDED, self, [entry]
+
+    def add_flex_at(self, entry: EntryProtocol, start: Time, end: Time) -> ResultTriple[Self]:
+        """Place `entry` as a flex block at exactly [start, end].
+
+        Returns (AddResult.NOT_ADDED, self, [entry]) if the span is not free, is outside the
+        entry's `min_time` and `max_time`, or no slot can receive the entry.
+        """
+        begin, minutes = start.to_minutes(), start.minutes_to(end)
+        index = self.gap_index
+        if (
+            not entry.min_time <= minutes <= entry.max_time
+            or not index.is_free(begin, begin + minutes)
+            or not index.can_receive(begin, begin + minutes, entry_contexts(entry))
+        ):
+            return AddResult.NOT_ADDED, self, [entry]
+        return self._insert_flex(entry, begin, minutes), self, []
+
+    def remove_flex(self, name: str) -> EntryProtocol | None:
+        """Remove the flex block of the entry named `name` placed by `add_flex` (or
+        `add_flex_at`), returning the entry, or None if there is no such block."""
+        block = next((block for block in self.flex if block.name == name), None)
+        if block is None or not self._is_displaceable(block):
+            return None
+        return self._evict(block)
+
+    @property
+    def gap_index(self) -> GapIndex:
+        """Index over `gaps` and the slots, rebuilt if `gaps` was changed from outside."""
+        key = (id(self.gaps), len(self.gaps))
+        if self._gap_index is None or self._gap_key != key:
+            intervals = ((gap.start.to_minutes(), gap.end.to_minutes()) for gap in self.gaps)
+            self._gap_index = GapIndex(intervals, self._slots)
+            self._gap_key = key
+        return self._gap_index
+
+    def set_slots(self, slots: Iterable[TimeSlotMixin[Time]]) -> Self:
+        """Allow flex entries only in parts of the gaps covered by a slot that can receive them."""
+        self._slots = list(slots)
+        self._gap_index = None
+        return self
+
+    @property
+    def slots(self) -> list[TimeSlotMixin[Time]]:
+        return self._slots
+
+    @property
+    def placed(self) -> dict[str, EntryProtocol]:
+        """Entries allocated by `add_flex`, by name."""
+        return self._placed
+
+    def _place_flex(self, entry: EntryProtocol, contexts: set[Context]) -> AddResult | None:
+        found = self.gap_index.fit(entry, contexts)
+        return None if found is None else self._insert_flex(entry, *found)
+
+    def _insert_flex(self, entry: EntryProtocol, start: float, minutes: float) -> AddResult:
+        self._occupy(start, start + minutes)
+        self.flex.append(
+            FlexBlock.model_construct(
+                start=from_minutes(DAY_START, start),
+                end=from_minutes(DAY_START, start + minutes),
+                name=entry.name,
+                subentries=[],
+            )
+        )
+        self._placed[entry.name] = entry
+        self._touch()
+        return fit_result(entry, minutes)
+
+    def _is_displaceable(self, block: AbstractBlock[Time]) -> bool:
+        return isinstance(block, FlexBlock) and block.name in self._placed
+
+    def _evict(self, block: FlexBlock[Time]) -> EntryProtocol:
+        position = next(i for i, other in enumerate(self.flex) if other is block)
+        del self.flex[position]
+        self._release(block.start.to_minutes(), block.end.to_minutes())
+        self._touch()
+        return self._placed.pop(block.name)  # type: ignore[arg-type]
+
+    def _occupy(self, start: float, end: float) -> None:
+        position, parts = self.gap_index.occupy(start, end)
+        self.gaps[position : position + 1] = list(starmap(self._gap, parts))
+        self._gap_key = (id(self.gaps), len(self.gaps))
+        self._touch()
+
+    def _release(self, start: float, end: float) -> None:
+        lo, hi, merged = self.gap_index.release(start, end)
+        self.gaps[lo:hi] = [self._gap(*merged)]
+        self._gap_key = (id(self.gaps), len(self.gaps))
+        self._touch()
+
+    @staticmethod
+    def _gap(start: float, end: float) -> EmptyBlock[Time]:
+        # the bounds are valid by construction, and validating them costs more than the allocation
+        return EmptyBlock.model_construct(
+            start=from_minutes(DAY_START, start), end=from_minutes(DAY_START, end), subentries=[]
+        )
 
     def assert_validity(self) -> None: ...
 
     @property
     def _blocks(self) -> list[EmptyBlock[Time] | FlexBlock[Time] | FixedBlock[Time]]:
-        all_blocks: Sequence[FixedBlock[Time] | FlexBlock[Time] | EmptyBlock[Time]] = (
-            self.fixed + self.flex + self.gaps
+        """All blocks sorted by start, cached until `fixed`, `flex` or `gaps` change."""
+        if self._block_cache is None or self._cache_key != self._current_cache_key():
+            if instrumentation.STATE.enabled:
+                instrumentation.count("cache_miss:day_blocks")
+            all_blocks: Sequence[FixedBlock[Time] | FlexBlock[Time] | EmptyBlock[Time]] = (
+                self.fixed + self.flex + self.gaps
+            )
+            self._block_cache = sorted(all_blocks, key=lambda x: (x.start, x.end))
+            self._name_cache = None
+            self._rollup_cache.clear()
+            self._cache_key = self._current_cache_key()
+        elif instrumentation.STATE.enabled:
+            instrumentation.count("cache_hit:day_blocks")
+        return self._block_cache
+
+    @property
+    def name_index(self) -> dict[str, int]:
+        """Map from block name to the position of its first occurrence in `blocks`."""
+        blocks = self._blocks
+        if self._name_cache is None:
+            index: dict[str, int] = {}
+            for i, block in enumerate(blocks):
+                if block.name is not None:
+                    index.setdefault(block.name, i)
+            self._name_cache = index
+        return self._name_cache
+
+    def invalidate_cache(self) -> None:
+        """Drop cached lookups; needed only after editing `fixed`, `flex` or `gaps` directly
+        in a way that keeps each list and its length (e.g. replacing a block in place)."""
+        self._touch()
+        self._block_cache = None
+        self._name_cache = None
+        self._rollup_cache.clear()
+
+    def _touch(self) -> None:
+        self._version += 1
+
+    def _current_cache_key(self) -> tuple[int, ...]:
+        # the methods changing the blocks bump the version; the lists' ids and lengths catch
+        # appends, removals and reassignments made directly on the fields
+        return (
+            self._version,
+            id(self.fixed),
+            len(self.fixed),
+            id(self.flex),
+            len(self.flex),
+            id(self.gaps),
+            len(self.gaps),
         )
-        return sorted(all_blocks, key=lambda x: (x.start, x.end))
 
     @property
     def blocks(self) -> list[EmptyBlock[Time] | FlexBlock[Time] | FixedBlock[Time]]:
         self.assert_validity()
         return self._blocks
 
+    @property
+    def busy(self) -> list[FlexBlock[Time] | FixedBlock[Time]]:
+        """All occupied (fixed or flex) blocks, sorted by start."""
+        occupied: Sequence[FixedBlock[Time] | FlexBlock[Time]] = self.fixed + self.flex
+        return sorted(occupied, key=lambda x: (x.start, x.end))
+
+    def rollup(self, key: RollupKey) -> dict[str, float]:
+        """Total busy minutes per label, where `key` maps each fixed or flex block to its labels.
+
+        Cached until the blocks change (see `invalidate_cache` for in-place edits).
+        """
+        self._blocks
+        totals = self._rollup_cache.get(key)
+        if instrumentation.STATE.enabled:
+            instrumentation.count(f"cache_{'miss' if totals is None else 'hit'}:day_rollup")
+        if totals is None:
+            totals = {}
+            for block in self.busy:
+                minutes = block.end.to_minutes() - block.start.to_minutes()
+                for label in key(block):
+                    totals[label] = totals.get(label, 0.0) + minutes
+            self._rollup_cache[key] = totals
+        return totals
+
     def __contains__(self, obj: object) -> bool:
         if type(obj) is type(self.start):
             return self.start <= obj <= self.end
         if isinstance(obj, str):
-            return any(block.name == obj for block in self.blocks)
+            self.assert_validity()
+            return obj in self.name_index
         raise TypeError
 
     @classmethod
@@ -259,10 +512,11 @@ class DayPartition(BaseModelRW):
     def __getitem__(self, idx: TimeSpan) -> list[TimeBlockProtocol]: ...  # by time span
     def __getitem__(self, idx) -> TimeBlockProtocol | list[TimeBlockProtocol] | None:  # type: ignore
         if isinstance(idx, str):
-            for block in self.blocks:
-                if block.name == idx:
-                    return block
-            raise IndexError
+            self.assert_validity()
+            position = self.name_index.get(idx)
+            if position is None:
+                raise IndexError
+            return self._blocks[position]
         raise ValueError
 
     @staticmethod
@@ -368,6 +622,7 @@ class Calendar(BaseDict[Date, CalendarDay]):
     def ensure_validation(cls, value: dict[str, object]) -> dict[Date, CalendarDay]:
         return {Date.model_validate(k): CalendarDay.model_validate(v) for k, v in value.items()}
 
+    @instrumentation.timed("Calendar.create_schedule")
     def create_schedule(
         self,
         *,
@@ -375,11 +630,14 @@ class Calendar(BaseDict[Date, CalendarDay]):
         routines: Routines,
         entries: EntriesProtocol,
         context_hierarchy: ContextHierarchy,
+        max_workers: int | None = None,
     ) -> tuple[
         Calendar,
         Entries,
         list[SchedulingLog],
     ]:
+        """Allocate routines, recurring items and then `entries`; with `max_workers`, the entries
+        are allocated in a process pool (see `allocate_entries`)."""
         logs: list[SchedulingLog] = []
 
         routines_logs = self.allocate_routines(routines)
@@ -392,6 +650,7 @@ class Calendar(BaseDict[Date, CalendarDay]):
         remaining, log = self.allocate_entries(
             entries,
             context_hierarchy=context_hierarchy,
+            max_workers=max_workers,
         )
         logs.append(log)
 
@@ -401,14 +660,148 @@ class Calendar(BaseDict[Date, CalendarDay]):
         log = SchedulingLog()
         return log
 
+    @instrumentation.timed("Calendar.allocate_entries")
     def allocate_entries(
         self,
         entries: EntriesProtocol | Iterable[EntryProtocol],
         *,
         context_hierarchy: ContextHierarchy,
+        slots: Iterable[TimeSlotMixin[Time]] | None = None,
+        max_workers: int | None = None,
+        block_days: int = 7,
+    ) -> tuple[Entries, SchedulingLog]:
+        """Place `entries` as flex blocks in the gaps of the calendar's days.
+
+        Entries are taken in `entry_order` (priority, due date, earliest date). Each one goes to
+        the first day between its `earliest_date` and `due_date` whose gaps can hold its
+        `min_time` in a slot receiving its contexts (see `DayPartition.add_flex`). If there is
+        none, it displaces a lower-priority entry on the first day of its window where that makes
+        room; displaced entries go back into the queue.
+
+        An entry goes to a later day than the entries named in its `dependencies` (those among
+        `entries`), and is not placed if one of them is not. A prerequisite is taken with the
+        priority of its most urgent dependent; if it is displaced, its placed dependents are
+        removed and queued again behind it.
+
+        Args:
+            entries: the entries to place, as a mapping by name or an iterable.
+            context_hierarchy: not used yet.
+            slots: daily context slots, replacing those set on each day with `set_slots`.
+            max_workers: if given, split the days into groups that no entry's date window crosses
+                and allocate each group in a process pool; the entries must be picklable. The
+                placements are the same as without a pool (unless entries placed by an earlier
+                run are displaced), but the log lists the groups in date order. Entries with
+                dependencies among `entries` are allocated without a pool.
+            block_days: minimum number of days per process-pool task.
+
+        Returns:
+            the entries that could not be placed, and one log record per placement attempt
+
+        Raises:
+            TemporalLogicError: if the dependencies of `entries` have a cycle.
+        """
+        entries = list(entries.values() if isinstance(entries, Mapping) else entries)
+        graph = DependencyGraph(entries)
+        if slots is not None:
+            slots = list(slots)
+            for day in self.values():
+                day.schedule.set_slots(slots)
+        if max_workers is not None and not graph.edges:
+            return self._allocate_parallel(entries, context_hierarchy, max_workers, block_days)
+
+        dates = sorted(self.keys())
+        days = [self[date].schedule for date in dates]
+
+        # prerequisites rank with their most urgent dependent, so that no less urgent entry
+        # displaces them (and their dependents with them)
+        priorities = (
+            dict(zip(graph.names, graph.inherited([e.priority for e in entries]), strict=True))
+            if graph.edges
+            else None
+        )
+
+        def place(position: int, entry: EntryProtocol) -> tuple[AddResult, float, list]:
+            result, day, displaced = days[position].add_flex(entry, priorities=priorities)
+            return result, day.gap_index.largest(), displaced
+
+        def unplace(position: int, entry: EntryProtocol) -> float:
+            days[position].remove_flex(entry.name)
+            self[dates[position]].entries.pop(entry.name, None)
+            return days[position].gap_index.largest()
+
+        remaining = Entries()
+        log = SchedulingLog()
+        largest = [day.gap_index.largest() for day in days]
+        outcomes = allocate(
+            entries,
+            dates,
+            largest,
+            place,
+            graph=graph if graph.edges else None,
+            unplace=unplace,
+            displace=True,
+        )
+        for entry, position, result, displaced in outcomes:
+            if position is None:
+                remaining[entry.name] = entry
+                log.record(entry.name, None, result)
+                continue
+            placed = self[dates[position]].entries
+            placed[entry.name] = entry
+            for incumbent in displaced:
+                placed.pop(incumbent.name, None)
+            log.record(entry.name, dates[position], result)
+        return remaining, log
+
+    def _allocate_parallel(
+        self,
+        entries: list[EntryProtocol],
+        context_hierarchy: ContextHierarchy,
+        max_workers: int,
+        block_days: int,
     ) -> tuple[Entries, SchedulingLog]:
-        remaining = Entries([])
+        dates = sorted(self.keys())
+        windows = [entry_window(dates, entry) for entry in entries]
+        groups = independent_groups(windows, block_days)
+        if len(groups) < 2:
+            return self.allocate_entries(entries, context_hierarchy=context_hierarchy)
+
+        by_name = {entry.name: entry for entry in entries}
+        remaining = Entries()
         log = SchedulingLog()
+        for entry, (first, last) in zip(entries, windows, strict=True):
+            if first > last:
+                remaining[entry.name] = entry
+                log.record(entry.name, None, AddResult.NOT_ADDED)
+        tasks = [
+            (
+                dates[first : last + 1],
+                [
+                    (self[date].schedule.gap_index.gaps, self[date].schedule.slots)
+                    for date in dates[first : last + 1]
+                ],
+                [entries[i] for i in members],
+            )
+            for first, last, members in groups
+        ]
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            # map yields in task order, so the merge does not depend on which worker finishes first
+            outcomes = pool.map(allocate_gaps, tasks)
+            for (first, _, _), group_outcomes in zip(groups, outcomes, strict=True):
+                for name, position, result, start, minutes in group_outcomes:
+                    entry = by_name[name]
+                    if position is None:
+                        remaining[name] = entry
+                        log.record(name, None, result)
+                        continue
+                    date = dates[first + position]
+                    self[date].schedule.add_flex_at(
+                        entry,
+                        from_minutes(DAY_START, start),
+                        from_minutes(DAY_START, start + minutes),
+                    )
+                    self[date].entries[name] = entry
+                    log.record(name, date, result)
         return remaining, log
 
     def allocate_recurring(self, recurring: Recurring) -> SchedulingLog:
@@ -30,6 +30,7 @@ class TimeSlotMixin[T: TimeProtocol]:
     ) -> None:
         self._start = start
         self._end = end
+        self._name: str | None = None
         self._require_all: ReceivingSet = require_all or set()
         self._require_any: ReceivingSet = require_any or set()
         self._require_none: ReceivingSet = require_none or set()
@@ -66,9 +67,9 @@ class TimeSlotMixin[T: TimeProtocol]:
                 "not as an entry context."
             )
             raise ValueError(msg)
-        all_condition = self._require_all.issubset(context)
-        any_condition = bool((not self._require_any) or self._require_any.intersection(context))
-        none_condition = not self._require_none.intersection(context)
+        all_condition = self._require_all.issubset(contexts)
+        any_condition = bool((not self._require_any) or self._require_any.intersection(contexts))
+        none_condition = not self._require_none.intersection(contexts)
         return all_condition and any_condition and none_condition
 
     def add_requirement(self, type_: Literal["all", "any", "none"], context: Context) -> Self:
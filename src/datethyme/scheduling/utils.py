@@ -1,7 +1,11 @@
 from collections.abc import Iterable
 from itertools import pairwise
 
-from ..protocols import DurationProtocol
+from ..constants import Unit
+from ..core import Date, DateTime, Time
+from ..protocols import DurationProtocol, SpanProtocol, TimeProtocol
+
+MINUTES_PER_DAY = Unit.DAY.minutes
 
 
 def is_partitioned(spans: Iterable[DurationProtocol]) -> bool:
@@ -10,3 +14,39 @@ def is_partitioned(spans: Iterable[DurationProtocol]) -> bool:
         if not first.end == second.start:
             return False
     return True
+
+
+def explicit_name(span: SpanProtocol) -> str | None:
+    """The name given to `span`, not the one spans make up from their bounds when unnamed."""
+    try:
+        return span._name  # type: ignore[attr-defined]
+    except AttributeError:
+        return getattr(span, "name", None)
+
+
+def to_minutes(point: TimeProtocol) -> float:
+    """Map a point in time to a plain number of minutes, suitable for arithmetic and sorting."""
+    return point.to_minutes()
+
+
+def from_minutes[T: TimeProtocol](like: T, minutes: float) -> T:
+    """Inverse of `to_minutes`, returning a point of the same type as `like`.
+
+    Unlike `Time.from_minutes`, the end of the day is preserved as 24:00 rather than wrapping.
+    """
+    if isinstance(like, DateTime):
+        return datetime_from_minutes(minutes)  # type: ignore
+    if isinstance(like, Time):
+        if minutes >= MINUTES_PER_DAY:
+            return Time(hour=24)  # type: ignore
+        return Time.from_minutes(max(0.0, minutes))  # type: ignore
+    raise TypeError(f"Unsupported point type: {like.__class__.__name__}")
+
+
+def date_to_minutes(date: Date) -> float:
+    return date.ordinal * MINUTES_PER_DAY
+
+
+def datetime_from_minutes(minutes: float) -> DateTime:
+    days, rest = divmod(minutes, MINUTES_PER_DAY)
+    return DateTime.from_pair(Date.from_ordinal(int(days)), Time.from_minutes(rest))
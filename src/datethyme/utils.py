@@ -43,6 +43,20 @@ def transfer_case(reference: str, candidate: str) -> str:
 DATE_REGEX: re.Pattern = re.compile(r"^([12]\d\d\d)-(0?\d|1[012])-(0?\d|[12]\d|3[01])$")
 DATE_REGEX_STRICT: re.Pattern = re.compile(r"^([12]\d\d\d)-(0\d|1[012]|)-(0\d|[12]\d|3[01])$")
 DATE_TIME_REGEX: re.Pattern = re.compile(r"^([12]\d\d\d-\d\d?-\d\d?)[^0-9]{1,4}([0-9:\.]+)$")
+MAX_DAYS = {
+    1: 31,
+    2: 29,
+    3: 31,
+    4: 30,
+    5: 31,
+    6: 30,
+    7: 31,
+    8: 31,
+    9: 31,
+    10: 31,
+    11: 30,
+    12: 31,
+}
 
 WeekdayLiteral = Literal[
     "mon",
@@ -58,20 +72,6 @@ WeekdayLiteral = Literal[
 # @deal.has()
 # @deal.raises(DateValidationError)
 def validate_date(raw_date: str | dict | list | tuple) -> dict[str, int | float]:
-    MAX_DAYS = {
-        1: 31,
-        2: 29,
-        3: 31,
-        4: 30,
-        5: 31,
-        6: 30,
-        7: 31,
-        8: 31,
-        9: 31,
-        10: 31,
-        11: 30,
-        12: 31,
-    }
     outdict: dict[str, int | float] = {}
     if isinstance(raw_date, dict):
         outdict = raw_date
@@ -0,0 +1,52 @@
+import subprocess
+import sys
+
+import pytest
+
+import datethyme
+from datethyme import scheduling
+
+
+def run_fresh(code: str) -> str:
+    """Run `code` in a new interpreter, so that nothing is imported yet."""
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return result.stdout.strip()
+
+
+@pytest.mark.parametrize(
+    ("statement", "not_loaded"),
+    [
+        (
+            "import datethyme",
+            ["datethyme.extra", "datethyme.scheduling", "datethyme.instrumentation", "adiumentum"],
+        ),
+        ("import datethyme.scheduling", ["datethyme.scheduling.types", "adiumentum"]),
+        ("from datethyme.scheduling import algorithms", ["datethyme.scheduling.types"]),
+        ("from datethyme.scheduling.types import TimePartition", ["adiumentum"]),
+    ],
+)
+def test_heavy_modules_load_lazily(statement, not_loaded):
+    loaded = run_fresh(f"import sys\n{statement}\nprint(sorted(sys.modules))")
+    for module in not_loaded:
+        assert repr(module) not in loaded
+
+
+def test_validators_are_built_on_first_use():
+    code = (
+        "import datethyme as dt\n"
+        "print(dt.Time.__pydantic_complete__)\n"
+        "dt.Time(hour=9)\n"
+        "print(dt.Time.__pydantic_complete__)"
+    )
+    assert run_fresh(code).split() == ["False", "True"]
+
+
+def test_lazy_names_resolve():
+    assert datethyme.HourRange.__module__ == "datethyme.extra"
+    assert scheduling.Calendar.__module__ == "datethyme.scheduling.types.schedules"
+    assert scheduling.algorithms.__name__ == "datethyme.scheduling.algorithms"
+    assert {"HourRange", "scheduling"} <= set(dir(datethyme))
+    with pytest.raises(AttributeError, match="no_such_name"):
+        _ = datethyme.no_such_name
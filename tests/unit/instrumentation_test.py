@@ -0,0 +1,86 @@
+import threading
+
+import pytest
+
+from datethyme import Date, DateRange, Time, TimeSpan, instrumentation
+from datethyme.scheduling import TimePartition, algorithms
+
+
+@pytest.fixture
+def enabled():
+    instrumentation.reset()
+    instrumentation.enable()
+    yield
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+def test_disabled_by_default():
+    assert not instrumentation.is_enabled()
+    instrumentation.reset()
+    Time(hour=9)
+    assert instrumentation.snapshot().counters == {}
+
+
+def test_counts_construction_parsing_and_validation(enabled):
+    Time(hour=9)
+    Date.parse("2026-05-11")
+    counters = instrumentation.snapshot().counters
+    assert counters["construct:Time"] == 1
+    assert counters["parse:Date"] == 1
+    assert counters["validate:Time"] == 1
+    assert counters["validate:Date"] >= 1
+
+
+def test_counts_range_iteration(enabled):
+    start = Date.parse("2026-01-01")
+    list(DateRange(start, start + 3))
+    assert instrumentation.snapshot().counters["iterate:DateRange"] == 1
+
+
+def test_counts_partition_rebuilds_and_cache_hits(enabled):
+    partition = TimePartition.from_minutes(minute_durations=[30, 30], start=Time(hour=8))
+
+    def key(span):
+        return ("all",)
+
+    partition.rollup(key)
+    partition.rollup(key)
+    partition.insert(0, TimeSpan(Time(hour=7, minute=30), Time(hour=8)))
+    counters = instrumentation.snapshot().counters
+    assert counters["cache_miss:partition_rollup"] == 1
+    assert counters["cache_hit:partition_rollup"] == 1
+    assert counters["materialize:partition"] == 1
+
+
+def test_times_entry_points(enabled):
+    spans = [TimeSpan(Time(hour=8), Time(hour=9)), TimeSpan(Time(hour=10), Time(hour=11))]
+    algorithms.stack(spans, "FORWARD")
+    algorithms.stack(spans, "FORWARD")
+    stats = instrumentation.snapshot().timers["algorithms.stack"]
+    assert stats.calls == 2
+    assert stats.seconds > 0
+
+
+def test_disable_restores_originals(enabled):
+    init, parse = Time.__init__, Time.__dict__["parse"]
+    instrumentation.disable()
+    assert Time.__init__ is not init
+    assert Time.__dict__["parse"] is not parse
+    instrumentation.reset()
+    Time.parse("09:00")
+    assert instrumentation.snapshot().counters == {}
+
+
+def test_recording_is_per_context(enabled):
+    def other_request():
+        for _ in range(5):
+            Time(hour=1)
+
+    with instrumentation.recording() as request:
+        Time(hour=9)
+        thread = threading.Thread(target=other_request)
+        thread.start()
+        thread.join()
+    assert request.snapshot().counters == {"construct:Time": 1, "validate:Time": 1}
+    assert instrumentation.snapshot().counters["construct:Time"] == 6
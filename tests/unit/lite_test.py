@@ -0,0 +1,159 @@
+import pickle
+
+import pytest
+from pydantic import BaseModel
+
+from datethyme import Date, DateTime, Time, TimeSpan, lite
+from datethyme.constants import Unit
+from datethyme.exceptions import DateValidationError, TimeValidationError
+
+
+class Meeting(BaseModel):
+    day: lite.Date
+    start: lite.Time
+    end: lite.DateTime | None = None
+
+
+@pytest.mark.parametrize(
+    "model, raw",
+    [
+        (Date, "2026-05-11"),
+        (Time, "09:30"),
+        (Time, "09:30:15.5"),
+        (Time, "24:00"),
+        (DateTime, "2026-05-11 09:30"),
+        (DateTime, "2026-05-11_23:59:59.5"),
+    ],
+)
+def test_same_string_form(model, raw):
+    lite_type = getattr(lite, model.__name__)
+    assert str(lite_type.parse(raw)) == str(model.parse(raw))
+    assert repr(lite_type.parse(raw)) == repr(model.parse(raw))
+
+
+def test_same_arithmetic():
+    time, core_time = lite.Time(hour=9, minute=30), Time(hour=9, minute=30)
+    assert str(time + 45) == str(core_time + 45)
+    assert str(time.round_minutes(15)) == str(core_time.round_minutes(15))
+    assert time.minutes_to_next(lite.Time(hour=8)) == core_time.minutes_to_next(Time(hour=8))
+    date, core_date = lite.Date(2026, 5, 11), Date.parse("2026-05-11")
+    assert date.prose == core_date.prose
+    assert [str(d) for d in date.range(date + 3)] == [str(d) for d in core_date.range(3)]
+    assert str(date.datetime) == str(core_date.datetime)
+
+
+def test_methods_return_lite_types():
+    time = lite.Time(hour=9)
+    assert type(time + 30) is lite.Time
+    assert type(time >> lite.Time(hour=10)) is lite.TimeSpan
+    assert type(time & lite.Date(2026, 5, 11)) is lite.DateTime
+    assert type(lite.Date(2026, 5, 11).span) is lite.DateTimeSpan
+
+
+def test_equal_to_core_counterparts():
+    pairs = [
+        (lite.Date(2026, 5, 11), Date.parse("2026-05-11")),
+        (lite.Time(hour=9, minute=30), Time(hour=9, minute=30)),
+        (lite.DateTime(2026, 5, 11, 9, 30), DateTime.parse("2026-05-11 09:30")),
+        (
+            lite.TimeSpan(lite.Time(hour=9), lite.Time(hour=10)),
+            TimeSpan(Time(hour=9), Time(hour=10)),
+        ),
+    ]
+    for value, model in pairs:
+        assert value == model
+        assert model == value
+        assert hash(value) == hash(model)
+    assert lite.Time(hour=9) < Time(hour=10)
+
+
+def test_other_attributes_from_core():
+    span = lite.TimeSpan(lite.Time(hour=9), lite.Time(hour=11), name="a")
+    first, second = span.split(Time(hour=10))
+    assert (type(first), type(second.start)) == (lite.TimeSpan, lite.Time)
+    assert str(span.midpoint()) == "10:00"
+    assert lite.Time(hour=10) in span
+    assert type(lite.Date.today()) is lite.Date
+    with pytest.raises(AttributeError):
+        lite.Time(hour=9).missing
+
+
+def test_validation():
+    with pytest.raises(TimeValidationError):
+        lite.Time(hour=25)
+    with pytest.raises(TimeValidationError):
+        lite.Time.parse("12:60")
+    with pytest.raises(DateValidationError):
+        lite.Date(2026, 2, 30)
+    assert lite.Date.if_valid("2026-13-01") is None
+    assert lite.Time.model_validate([8, 30]) == lite.Time(hour=8, minute=30)
+
+
+def test_immutable_and_slotted():
+    time = lite.Time(hour=9)
+    span = lite.TimeSpan(time, lite.Time(hour=10), name="a")
+    with pytest.raises(AttributeError):
+        time.hour = 10
+    with pytest.raises(AttributeError):
+        span._start = time
+    assert not hasattr(time, "__dict__")
+    assert not hasattr(span, "__dict__")
+
+
+def test_span_methods_return_new_spans():
+    span = lite.TimeSpan(lite.Time(hour=9), lite.Time(hour=10), name="a")
+    longer = span.with_end(lite.Time(hour=11))
+    moved = span.forward_affine_transform(scale_factor=0.5, new_start=lite.Time(hour=12))
+    assert (longer.minutes, longer.name) == (120, "a")
+    assert (str(moved.start), str(moved.end)) == ("12:00", "12:30")
+    assert span.minutes == 60
+    assert span == lite.TimeSpan(lite.Time(hour=9), lite.Time(hour=10))
+
+
+def test_ranges():
+    start = lite.Date(2026, 1, 1)
+    assert [str(d) for d in lite.DateRange(start, start + 3)] == [
+        "2026-01-01",
+        "2026-01-02",
+        "2026-01-03",
+    ]
+    hours = lite.TimeRange(lite.Time(hour=8), lite.Time(hour=11), unit=Unit.HOUR)
+    assert [str(t) for t in hours] == ["08:00", "09:00", "10:00"]
+    assert [str(t) for t in hours.with_end()] == ["08:00", "09:00", "10:00", "11:00"]
+    assert list(hours) == list(hours)
+    late = lite.DateTimeRange(
+        lite.DateTime(2026, 1, 1, 23), lite.DateTime(2026, 1, 2, 1), unit=Unit.HOUR
+    )
+    assert [str(t) for t in late] == ["2026-01-01_23:00", "2026-01-02_00:00"]
+
+
+def test_pickle():
+    values = [
+        lite.DateTime(2026, 5, 11, 9, 30),
+        lite.TimeSpan(lite.Time(hour=9), lite.Time(hour=10), name="a"),
+        lite.TimeRange(lite.Time(hour=8), lite.Time(hour=11), unit=Unit.HOUR, step=2),
+    ]
+    for value in values:
+        assert pickle.loads(pickle.dumps(value)) == value
+
+
+def test_conversion_round_trip():
+    span = TimeSpan(Time(hour=9), Time(hour=10, minute=15), name="a")
+    converted = lite.from_model(span)
+    assert type(converted) is lite.TimeSpan
+    assert type(converted.start) is lite.Time
+    assert converted.name == "a"
+    back = lite.to_model(converted)
+    assert type(back.start) is Time
+    assert back == span
+    with pytest.raises(TypeError):
+        lite.from_model("09:00")
+
+
+def test_pydantic_fields():
+    meeting = Meeting.model_validate({"day": "2026-05-11", "start": Time(hour=9)})
+    assert type(meeting.start) is lite.Time
+    assert meeting.model_dump() == {"day": "2026-05-11", "start": "09:00", "end": None}
+    assert Meeting.model_validate_json(meeting.model_dump_json()) == meeting
+    with pytest.raises(TimeValidationError):
+        Meeting.model_validate({"day": "2026-05-11", "start": "25:00"})
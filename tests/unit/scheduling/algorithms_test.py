@@ -1,3 +1,6 @@
+from functools import partial
+from itertools import count, islice
+
 import pytest
 
 from datethyme import DateTime, DateTimeSpan, Time, TimeSpan
@@ -5,11 +8,21 @@ from datethyme.protocols import TimeProtocol
 from datethyme.scheduling.algorithms import (
     SpanIterable,
     apply_pairwise,
+    coalesce,
+    compose,
     earliest_start,
+    eclipse_backward,
+    eclipse_by_priority,
     get_relative_lengths,
     get_total_length,
+    iter_eclipse_forward,
+    iter_pairwise,
+    iter_resolve_gaps,
+    iter_resolve_overlaps,
+    iter_truncate,
     latest_end,
     most_central,
+    resolve_overlaps_global,
     snap_back,
     snap_between,
     snap_forward,
@@ -19,12 +32,19 @@ from datethyme.scheduling.algorithms import (
     split_overlap_equal,
     split_overlap_inverse_proportional,
     split_overlap_proportional,
+    squeeze,
+    squeeze_boundaries,
+    stack,
     stack_backward,
+    stack_boundaries,
     stack_forward,
     stack_from_middle,
     truncate,
     truncate_nodiscard,
+    water_fill,
+    with_bounds,
 )
+from datethyme.scheduling.types.slots import TimeSlot
 
 
 @pytest.mark.parametrize(
@@ -1127,3 +1147,245 @@ def test_truncate_nodiscard(original, earliest, latest, truncated):
 )
 def test_snap_back_alt(original, times, modified):
     assert snap_back(*original) == modified
+
+
+@pytest.mark.parametrize(
+    "lengths, total, floor, expected",
+    [
+        ([10, 20, 30], 120, 0, [20, 40, 60]),
+        ([10, 20, 30, 60], 60, 10, [10, 10, 40 / 3, 80 / 3]),
+        ([0, 0], 30, 10, [15, 15]),
+        ([], 0, 5, []),
+    ],
+)
+def test_water_fill(lengths, total, floor, expected):
+    assert water_fill(lengths, total, floor) == pytest.approx(expected)
+
+
+def test_water_fill_infeasible():
+    with pytest.raises(ValueError):
+        water_fill([10, 20], 15, floor=10)
+
+
+def make_spans() -> list[TimeSpan]:
+    return [
+        TimeSpan(Time(hour=8), Time(hour=9), name="a"),
+        TimeSpan(Time(hour=10), Time(hour=12), name="b"),
+        TimeSpan(Time(hour=13), Time(hour=14), name="c"),
+    ]
+
+
+@pytest.mark.parametrize(
+    "mode, min_minutes, expected",
+    [
+        ("PROPORTIONAL", 0, [0, 60, 180, 240]),
+        ("EQUAL", 0, [0, 80, 160, 240]),
+        ("PROPORTIONAL", 70, [0, 70, 170, 240]),
+    ],
+)
+def test_squeeze_boundaries(mode, min_minutes, expected):
+    boundaries = squeeze_boundaries(
+        [60, 120, 60], mode=mode, lower=0, upper=240, min_minutes=min_minutes
+    )
+    assert boundaries == pytest.approx(expected)
+
+
+@pytest.mark.parametrize(
+    "mode, anchor, expected",
+    [
+        ("FORWARD", None, [480, 540, 660, 720]),
+        ("FORWARD", 0, [0, 60, 180, 240]),
+        ("BACKWARD", None, [600, 660, 780, 840]),
+        ("OUTWARD", None, [540, 600, 720, 780]),
+    ],
+)
+def test_stack_boundaries(mode, anchor, expected):
+    assert stack_boundaries([480, 600, 780], [540, 720, 840], mode=mode, anchor=anchor) == expected
+
+
+def test_squeeze_vectorized():
+    spans = make_spans()
+    squeezed = squeeze(
+        spans, mode="EQUAL", earliest=Time(hour=8), latest=Time(hour=12), backend="vectorized"
+    )
+    assert [span.start for span in squeezed] == [
+        Time(hour=8),
+        Time(hour=9, minute=20),
+        Time(hour=10, minute=40),
+    ]
+    assert squeezed[-1].end == Time(hour=12)
+    assert [span.name for span in squeezed] == ["a", "b", "c"]
+    assert spans == make_spans()
+
+
+def test_stack_vectorized():
+    stacked = stack(make_spans(), "BACKWARD", anchor=Time(hour=24), backend="vectorized")
+    assert [span.start for span in stacked] == [Time(hour=20), Time(hour=21), Time(hour=23)]
+    assert stacked[-1].end == Time(hour=24)
+
+
+def test_invalid_backend():
+    with pytest.raises(ValueError):
+        stack(make_spans(), "FORWARD", backend="gpu")
+
+
+def hourly(*hours: tuple[float, float, str]) -> list[TimeSpan]:
+    return [TimeSpan(Time.from_hours(a), Time.from_hours(b), name=name) for a, b, name in hours]
+
+
+def endless_spans():
+    for i in count():
+        yield TimeSpan(Time(hour=0, minute=2 * i), Time(hour=0, minute=2 * i + 1), name=str(i))
+
+
+def test_iter_pairwise_is_lazy():
+    spans = islice(iter_pairwise(snap_forward, endless_spans()), 3)
+    assert [span.end for span in spans] == [
+        Time(hour=0, minute=2),
+        Time(hour=0, minute=4),
+        Time(hour=0, minute=6),
+    ]
+
+
+def test_iter_resolve_gaps():
+    spans = hourly((8, 9, "a"), (10, 11, "b"), (11, 12, "c"))
+    resolved = list(iter_resolve_gaps(iter(spans), "SNAP_FORWARD"))
+    assert [span.end for span in resolved] == [Time(hour=10), Time(hour=11), Time(hour=12)]
+
+
+def test_iter_resolve_invalid_mode():
+    with pytest.raises(ValueError):
+        iter_resolve_gaps([], "SIDEWAYS")
+    with pytest.raises(ValueError):
+        iter_resolve_overlaps([], "SIDEWAYS")
+
+
+def test_iter_truncate_bounds_unbounded_stream():
+    truncated = list(
+        iter_truncate(endless_spans(), Time(hour=0, minute=3), Time(hour=0, minute=8, second=30))
+    )
+    assert [span.name for span in truncated] == ["2", "3", "4"]
+    assert truncated[-1].end == Time(hour=0, minute=8, second=30)
+
+
+def test_iter_eclipse_forward():
+    spans = hourly((8, 10, "a"), (9, 11, "b"), (9, 10, "c"), (12, 13, "d"))
+    kept = list(iter_eclipse_forward(spans))
+    assert [(span.name, span.start) for span in kept] == [
+        ("a", Time(hour=8)),
+        ("b", Time(hour=10)),
+        ("d", Time(hour=12)),
+    ]
+
+
+def test_coalesce():
+    spans = hourly((8, 9, "a"), (9, 10, "a"), (9.5, 11, "a"), (11, 12, "b"), (13, 14, "b"))
+    merged = list(coalesce(spans))
+    assert [(span.name, span.start, span.end) for span in merged] == [
+        ("a", Time(hour=8), Time(hour=11)),
+        ("b", Time(hour=11), Time(hour=12)),
+        ("b", Time(hour=13), Time(hour=14)),
+    ]
+
+
+def test_compose():
+    pipeline = compose(
+        coalesce,
+        partial(iter_resolve_gaps, mode="SNAP_FORWARD"),
+        partial(iter_truncate, earliest=Time(hour=8, minute=30), latest=Time(hour=13)),
+    )
+    spans = hourly((7, 8, "x"), (8, 9, "a"), (9, 10, "a"), (11, 12, "b"), (14, 15, "c"))
+    result = list(pipeline(iter(spans)))
+    assert [(span.name, span.start, span.end) for span in result] == [
+        ("a", Time(hour=8, minute=30), Time(hour=11)),
+        ("b", Time(hour=11), Time(hour=13)),
+    ]
+
+
+@pytest.mark.parametrize(
+    "mode, expected_ends, expected_cuts",
+    [
+        ("EQUAL", [Time(hour=11, minute=30), Time(hour=12)], [30, 30]),
+        ("PROPORTIONAL", [Time(hour=11, minute=48), Time(hour=12)], [12, 48]),
+        ("INVERSE", [Time(hour=11, minute=12), Time(hour=12)], [48, 12]),
+    ],
+)
+def test_resolve_overlaps_global_modes(mode, expected_ends, expected_cuts):
+    resolved, cuts = resolve_overlaps_global(hourly((9, 10, "b"), (8, 12, "a")), mode)
+    assert [span.name for span in resolved] == ["a", "b"]
+    assert [span.end for span in resolved] == expected_ends
+    assert [cut.minutes for cut in cuts] == pytest.approx(expected_cuts)
+
+
+def test_resolve_overlaps_global_triple_booking():
+    spans = hourly((9, 12, "b"), (8, 11, "a"), (10, 13, "c"), (14, 15, "d"), (15, 16, "e"))
+    resolved, cuts = resolve_overlaps_global(spans)
+    assert [(span.name, span.start, span.end) for span in resolved] == [
+        ("a", Time(hour=8), Time(hour=9, minute=50)),
+        ("b", Time(hour=9, minute=50), Time(hour=11, minute=10)),
+        ("c", Time(hour=11, minute=10), Time(hour=13)),
+        ("d", Time(hour=14), Time(hour=15)),
+        ("e", Time(hour=15), Time(hour=16)),
+    ]
+    assert {cut.original.name: cut.minutes for cut in cuts} == {"a": 70, "b": 100, "c": 70}
+    assert resolved[3] is spans[3]
+
+
+def test_resolve_overlaps_global_empty():
+    assert resolve_overlaps_global([]) == ((), [])
+
+
+def bounds(spans):
+    return [(span.name, span.start, span.end) for span in spans]
+
+
+def test_eclipse_by_priority_layers():
+    levels = {"low": 0, "mid": 2, "high": 5}
+    spans = hourly((12, 14, "high"), (8, 18, "low"), (13, 16, "mid"))
+    kept, rejected = eclipse_by_priority(spans, lambda span: levels[span.name])
+    assert bounds(kept) == [
+        ("low", Time(hour=8), Time(hour=12)),
+        ("high", Time(hour=12), Time(hour=14)),
+        ("mid", Time(hour=14), Time(hour=16)),
+        ("low", Time(hour=16), Time(hour=18)),
+    ]
+    assert sorted(bounds(rejected)) == [
+        ("low", Time(hour=12), Time(hour=16)),
+        ("mid", Time(hour=13), Time(hour=14)),
+    ]
+
+
+def test_eclipse_by_priority_defaults_to_start_order():
+    kept, rejected = eclipse_by_priority(hourly((9, 11, "b"), (8, 10, "a"), (12, 13, "c")))
+    assert bounds(rejected) == [("b", Time(hour=9), Time(hour=10))]
+    assert bounds(kept) == [
+        ("a", Time(hour=8), Time(hour=10)),
+        ("b", Time(hour=10), Time(hour=11)),
+        ("c", Time(hour=12), Time(hour=13)),
+    ]
+
+
+def test_eclipse_by_priority_streams_are_lazy():
+    kept, _ = eclipse_by_priority(hourly((8, 9, "a"), (9, 10, "b")))
+    assert next(kept).name == "a"
+    assert next(kept).name == "b"
+    assert next(kept, None) is None
+
+
+def test_eclipse_backward_later_spans_win():
+    kept, rejected = eclipse_backward(hourly((8, 10, "a"), (9, 11, "b")))
+    assert [(span.start, span.end) for span in kept] == [
+        (Time(hour=9), Time(hour=11)),
+        (Time(hour=8), Time(hour=9)),
+    ]
+    assert [(span.start, span.end) for span in rejected] == [(Time(hour=9), Time(hour=10))]
+
+
+def test_with_bounds_keeps_slot():
+    slot = TimeSlot(Time(hour=8), Time(hour=12), require_all={"deep"})
+    moved = with_bounds(slot, Time(hour=9), Time(hour=10))
+    assert isinstance(moved, TimeSlot)
+    assert (moved.start, moved.end) == (Time(hour=9), Time(hour=10))
+    assert moved.can_receive({"deep"})
+    assert not moved.can_receive(set())
+    assert (slot.start, slot.end) == (Time(hour=8), Time(hour=12))
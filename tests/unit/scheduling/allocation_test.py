@@ -0,0 +1,135 @@
+import pytest
+
+from datethyme import Date, Time
+from datethyme.constants import AddResult
+from datethyme.exceptions import TemporalLogicError
+from datethyme.scheduling.allocation import (
+    DayIndex,
+    GapIndex,
+    allocate,
+    entry_order,
+    entry_window,
+    independent_groups,
+)
+from datethyme.scheduling.dependencies import DependencyGraph
+from datethyme.scheduling.types import Entry
+from datethyme.scheduling.types.slots import TimeSlot
+
+
+class TestGapIndex:
+    def test_find_shortest_fit(self):
+        index = GapIndex([(0.0, 60.0), (120.0, 150.0), (200.0, 300.0)])
+        assert index.find(30, set()) == (120.0, 150.0)
+        assert index.find(31, set()) == (0.0, 60.0)
+        assert index.find(31, set(), longest=True) == (200.0, 300.0)
+        assert index.find(101, set()) is None
+        assert index.largest() == pytest.approx(100)
+
+    def test_occupy_and_release(self):
+        index = GapIndex([(0.0, 60.0), (120.0, 180.0)])
+        index.occupy(130.0, 150.0)
+        assert index.gaps == [(0.0, 60.0), (120.0, 130.0), (150.0, 180.0)]
+        assert index.find(40, set()) == (0.0, 60.0)
+        index.release(130.0, 150.0)
+        assert index.gaps == [(0.0, 60.0), (120.0, 180.0)]
+        index.release(60.0, 120.0)
+        assert index.gaps == [(0.0, 180.0)]
+        with pytest.raises(TemporalLogicError):
+            index.occupy(170.0, 190.0)
+
+    def test_free_around(self):
+        index = GapIndex([(0.0, 60.0), (90.0, 120.0)])
+        assert index.free_around(60.0, 90.0) == (0.0, 120.0)
+        assert index.free_around(60.0, 80.0) == (0.0, 80.0)
+        assert index.is_free(95.0, 120.0)
+        assert not index.is_free(50.0, 70.0)
+
+    def test_slots(self):
+        work = TimeSlot(Time(hour=1), Time(hour=2), require_any={"work"})
+        index = GapIndex([(0.0, 180.0)], [work])
+        assert index.find(30, {"home"}) is None
+        assert index.find(30, {"work"}) == (60.0, 120.0)
+        assert index.largest() == pytest.approx(60)
+        assert index.can_receive(60.0, 90.0, {"work"})
+        assert not index.can_receive(0.0, 90.0, {"work"})
+
+
+def test_day_index():
+    index = DayIndex([10.0, 50.0, 20.0, 50.0, 5.0])
+    assert index.first_at_least(30, 0, 4) == 1
+    assert index.first_at_least(30, 2, 4) == 3
+    assert index.first_at_least(60, 0, 4) is None
+    assert index.first_at_least(1, 3, 2) is None
+    index.update(1, 0.0)
+    assert index.first_at_least(30, 0, 4) == 3
+    assert index[1] == pytest.approx(0)
+
+
+def test_entry_order():
+    due = Date.parse("2026-01-10")
+    entries = [
+        Entry(name="low", priority=0.1),
+        Entry(name="undated", priority=0.9),
+        Entry(name="due", priority=0.9, due_date=due),
+        Entry(name="due_later_start", priority=0.9, due_date=due, earliest_date=due - 2),
+    ]
+    assert [e.name for e in sorted(entries, key=entry_order)] == [
+        "due",
+        "due_later_start",
+        "undated",
+        "low",
+    ]
+
+
+def test_entry_window():
+    first = Date.parse("2026-01-01")
+    dates = [first + i for i in range(5)]
+    assert entry_window(dates, Entry(name="a", normal_time=30)) == (0, 4)
+    bounded = Entry(name="b", normal_time=30, earliest_date=first + 1, due_date=first + 3)
+    assert entry_window(dates, bounded) == (1, 3)
+    overdue = Entry(name="c", normal_time=30, due_date=first - 1)
+    assert entry_window(dates, overdue) == (0, -1)
+
+
+def test_independent_groups():
+    windows = [(0, 1), (1, 2), (4, 4), (6, 7), (3, 2)]
+    assert independent_groups(windows) == [(0, 2, [0, 1]), (4, 4, [2]), (6, 7, [3])]
+    assert independent_groups(windows, min_days=3) == [(0, 2, [0, 1]), (4, 7, [2, 3])]
+
+
+def test_allocate_with_dependencies():
+    first = Date.parse("2026-01-01")
+    dates = [first + i for i in range(3)]
+    entries = [
+        Entry(name="x", priority=0.5),
+        Entry(name="d", priority=0.9, dependencies={"p"}),
+        Entry(name="p", priority=0.1),
+        Entry(name="blocked", dependencies={"d"}, due_date=first + 1),
+    ]
+    days: list[list[str]] = [[] for _ in dates]
+
+    def place(position, entry):
+        if entry.name == "x" and "p" in days[position]:  # x displaces p, whatever their priority
+            days[position].remove("p")
+            days[position].append("x")
+            return AddResult.DISPLACED, 60.0, [entries[2]]
+        days[position].append(entry.name)
+        return AddResult.ADDED, 60.0, []
+
+    def unplace(position, entry):
+        days[position].remove(entry.name)
+        return 60.0
+
+    outcomes = allocate(
+        entries, dates, [60.0] * 3, place, graph=DependencyGraph(entries), unplace=unplace
+    )
+    assert [(entry.name, position) for entry, position, *_ in outcomes] == [
+        ("p", 0),  # with the priority of d
+        ("d", 1),
+        ("blocked", None),  # p and d take the days up to its due date
+        ("x", 0),  # which removes d and queues it behind p
+        ("p", 0),
+        ("d", 1),
+        ("blocked", None),
+    ]
+    assert days == [["x", "p"], ["d"], []]
@@ -0,0 +1,150 @@
+import pytest
+
+from datethyme import Time, TimeSpan
+from datethyme.scheduling import backends
+from datethyme.scheduling.algorithms import (
+    eclipse_backward,
+    eclipse_forward,
+    get_relative_lengths,
+    get_total_length,
+    resolve_gaps,
+    resolve_overlaps,
+    squeeze,
+    stack,
+    truncate,
+)
+from datethyme.scheduling.backends import register, select_backend, use_backend
+
+
+def spans() -> list[TimeSpan]:
+    return [
+        TimeSpan(Time(hour=8), Time(hour=10), name="a"),
+        TimeSpan(Time(hour=9), Time(hour=12), name="b"),
+        TimeSpan(Time(hour=13), Time(hour=14), name="c"),
+    ]
+
+
+def bounds(seq):
+    return [(span.name, span.start, span.end) for span in seq]
+
+
+FAKE_TOTAL = object()
+
+
+@pytest.fixture
+def fake_backend():
+    calls = []
+
+    @register("get_total_length", "fake")
+    def total(seq):
+        calls.append(len(seq))
+        return FAKE_TOTAL
+
+    yield calls
+    del backends._implementations["get_total_length"]["fake"]
+
+
+def test_small_inputs_stay_pure():
+    assert select_backend(spans()) == "python"
+
+
+def test_large_inputs_use_numpy_when_installed(monkeypatch):
+    monkeypatch.setattr(backends, "NUMPY_MIN_SIZE", 3)
+    expected = "numpy" if backends.numpy_available() else "python"
+    assert select_backend(spans()) == expected
+    assert select_backend(spans()[:2]) == "python"
+
+
+def test_squeeze_and_stack_do_not_switch_with_input_size(monkeypatch):
+    monkeypatch.setattr(backends, "NUMPY_MIN_SIZE", 1)
+    window = {"earliest": Time(hour=8), "latest": Time(hour=9), "min_minutes": 15}
+    squeezed = squeeze(spans(), mode="PROPORTIONAL", **window)
+    assert bounds(squeezed) == bounds(
+        squeeze(spans(), mode="PROPORTIONAL", backend="iterative", **window)
+    )
+    # the vectorized squeeze keeps the total when spans are held at `min_minutes`
+    vectorized = squeeze(spans(), mode="PROPORTIONAL", backend="vectorized", **window)
+    assert squeezed[-1].end > Time(hour=9)
+    assert vectorized[-1].end == Time(hour=9)
+    assert bounds(stack(spans(), "FORWARD")) == bounds(
+        stack(spans(), "FORWARD", backend="iterative")
+    )
+
+
+def test_use_backend_forces_and_restores(fake_backend):
+    with use_backend("fake"):
+        assert select_backend(spans()) == "fake"
+        assert get_total_length(iter(spans())) is FAKE_TOTAL
+    assert fake_backend == [3]
+    assert get_total_length(spans()) == 360
+
+
+def test_missing_implementation_falls_back_to_python(fake_backend):
+    with use_backend("fake"):
+        assert stack(spans(), "FORWARD", backend="vectorized")[-1].end == Time(hour=14)
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError, match="not available"), use_backend("gpu"):
+        pass
+
+
+def test_truncate_cuts_spans_across_both_bounds():
+    before, inside, after = truncate(spans(), Time(hour=9), Time(hour=11))
+    assert bounds(before) == [("a", Time(hour=8), Time(hour=9))]
+    assert bounds(inside) == [
+        ("a", Time(hour=9), Time(hour=10)),
+        ("b", Time(hour=9), Time(hour=11)),
+    ]
+    assert bounds(after) == [
+        ("b", Time(hour=11), Time(hour=12)),
+        ("c", Time(hour=13), Time(hour=14)),
+    ]
+
+
+@pytest.mark.parametrize("backend", ["python", "numpy"])
+@pytest.mark.parametrize(
+    "call",
+    [
+        lambda seq: resolve_overlaps(seq, "EQUAL"),
+        lambda seq: resolve_overlaps(seq, "PROPORTIONAL"),
+        lambda seq: resolve_gaps(seq, "EQUAL"),
+        lambda seq: resolve_gaps(seq, "SNAP_BACK"),
+    ],
+)
+def test_resolve_leaves_input_unchanged(call, backend):
+    if backend == "numpy":
+        pytest.importorskip("numpy")
+    seq = spans()
+    with use_backend(backend):
+        resolved = call(seq)
+    assert bounds(seq) == bounds(spans())
+    assert bounds(resolved) != bounds(spans())
+
+
+@pytest.mark.parametrize(
+    "call",
+    [
+        lambda seq: truncate(seq, Time(hour=9), Time(hour=11)),
+        eclipse_forward,
+        eclipse_backward,
+        lambda seq: resolve_gaps(seq, mode="SNAP_BACK"),
+        lambda seq: stack(seq, "BACKWARD", backend="vectorized"),
+        lambda seq: squeeze(seq, mode="PROPORTIONAL", min_minutes=90, backend="vectorized"),
+        get_relative_lengths,
+    ],
+)
+def test_numpy_matches_python(call):
+    pytest.importorskip("numpy")
+
+    def flatten(result):
+        if isinstance(result, TimeSpan):
+            return (result.name, result.start, result.end)
+        if isinstance(result, (list, tuple)):
+            return [flatten(item) for item in result]
+        return pytest.approx(result)
+
+    with use_backend("python"):
+        expected = flatten(call(spans()))
+    with use_backend("numpy"):
+        assert flatten(call(spans())) == expected
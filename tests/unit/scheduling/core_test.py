@@ -0,0 +1,127 @@
+from time import perf_counter
+
+from datethyme import Date
+from datethyme.constants import AddResult, Recipe
+from datethyme.scheduling.core import (
+    IncrementalSchedule,
+    Weights,
+    optimize_schedule,
+    schedule_entries,
+)
+from datethyme.scheduling.types import Calendar, CalendarDay, DayPartition, Entry
+from datethyme.scheduling.utils import is_partitioned
+
+FIRST = Date.parse("2026-01-01")
+
+
+def make_calendar(ndays: int) -> Calendar:
+    def day() -> DayPartition:
+        return DayPartition.model_validate({
+            "fixed": [
+                {"start": "00:00", "end": "09:00", "name": "night"},
+                {"start": "12:00", "end": "24:00", "name": "afternoon"},
+            ]
+        })
+
+    return Calendar({FIRST + i: CalendarDay(schedule=day(), entries=[]) for i in range(ndays)})
+
+
+def make_entries(n: int) -> list[Entry]:
+    return [
+        Entry(
+            name=f"e{i}",
+            normal_time=30 + 15 * (i % 4),
+            min_time_explicit=20,
+            max_time_explicit=90,
+            priority=(i % 5) / 5,
+            due_date=FIRST + i % 4,
+            contexts={"home" if i % 2 else "work"},
+        )
+        for i in range(n)
+    ]
+
+
+def test_schedule_entries_leaves_preexisting_alone():
+    calendar = make_calendar(2)
+    scheduled = schedule_entries(make_entries(2), calendar, Recipe.DEFAULT)
+    assert sum(len(day.entries) for day in scheduled.values()) == 2
+    assert not any(day.schedule.flex for day in calendar.values())
+
+
+def test_incremental_schedule():
+    calendar = make_calendar(6)
+    entries = {
+        entry.name: entry
+        for entry in (
+            Entry(
+                name=f"e{i}",
+                normal_time=60 + 30 * (i % 3),
+                priority=(i % 5) / 5,
+                earliest_date=FIRST + 2 * (i % 3),
+                due_date=FIRST + 2 * (i % 3) + 1,
+            )
+            for i in range(30)
+        )
+    }
+    schedule = IncrementalSchedule(entries.values(), calendar)
+    urgent = entries["e4"].model_copy(update={"priority": 0.99})
+    entries[urgent.name] = urgent
+    del entries["e0"], entries["e3"]
+    assert schedule.update([urgent], removed=["e0"]) == [FIRST + 2, FIRST + 3]
+    assert schedule.update(removed=["e3"]) == [FIRST + 0, FIRST + 1]
+    assert schedule.update() == []
+
+    scheduled = schedule_entries(entries.values(), calendar, Recipe.DEFAULT)
+    assert str(schedule.calendar) == str(scheduled)
+    assert "e4" in schedule.placed
+    assert "e4" not in schedule.remaining
+    assert not any("e3" in day.entries for day in schedule.calendar.values())
+    assert all(record.name not in {"e0", "e3"} for record in schedule.log.records)
+    assert not any(day.schedule.flex for day in calendar.values())
+
+
+def test_optimize_schedule():
+    calendar, entries = make_calendar(4), make_entries(24)
+    greedy = optimize_schedule(entries, calendar, budget=0.0, seed=0)
+    started = perf_counter()
+    result = optimize_schedule(entries, calendar, budget=0.5, seed=0)
+    assert perf_counter() - started < 1.0
+    assert result.iterations > greedy.iterations
+    assert result.cost <= greedy.cost
+    placed = {name for day in result.calendar.values() for name in day.entries}
+    assert placed.isdisjoint(result.remaining)
+    assert len(placed) + len(result.remaining) == len(entries)
+    for day in result.calendar.values():
+        assert is_partitioned(day.schedule.blocks)
+        assert set(day.entries) == {block.name for block in day.schedule.flex}
+    assert not any(day.schedule.flex for day in calendar.values())
+
+
+def test_optimize_leaves_entries_it_cannot_add(monkeypatch):
+    def add_flex_at(self, entry, start, end):
+        return AddResult.NOT_ADDED, self, [entry]
+
+    monkeypatch.setattr(DayPartition, "add_flex_at", add_flex_at)
+    entries = make_entries(4)
+    result = optimize_schedule(entries, make_calendar(2), budget=0.0, seed=0)
+    assert set(result.remaining) == {entry.name for entry in entries}
+    assert not any(day.entries for day in result.calendar.values())
+
+
+def test_optimize_searches_when_few_entries_fit():
+    result = optimize_schedule(make_entries(1000), make_calendar(30), budget=0.5, seed=0)
+    assert len(result.remaining) > 500
+    assert result.iterations > 0
+
+
+def test_optimize_groups_contexts():
+    calendar = make_calendar(1)
+    entries = [
+        Entry(name=f"e{i}", normal_time=30, contexts={"home" if i % 2 else "work"})
+        for i in range(6)
+    ]
+    weights = Weights(switches=100.0)
+    greedy = optimize_schedule(entries, calendar, budget=0.0, weights=weights)
+    result = optimize_schedule(entries, calendar, budget=0.3, weights=weights, seed=1)
+    assert greedy.cost >= 500
+    assert result.cost <= 100
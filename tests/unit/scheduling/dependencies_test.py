@@ -0,0 +1,43 @@
+import pytest
+
+from datethyme.exceptions import TemporalLogicError
+from datethyme.scheduling.dependencies import DependencyGraph
+from datethyme.scheduling.types import Entry
+
+
+def make_graph(**dependencies: set[str]) -> DependencyGraph:
+    return DependencyGraph(
+        Entry(name=name, dependencies=names or None) for name, names in dependencies.items()
+    )
+
+
+def test_compile():
+    graph = make_graph(c={"a", "b"}, a=set(), b={"a", "done"}, d=set())
+    assert graph.edges == 3
+    assert graph.prerequisites(graph.index["c"]) == [graph.index["a"], graph.index["b"]]
+    assert graph.dependents(graph.index["a"]) == [graph.index["c"], graph.index["b"]]
+    assert [graph.names[i] for i in graph.order] == ["a", "d", "b", "c"]
+
+
+def test_cycle():
+    with pytest.raises(TemporalLogicError, match="a -> b -> c -> a"):
+        make_graph(a={"c"}, b={"a"}, c={"b"}, d={"a"})
+    with pytest.raises(TemporalLogicError, match="a -> a"):
+        make_graph(a={"a"})
+
+
+def test_propagate():
+    graph = make_graph(a=set(), b={"a"}, c={"b"})
+    assert graph.propagate([(0, 9), (0, 9), (0, 5)]) == [(0, 9), (1, 9), (2, 5)]
+    assert graph.propagate([(3, 9), (0, 9), (0, 4)]) == [(3, 9), (4, 9), (5, 4)]
+
+
+def test_inherited():
+    graph = make_graph(a=set(), b={"a"}, c={"a"}, d=set())
+    assert graph.inherited([0.1, 0.5, 0.9, 0.2]) == [0.9, 0.5, 0.9, 0.2]
+
+
+def test_critical_path():
+    graph = make_graph(a=set(), b={"a"}, c={"a"}, d={"b", "c"})
+    assert graph.critical_path([10, 30, 20, 5]) == (45, [0, 1, 3])
+    assert DependencyGraph([]).critical_path([]) == (0.0, [])
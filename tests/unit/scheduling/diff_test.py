@@ -0,0 +1,139 @@
+from itertools import pairwise
+
+import pytest
+
+from datethyme import Date, Time
+from datethyme.scheduling import Calendar, TimePartition
+from datethyme.scheduling.diff import EditOp, diff, patch
+from datethyme.scheduling.types import DayPartition, Entry
+from datethyme.scheduling.types.slots import TimeSlot
+
+
+def make_partition(*bounds: tuple[float, str | None]) -> TimePartition:
+    times = [Time.from_hours(h) for h, _ in bounds]
+    return TimePartition([
+        a.span(b, name=name) for (a, b), (_, name) in zip(pairwise(times), bounds)
+    ])
+
+
+def make_day(*blocks: tuple[str, str, str]) -> DayPartition:
+    return DayPartition.model_validate({
+        "fixed": [{"start": a, "end": b, "name": name} for a, b, name in blocks]
+    })
+
+
+def make_calendar(days: dict[str, list[tuple[str, str, str]]]) -> Calendar:
+    return Calendar.model_validate({
+        date: {"schedule": make_day(*blocks).model_dump(), "entries": []}
+        for date, blocks in days.items()
+    })
+
+
+class TestPartitionDiff:
+    def test_identical(self):
+        old = make_partition((8, "a"), (9, "b"), (10, None))
+        assert diff(old, make_partition((8, "a"), (9, "b"), (10, None))) == []
+
+    def test_resize_and_insert(self):
+        old = make_partition((8, "a"), (9, "b"), (12, None))
+        new = make_partition((8, "a"), (10, "b"), (11, "c"), (12, None))
+        edits = diff(old, new)
+        assert [(e.op, e.key) for e in edits] == [
+            (EditOp.RESIZE, ("a", 0)),
+            (EditOp.RESIZE, ("b", 0)),
+            (EditOp.INSERT, ("c", 0)),
+        ]
+        assert patch(old, edits).spans == new.spans
+
+    def test_remove(self):
+        old = make_partition((8, "a"), (9, "b"), (10, "c"), (11, None))
+        new = make_partition((8, "a"), (10, "c"), (11, None))
+        edits = diff(old, new)
+        assert {e.op for e in edits} == {EditOp.REMOVE, EditOp.RESIZE}
+        assert patch(old, edits).spans == new.spans
+
+    def test_repeated_names_matched_in_order(self):
+        old = make_partition((8, "email"), (9, "code"), (12, "email"), (13, None))
+        new = make_partition((8, "email"), (9, "code"), (12.5, "email"), (13, None))
+        assert [e.key for e in diff(old, new)] == [("code", 0), ("email", 1)]
+
+    def test_unnamed_matched_by_bounds(self):
+        old = make_partition((8, "a"), (9, None), (10, None))
+        new = make_partition((8, "a"), (9.5, None), (10, None))
+        edits = diff(old, new)
+        assert [(e.op, e.key) for e in edits] == [
+            (EditOp.REMOVE, (540.0, 600.0)),
+            (EditOp.RESIZE, ("a", 0)),
+            (EditOp.INSERT, (570.0, 600.0)),
+        ]
+        assert patch(old, edits).spans == new.spans
+
+
+class TestDayPartitionDiff:
+    def test_single_block_moved(self):
+        old = make_day(("09:00", "10:00", "a"), ("13:00", "14:00", "b"))
+        new = make_day(("09:00", "10:00", "a"), ("15:00", "16:00", "b"))
+        edits = diff(old, new)
+        assert [(e.op, e.key) for e in edits] == [(EditOp.RESIZE, ("b", 0))]
+        patched = patch(old, edits)
+        assert patched.busy == new.busy
+        assert patched.gaps == new.gaps
+        assert old["b"].start == Time(hour=13)
+
+    def test_keeps_slots_and_placed_entries(self):
+        old, new = make_day(("09:00", "10:00", "a")), make_day(("09:00", "11:00", "a"))
+        for day in (old, new):
+            day.set_slots([TimeSlot(start=Time(hour=12), end=Time(hour=18))])
+            day.add_flex(Entry(name="x", normal_time=60))
+        patched = patch(old, diff(old, new))
+        assert patched.slots == old.slots
+        assert list(patched.placed) == ["x"]
+        assert patched.remove_flex("x") is old.placed["x"]
+
+
+class TestCalendarDiff:
+    def test_only_changed_days(self):
+        old = make_calendar({
+            "2026-05-11": [("09:00", "10:00", "a")],
+            "2026-05-12": [("09:00", "10:00", "b")],
+        })
+        new = make_calendar({
+            "2026-05-11": [("09:00", "10:00", "a")],
+            "2026-05-12": [("09:00", "11:00", "b")],
+            "2026-05-13": [("08:00", "09:00", "c")],
+        })
+        edits = diff(old, new)
+        assert list(edits) == [Date.parse("2026-05-12"), Date.parse("2026-05-13")]
+        patched = patch(old, edits)
+        assert diff(patched, new) == {}
+
+    def test_removed_day(self):
+        old = make_calendar({"2026-05-11": [], "2026-05-12": [("09:00", "10:00", "b")]})
+        new = make_calendar({"2026-05-12": [("09:00", "10:00", "b")]})
+        edits = diff(old, new)
+        assert edits == {Date.parse("2026-05-11"): None}
+        patched = patch(old, edits)
+        assert list(patched) == [Date.parse("2026-05-12")]
+        assert diff(patched, new) == {}
+        assert sorted(patch(new, diff(new, old))) == list(old)
+
+    def test_target_unchanged(self):
+        old = make_calendar({
+            "2026-05-11": [("09:00", "10:00", "a")],
+            "2026-05-12": [("09:00", "10:00", "b")],
+        })
+        new = make_calendar({
+            "2026-05-11": [("09:00", "10:00", "a")],
+            "2026-05-12": [("09:00", "11:00", "b")],
+        })
+        patched = patch(old, diff(old, new))
+        for date in ("2026-05-11", "2026-05-12"):
+            patched[Date.parse(date)].schedule.add_flex(Entry(name="x", normal_time=60))
+            patched[Date.parse(date)].entries.clear()
+        assert [block.name for block in old[Date.parse("2026-05-11")].schedule.busy] == ["a"]
+        assert old[Date.parse("2026-05-12")].schedule.busy[0].end == Time(hour=10)
+        assert not old[Date.parse("2026-05-12")].schedule.placed
+
+    def test_type_mismatch(self):
+        with pytest.raises(TypeError):
+            diff(make_day(), make_partition((8, "a"), (9, None)))
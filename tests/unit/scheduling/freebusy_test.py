@@ -0,0 +1,115 @@
+import pytest
+
+from datethyme import Date, DateTime, DateTimeSpan, Time, TimeSpan
+from datethyme.scheduling import Calendar, find_slots, free_busy
+from datethyme.scheduling.freebusy import busy_intervals, free_intervals, merge_busy
+from datethyme.scheduling.types.slots import TimeSlot
+
+
+def make_calendar(days: dict[str, list[tuple[str, str]]]) -> Calendar:
+    return Calendar.model_validate({
+        date: {
+            "schedule": {"fixed": [{"start": a, "end": b, "name": f"{a}-{b}"} for a, b in blocks]},
+            "entries": [],
+        }
+        for date, blocks in days.items()
+    })
+
+
+def dt(date: str, time: str) -> DateTime:
+    return DateTime.from_pair(Date.parse(date), Time.parse(time))
+
+
+CAL_A = make_calendar({
+    "2026-05-11": [("09:00", "10:00"), ("13:00", "14:00")],
+    "2026-05-12": [("08:00", "12:00")],
+})
+CAL_B = make_calendar({
+    "2026-05-11": [("09:30", "11:00"), ("16:00", "17:00")],
+})
+WORKING_HOURS = TimeSpan(start=Time(hour=8), end=Time(hour=18))
+
+
+@pytest.mark.parametrize(
+    "busy_lists, expected",
+    [
+        ([[(0, 10), (20, 30)], [(5, 12)], [(29, 40)]], [(0, 12), (20, 40)]),
+        ([[(0, 10)], [(10, 20)]], [(0, 20)]),
+        ([[], []], []),
+    ],
+)
+def test_merge_busy(busy_lists, expected):
+    assert list(merge_busy(busy_lists)) == expected
+
+
+def test_free_intervals_min_minutes():
+    busy = [[(10, 20), (25, 50)]]
+    assert free_intervals(busy, [(0, 60)]) == [(0, 10), (20, 25), (50, 60)]
+    assert free_intervals(busy, [(0, 60)], min_minutes=10) == [(0, 10), (50, 60)]
+
+
+def test_free_intervals_busy_across_windows():
+    assert free_intervals([[(5, 25)]], [(0, 10), (20, 30)]) == [(0, 5), (25, 30)]
+
+
+def test_busy_intervals_sorted():
+    intervals = busy_intervals(CAL_A)
+    assert intervals == sorted(intervals)
+    assert len(intervals) == 3
+
+
+def test_free_busy():
+    result = free_busy([CAL_A, CAL_B], working_hours=WORKING_HOURS, min_minutes=30)
+    assert result == [
+        DateTimeSpan(dt("2026-05-11", "08:00"), dt("2026-05-11", "09:00")),
+        DateTimeSpan(dt("2026-05-11", "11:00"), dt("2026-05-11", "13:00")),
+        DateTimeSpan(dt("2026-05-11", "14:00"), dt("2026-05-11", "16:00")),
+        DateTimeSpan(dt("2026-05-11", "17:00"), dt("2026-05-11", "18:00")),
+        DateTimeSpan(dt("2026-05-12", "12:00"), dt("2026-05-12", "18:00")),
+    ]
+
+
+def test_free_busy_crosses_midnight_without_mask():
+    result = free_busy([CAL_A], dates=[Date.parse("2026-05-11"), Date.parse("2026-05-12")])
+    assert DateTimeSpan(dt("2026-05-11", "14:00"), dt("2026-05-12", "08:00")) in result
+
+
+def test_free_busy_parallel_matches_serial():
+    serial = free_busy([CAL_A, CAL_B], working_hours=WORKING_HOURS, min_minutes=30)
+    parallel = free_busy(
+        [CAL_A, CAL_B], working_hours=WORKING_HOURS, min_minutes=30, max_workers=2, block_days=1
+    )
+    assert parallel == serial
+
+
+def test_find_slots_stops_at_k():
+    result = find_slots([CAL_A, CAL_B], 60, 2, dt("2026-05-11", "08:00"), dt("2026-05-12", "18:00"))
+    assert result == [
+        DateTimeSpan(dt("2026-05-11", "08:00"), dt("2026-05-11", "09:00")),
+        DateTimeSpan(dt("2026-05-11", "11:00"), dt("2026-05-11", "12:00")),
+    ]
+
+
+def test_find_slots_step():
+    result = find_slots(
+        [CAL_A, CAL_B], 60, 3, dt("2026-05-11", "10:30"), dt("2026-05-11", "18:00"), step=30
+    )
+    assert [span.start for span in result] == [
+        dt("2026-05-11", "11:00"),
+        dt("2026-05-11", "11:30"),
+        dt("2026-05-11", "12:00"),
+    ]
+
+
+def test_find_slots_respects_contexts():
+    slots = [
+        TimeSlot(Time(hour=8), Time(hour=12), require_any={"work"}),
+        TimeSlot(Time(hour=19), Time(hour=22), require_none={"work"}),
+    ]
+    window = dt("2026-05-11", "00:00"), dt("2026-05-12", "00:00")
+    work = find_slots([CAL_A, CAL_B], 60, 5, *window, contexts="work", slots=slots)
+    home = find_slots([CAL_A, CAL_B], 60, 5, *window, contexts={"home"}, slots=slots)
+    assert [span.start for span in work] == [dt("2026-05-11", "08:00"), dt("2026-05-11", "11:00")]
+    assert [span.start for span in home] == [dt("2026-05-11", "19:00")]
+    with pytest.raises(ValueError, match="no slots"):
+        find_slots([CAL_A, CAL_B], 60, 5, *window, contexts="work")
@@ -0,0 +1,396 @@
+import string
+from functools import partial
+from itertools import pairwise
+
+import pytest
+
+from datethyme import Time, TimeSpan
+from datethyme.exceptions import TemporalLogicError
+from datethyme.scheduling.algorithms import coalesce, compose, iter_resolve_gaps
+from datethyme.scheduling.types import PersistentPartition, TimePartition
+from datethyme.scheduling.types.slots import TimeSlot
+
+
+def make_partition(*hours: float, names: str | None = None) -> TimePartition:
+    times = [Time.from_hours(h) for h in hours]
+    labels = names or string.ascii_lowercase
+    return TimePartition([
+        TimeSpan(start=a, end=b, name=labels[i]) for i, (a, b) in enumerate(pairwise(times))
+    ])
+
+
+PARTITION = make_partition(8, 9, 11, 12, 15)
+
+
+class TestLookup:
+    def test_boundaries(self):
+        assert PARTITION.boundaries == [480, 540, 660, 720, 900]
+
+    @pytest.mark.parametrize(
+        "point, expected",
+        [
+            (Time(hour=7), None),
+            (Time(hour=8), 0),
+            (Time(hour=8, minute=59), 0),
+            (Time(hour=9), 1),
+            (Time(hour=11, minute=30), 2),
+            (Time(hour=14, minute=59), 3),
+            (Time(hour=15), None),
+        ],
+    )
+    def test_index_from_time(self, point, expected):
+        assert PARTITION.index_from_time(point) == expected
+
+    def test_index_from_times(self):
+        points = [Time(hour=h) for h in (14, 7, 9, 8, 12, 16, 10)]
+        assert PARTITION.index_from_times(points) == list(map(PARTITION.index_from_time, points))
+
+    def test_span_containing(self):
+        assert PARTITION.span_containing(Time(hour=10)).name == "b"
+        assert PARTITION.span_containing(Time(hour=20)) is None
+
+    def test_span_containing_is_half_open(self):
+        assert PARTITION.span_containing(Time(hour=8)).name == "a"
+        assert PARTITION.span_containing(Time(hour=9)).name == "b"
+        assert PARTITION.span_containing(Time(hour=15)) is None
+
+    def test_split_inside_span(self):
+        first, second = PARTITION.split(Time(hour=10))
+        assert first.boundaries == [480, 540, 600]
+        assert second.boundaries == [600, 660, 720, 900]
+
+    def test_split_at_boundary(self):
+        first, second = PARTITION.split(Time(hour=11))
+        assert [s.name for s in first.spans] == ["a", "b"]
+        assert [s.name for s in second.spans] == ["c", "d"]
+
+    def test_split_outside(self):
+        with pytest.raises(TemporalLogicError):
+            PARTITION.split(Time(hour=16))
+
+    def test_cache_invalidated_on_shift(self):
+        partition = make_partition(8, 9, 10)
+        assert partition.boundaries == [480, 540, 600]
+        partition.shift_seconds(3600)
+        assert partition.index_from_time(Time(hour=9, minute=30)) == 0
+
+
+class TestNameIndex:
+    def test_getitem(self):
+        assert PARTITION["c"].start == Time(hour=11)
+        with pytest.raises(IndexError):
+            PARTITION["z"]
+
+    def test_index_from_name(self):
+        assert PARTITION.index_from_name("d") == 3
+        assert PARTITION.index_from_name("z") is None
+
+    def test_first_occurrence_wins(self):
+        partition = make_partition(8, 9, 10, 11, names="aba")
+        assert partition.index_from_name("a") == 0
+
+
+class TestPersistentPartition:
+    def test_roundtrip(self):
+        persistent = PARTITION.persistent()
+        assert len(persistent) == 4
+        assert persistent.spans == PARTITION.spans
+        assert persistent.names == ("a", "b", "c", "d")
+        assert persistent.end == Time(hour=15)
+
+    def test_from_spans_without_name_field(self):
+        slots = [TimeSlot(start=Time(hour=h), end=Time(hour=h + 1)) for h in (8, 9)]
+        persistent = PersistentPartition.from_spans(slots)
+        assert persistent.durations == (60, 60)
+        assert persistent[1].start == Time(hour=9)
+        assert persistent.names == (None, None)
+
+    def test_edits_leave_original_untouched(self):
+        original = PARTITION.persistent()
+        inserted = original.insert(1, 30, name="x")
+        resized = original.resize(0, 120)
+        removed = original.remove(2)
+        assert original.durations == (60, 120, 60, 180)
+        assert inserted.names == ("a", "x", "b", "c", "d")
+        assert inserted.end == Time(hour=15, minute=30)
+        assert resized[1].start == Time(hour=10)
+        assert removed.names == ("a", "b", "d")
+        assert removed.end == Time(hour=14)
+
+    def test_split(self):
+        first, second = PARTITION.persistent().split(Time(hour=10))
+        assert first.durations == (60, 60)
+        assert second.durations == (60, 60, 180)
+        assert second.start == Time(hour=10)
+        assert second.names == ("b", "c", "d")
+
+    def test_split_at_boundary(self):
+        first, second = PARTITION.persistent().split(Time(hour=11))
+        assert first.names == ("a", "b")
+        assert second.names == ("c", "d")
+
+    def test_index_and_getitem(self):
+        persistent = PARTITION.persistent()
+        assert persistent.index_from_time(Time(hour=11, minute=30)) == 2
+        assert persistent.index_from_time(Time(hour=16)) is None
+        assert persistent[-1].name == "d"
+
+    def test_many_edits(self):
+        persistent = PersistentPartition.from_minutes(Time(hour=0), [1] * 500)
+        for i in range(0, 500, 7):
+            persistent = persistent.resize(i, 2)
+        assert len(persistent) == 500
+        assert persistent.minutes == 500 + len(range(0, 500, 7))
+        assert persistent.to_partition(TimePartition).boundaries[-1] == persistent.minutes
+
+
+class TestIncrementalEdits:
+    def test_init_accepts_generator(self):
+        spans = (TimeSpan(Time(hour=h), Time(hour=h + 1)) for h in range(8, 12))
+        assert len(TimePartition(spans).spans) == 4
+
+    def test_init_rejects_gap(self):
+        with pytest.raises(ValueError):
+            TimePartition([
+                TimeSpan(Time(hour=8), Time(hour=9)),
+                TimeSpan(Time(hour=10), Time(hour=11)),
+            ])
+
+    def test_from_partition_without_validation(self):
+        partition = TimePartition.from_partition(PARTITION.spans, validate=False)
+        assert partition.boundaries == PARTITION.boundaries
+
+    def test_insert(self):
+        partition = make_partition(8, 9, 11)
+        partition.boundaries
+        partition.insert(2, TimeSpan(Time(hour=11), Time(hour=12), name="x"))
+        partition.insert(0, TimeSpan(Time(hour=7), Time(hour=8), name="y"))
+        assert partition.boundaries == [420, 480, 540, 660, 720]
+        assert partition.index_from_name("x") == 3
+        with pytest.raises(TemporalLogicError):
+            partition.insert(1, TimeSpan(Time(hour=8), Time(hour=10)))
+
+    def test_insert_interior(self):
+        partition = make_partition(8, 9, 11)
+        partition.boundaries
+        partition.insert(1, TimeSpan(Time(hour=9), Time(hour=9), name="x"))
+        assert partition.boundaries == [480, 540, 540, 660]
+        assert partition.names == ("a", "x", "b")
+        with pytest.raises(TemporalLogicError):
+            partition.insert(1, TimeSpan(Time(hour=9), Time(hour=10)))
+
+    def test_replace(self):
+        partition = make_partition(8, 9, 11)
+        partition.boundaries
+        partition.replace(
+            1,
+            TimeSpan(Time(hour=9), Time(hour=10), name="b1"),
+            TimeSpan(Time(hour=10), Time(hour=11), name="b2"),
+        )
+        assert partition.boundaries == [480, 540, 600, 660]
+        assert partition["b2"].start == Time(hour=10)
+        with pytest.raises(TemporalLogicError):
+            partition.replace(0, TimeSpan(Time(hour=8), Time(hour=8, minute=30)))
+
+    @pytest.mark.parametrize(
+        "index, absorb, boundaries, names",
+        [
+            (0, None, [540, 660, 720, 900], ["b", "c", "d"]),
+            (3, None, [480, 540, 660, 720], ["a", "b", "c"]),
+            (1, "previous", [480, 660, 720, 900], ["a", "c", "d"]),
+            (1, "next", [480, 540, 720, 900], ["a", "c", "d"]),
+        ],
+    )
+    def test_remove(self, index, absorb, boundaries, names):
+        partition = make_partition(8, 9, 11, 12, 15)
+        partition.boundaries
+        partition.remove(index, absorb=absorb)
+        assert partition.boundaries == boundaries
+        assert [span.name for span in partition.spans] == names
+        assert TimePartition(partition.spans).boundaries == boundaries
+
+    def test_remove_interior_requires_absorb(self):
+        with pytest.raises(TemporalLogicError):
+            make_partition(8, 9, 10, 11).remove(1)
+
+    def test_resize_boundary(self):
+        partition = make_partition(8, 9, 11)
+        partition.boundaries
+        partition.resize_boundary(1, Time(hour=10))
+        assert partition.boundaries == [480, 600, 660]
+        assert partition["a"].end == Time(hour=10)
+        assert partition["b"].start == Time(hour=10)
+        with pytest.raises(TemporalLogicError):
+            partition.resize_boundary(1, Time(hour=12))
+
+
+def make_nested() -> TimePartition:
+    inner = make_partition(9, 9.5, 10, names="xy")
+    return TimePartition([
+        TimeSpan(Time(hour=8), Time(hour=9), name="a"),
+        inner,
+        TimeSpan(Time(hour=10), Time(hour=11), name="c"),
+    ])
+
+
+class TestNestedTraversal:
+    def test_preorder(self):
+        walked = [(depth, span.start) for depth, span in make_nested().iter_nested()]
+        assert walked == [
+            (0, Time(hour=8)),
+            (0, Time(hour=9)),
+            (1, Time(hour=9)),
+            (1, Time(hour=9, minute=30)),
+            (0, Time(hour=10)),
+        ]
+
+    def test_is_lazy(self):
+        walk = make_nested().iter_nested()
+        assert next(walk)[1].name == "a"
+
+    def test_max_depth(self):
+        assert [depth for depth, _ in make_nested().iter_nested(max_depth=0)] == [0, 0, 0]
+
+    def test_window_pruning(self):
+        window = TimeSpan(Time(hour=9, minute=40), Time(hour=10, minute=30))
+        walked = [(depth, span.start) for depth, span in make_nested().iter_nested(window=window)]
+        assert walked == [(0, Time(hour=9)), (1, Time(hour=9, minute=30)), (0, Time(hour=10))]
+
+    def test_iter_leaves(self):
+        assert [span.name for span in make_nested().iter_leaves()] == ["a", "x", "y", "c"]
+
+    def test_deep_hierarchy(self):
+        partition = make_partition(8, 9, names="z")
+        for _ in range(200):
+            partition = TimePartition([partition])
+        assert max(depth for depth, _ in partition.iter_nested()) == 200
+        assert repr(partition).count("<END>") == 201
+
+    def test_repr(self):
+        lines = repr(make_nested()).splitlines()
+        assert lines[0] == "TimePartition("
+        assert lines[2] == "    TimePartition("
+        assert lines[5] == "        10:00 - <END>"
+        assert lines[-2:] == ["    11:00 - <END>", ")"]
+
+
+class TestArrayConstruction:
+    def test_from_minutes_advances(self):
+        partition = TimePartition.from_minutes(
+            minute_durations=[30, 60, 90], start=Time(hour=8), names="abc"
+        )
+        assert partition.boundaries == [480, 510, 570, 660]
+        assert partition.names == ("a", "b", "c")
+        assert partition["c"].start == Time(hour=9, minute=30)
+
+    def test_from_minutes_anchored_at_end(self):
+        partition = TimePartition.from_minutes(minute_durations=[30, 90], end=Time(hour=24))
+        assert partition.boundaries == [1320, 1350, 1440]
+        assert partition.end == Time(hour=24)
+
+    @pytest.mark.parametrize(
+        "anchor", [{"start": Time(hour=22)}, {"end": Time(hour=2)}], ids=["start", "end"]
+    )
+    def test_from_minutes_outside_the_day(self, anchor):
+        with pytest.raises(ValueError, match="outside the day"):
+            TimePartition.from_minutes(minute_durations=[60, 60, 60], **anchor)
+
+    def test_from_boundaries(self):
+        times = [Time(hour=h) for h in (8, 9, 11)]
+        partition = TimePartition.from_boundaries(times, names=["a", "b"])
+        assert partition.spans == make_partition(8, 9, 11).spans
+        with pytest.raises(ValueError):
+            TimePartition.from_boundaries(times[::-1])
+
+    def test_from_relative_lengths_hits_end(self):
+        partition = TimePartition.from_relative_lengths(
+            Time(hour=8), Time(hour=9), segments=iter([1, 1, 1])
+        )
+        assert partition.boundaries == [480, 500, 520, 540]
+
+    def test_spans_created_lazily(self):
+        partition = TimePartition.from_minutes(minute_durations=[1] * 1000, start=Time(hour=0))
+        assert partition.index_from_time(Time(hour=10)) == 600
+        assert partition._spans._items.count(None) == 1000
+        assert partition._spans[600].start == Time(hour=10)
+        assert partition._spans._items.count(None) == 999
+
+    def test_edits_materialize(self):
+        partition = TimePartition.from_minutes(minute_durations=[60, 60], start=Time(hour=8))
+        partition.remove(0)
+        partition.insert(1, TimeSpan(Time(hour=10), Time(hour=11), name="x"))
+        assert partition.boundaries == [540, 600, 660]
+        assert partition.index_from_name("x") == 1
+
+
+class TestAffineTransforms:
+    def test_forward(self):
+        partition = make_partition(8, 9, 11).forward_affine_transform(0.5, Time(hour=12))
+        assert partition.boundaries == [720, 750, 810]
+        assert partition.names == ("a", "b")
+
+    def test_backward_anchors_at_end(self):
+        partition = make_partition(8, 9, 11).backward_affine_transform(0.5)
+        assert partition.boundaries == [570, 600, 660]
+
+    def test_min_minutes_preserves_total(self):
+        partition = TimePartition.from_minutes(
+            minute_durations=[10, 20, 30, 60], start=Time(hour=8)
+        )
+        partition.forward_affine_transform(0.5, min_minutes=10)
+        assert partition.boundaries[-1] - partition.boundaries[0] == pytest.approx(60)
+        assert min(b - a for a, b in zip(partition.boundaries, partition.boundaries[1:])) == 10
+
+    def test_infeasible(self):
+        with pytest.raises(ValueError):
+            make_partition(8, 9, 10, 11).forward_affine_transform(0.1, min_minutes=10)
+
+    def test_keeps_span_class(self):
+        slots = [
+            TimeSlot(start=Time(hour=8), end=Time(hour=9), require_all={"deep"}),
+            TimeSlot(start=Time(hour=9), end=Time(hour=10)),
+        ]
+        partition = TimePartition(slots).forward_affine_transform(2, Time(hour=12))
+        assert partition.boundaries == [720, 840, 960]
+        first, second = partition.spans
+        assert isinstance(first, TimeSlot) and isinstance(second, TimeSlot)
+        assert not first.can_receive("shallow")
+        assert second.can_receive("shallow")
+        assert slots[0].start == Time(hour=8)
+
+    @pytest.mark.parametrize(
+        "transform",
+        [
+            lambda partition: partition.forward_affine_transform(3),
+            lambda partition: partition.backward_affine_transform(3, Time(hour=3)),
+        ],
+    )
+    def test_outside_the_day(self, transform):
+        partition = make_partition(20, 22)
+        with pytest.raises(ValueError):
+            transform(partition)
+        assert partition.boundaries == [1200, 1320]
+
+    def test_nested(self):
+        inner = make_partition(9, 9.5, 10, names="xy")
+        partition = TimePartition([TimeSpan(Time(hour=8), Time(hour=9), name="a"), inner])
+        partition.forward_affine_transform(2, min_minutes=0)
+        assert partition.boundaries == [480, 600, 720]
+        assert inner.boundaries == [600, 660, 720]
+
+
+class TestFromPipeline:
+    STEPS = (coalesce, partial(iter_resolve_gaps, mode="SNAP_FORWARD"))
+
+    def spans(self):
+        hours = [(8, 9, "a"), (9, 10, "a"), (11, 12, "b")]
+        return (TimeSpan(Time(hour=a), Time(hour=b), name=name) for a, b, name in hours)
+
+    def test_steps(self):
+        partition = TimePartition.from_pipeline(self.spans(), self.STEPS)
+        assert partition.boundaries == [480, 660, 720]
+        assert partition.names == ("a", "b")
+
+    def test_composed(self):
+        partition = TimePartition.from_pipeline(self.spans(), compose(*self.STEPS))
+        assert partition.boundaries == [480, 660, 720]
@@ -0,0 +1,92 @@
+import pytest
+
+from datethyme import Date, Time, TimeSpan
+from datethyme.scheduling import Calendar, TimePartition, rollup, rollup_by_period
+from datethyme.scheduling.rollups import by_context, by_mapping, by_name
+from datethyme.scheduling.types import DayPartition, Entry
+from datethyme.scheduling.types.schedules import FixedBlock
+
+
+def make_calendar() -> Calendar:
+    def day(*blocks: tuple[str, str, str, list[str]]) -> dict:
+        fixed = [
+            {"start": a, "end": b, "name": name, "contexts": contexts}
+            for a, b, name, contexts in blocks
+        ]
+        return {"schedule": {"fixed": fixed}, "entries": []}
+
+    return Calendar.model_validate({
+        "2026-05-11": day(("09:00", "10:00", "email", ["work"]), ("18:00", "19:30", "gym", [])),
+        "2026-05-12": day(("09:00", "11:00", "email", ["work", "focus"])),
+        "2026-05-18": day(("07:00", "08:00", "gym", ["health"])),
+        "2026-06-01": day(("09:00", "09:30", "email", ["work"])),
+    })
+
+
+def test_rollup_by_name():
+    assert rollup(make_calendar()) == {"email": 210, "gym": 150}
+
+
+def test_rollup_window_is_half_open():
+    totals = rollup(make_calendar(), start=Date.parse("2026-05-12"), end=Date.parse("2026-06-01"))
+    assert totals == {"email": 120, "gym": 60}
+
+
+def test_rollup_by_context():
+    assert rollup(make_calendar(), by_context) == {"work": 210, "focus": 120, "health": 60}
+
+
+def test_rollup_by_mapping():
+    key = by_mapping({"email": "admin"}, default="other")
+    assert rollup(make_calendar(), key) == {"admin": 210, "other": 150}
+
+
+@pytest.mark.parametrize(
+    "period, expected",
+    [
+        (
+            "week",
+            {
+                "2026-05-11": {"email": 180, "gym": 90},
+                "2026-05-18": {"gym": 60},
+                "2026-06-01": {"email": 30},
+            },
+        ),
+        ("month", {"2026-05-01": {"email": 180, "gym": 150}, "2026-06-01": {"email": 30}}),
+    ],
+)
+def test_rollup_by_period(period, expected):
+    grouped = rollup_by_period(make_calendar(), period=period)
+    assert {str(date): totals for date, totals in grouped.items()} == expected
+
+
+def test_day_cache_invalidated_on_change():
+    calendar = make_calendar()
+    schedule = calendar[Date.parse("2026-05-18")].schedule
+    assert schedule.rollup(by_name) is schedule.rollup(by_name)
+    schedule.fixed.append(FixedBlock(start=Time(hour=12), end=Time(hour=13), name="lunch"))
+    assert rollup(calendar, start=Date.parse("2026-05-18")) == {"gym": 60, "lunch": 60, "email": 30}
+
+
+def test_day_rollup_follows_displacement():
+    day = DayPartition.model_validate({
+        "fixed": [
+            {"start": "00:00", "end": "12:00", "name": "m"},
+            {"start": "13:00", "end": "24:00", "name": "n"},
+        ]
+    })
+    day.add_flex(Entry(name="low", normal_time=60, priority=1))
+    assert day.rollup(by_name) == {"m": 720, "low": 60, "n": 660}
+    day.add_flex(Entry(name="high", normal_time=60, priority=5))
+    assert day.rollup(by_name) == {"m": 720, "high": 60, "n": 660}
+
+
+def test_partition_rollup_follows_nested_edits():
+    inner = TimePartition([
+        TimeSpan(Time(hour=9), Time(hour=10), name="email"),
+        TimeSpan(Time(hour=10), Time(hour=11), name="code"),
+    ])
+    outer = TimePartition([TimeSpan(Time(hour=8), Time(hour=9), name="email"), inner])
+    assert outer.rollup(by_name) == {"email": 120, "code": 60}
+    inner.resize_boundary(1, Time(hour=9, minute=30))
+    assert outer.rollup(by_name) == {"email": 90, "code": 90}
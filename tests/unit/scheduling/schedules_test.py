@@ -0,0 +1,223 @@
+import pytest
+
+from datethyme import Date, Time
+from datethyme.constants import AddResult
+from datethyme.exceptions import TemporalLogicError
+from datethyme.scheduling.types import Calendar, CalendarDay, DayPartition, Entry, FlexBlock
+from datethyme.scheduling.types.schedules import ContextHierarchy
+from datethyme.scheduling.types.slots import TimeSlot
+
+
+def make_day() -> DayPartition:
+    return DayPartition.model_validate({
+        "fixed": [
+            {"start": "07:00", "end": "12:00", "name": "work (morning)"},
+            {"start": "13:00", "end": "17:00", "name": "work (afternoon)"},
+        ]
+    })
+
+
+class TestDayPartitionLookup:
+    def test_blocks_sorted(self):
+        day = make_day()
+        starts = [block.start for block in day.blocks]
+        assert starts == sorted(starts)
+        assert day.blocks[0].start == Time(hour=0)
+
+    def test_getitem_and_contains(self):
+        day = make_day()
+        assert day["work (afternoon)"].start == Time(hour=13)
+        assert "work (morning)" in day
+        assert "gym" not in day
+
+    def test_cache_follows_mutation(self):
+        day = make_day()
+        assert "gym" not in day
+        day.flex.append(FlexBlock(start=Time(hour=18), end=Time(hour=19), name="gym"))
+        assert "gym" in day
+        assert day["gym"].end == Time(hour=19)
+
+    def test_invalidate_after_in_place_replacement(self):
+        day = make_day()
+        assert "work (morning)" in day
+        day.fixed[0] = day.fixed[0].model_copy(update={"name": "deep work"})
+        day.invalidate_cache()
+        assert "deep work" in day
+        assert "work (morning)" not in day
+
+
+class TestAddFlex:
+    def test_ideal_time_in_shortest_fitting_gap(self):
+        day = make_day()
+        result, _, popped = day.add_flex(Entry(name="a", normal_time=60))
+        assert (result, popped) == (AddResult.ADDED, [])
+        assert (day["a"].start, day["a"].end) == (Time(hour=12), Time(hour=13))
+        assert "a" in day.placed
+
+    def test_squeezed_into_longest_gap(self):
+        day = make_day()
+        entry = Entry(name="long", normal_time=600, min_time_explicit=300)
+        result, _, _ = day.add_flex(entry)
+        assert result is AddResult.ADDED_MODIFIED
+        assert (day["long"].start, day["long"].end) == (Time(hour=0), Time(hour=7))
+
+    def test_not_added(self):
+        day = make_day()
+        entry = Entry(name="huge", normal_time=600)
+        assert day.add_flex(entry) == (AddResult.NOT_ADDED, day, [entry])
+        assert not day.flex
+
+    def test_displaces_lower_priority(self):
+        day = make_day()
+        low = Entry(name="low", normal_time=60 * 7, priority=0.1)
+        high = Entry(name="high", normal_time=60 * 7, priority=0.9)
+        day.add_flex(low)
+        day.add_flex(Entry(name="b", normal_time=60 * 7, priority=0.5))
+        result, _, popped = day.add_flex(high)
+        assert (result, popped) == (AddResult.DISPLACED, [low])
+        assert "low" not in day
+        assert day["high"].start == Time(hour=0)
+
+    def test_lookups_follow_displacement(self):
+        day = DayPartition.model_validate({
+            "fixed": [
+                {"start": "00:00", "end": "12:00", "name": "m"},
+                {"start": "13:00", "end": "24:00", "name": "n"},
+            ]
+        })
+        day.add_flex(Entry(name="low", normal_time=60, priority=1))
+        assert [block.name for block in day.blocks] == ["m", "low", "n"]
+        result, _, _ = day.add_flex(Entry(name="high", normal_time=60, priority=5))
+        assert result is AddResult.DISPLACED
+        assert [block.name for block in day.blocks] == ["m", "high", "n"]
+        assert "high" in day
+        assert "low" not in day
+        assert day.add_flex(Entry(name="c", normal_time=60 * 7, priority=0.2))[0] is (
+            AddResult.NOT_ADDED
+        )
+
+    def test_at(self):
+        day = make_day()
+        entry = Entry(name="a", normal_time=60, max_time_explicit=120)
+        assert day.add_flex_at(entry, Time(hour=20), Time(hour=22))[0] is AddResult.ADDED_MODIFIED
+        assert day["a"].start == Time(hour=20)
+        assert day.add_flex_at(entry, Time(hour=11), Time(hour=12, minute=30))[0] is (
+            AddResult.NOT_ADDED
+        )
+        assert day.add_flex_at(entry, Time(hour=17), Time(hour=20))[0] is AddResult.NOT_ADDED
+
+    def test_slots(self):
+        day = make_day().set_slots([TimeSlot(Time(hour=17), Time(hour=24), require_any={"home"})])
+        result, _, _ = day.add_flex(Entry(name="work", contexts={"work"}))
+        assert result is AddResult.NOT_ADDED
+        day.add_flex(Entry(name="read", contexts={"home"}))
+        assert day["read"].start == Time(hour=17)
+
+
+class TestAddFixed:
+    def test_added(self):
+        day = make_day()
+        entry = Entry(name="call", normal_time=30)
+        assert day.add_fixed(entry, Time(hour=12), Time(hour=13))[0] is AddResult.ADDED
+        assert day["call"].end == Time(hour=12, minute=30)
+        assert day.gap_index.gaps[1] == (12 * 60 + 30, 13 * 60)
+
+    def test_conflict_with_fixed(self):
+        day = make_day()
+        entry = Entry(name="call", normal_time=30)
+        assert day.add_fixed(entry, Time(hour=11, minute=45), Time(hour=13)) == (
+            AddResult.NOT_ADDED,
+            day,
+            [entry],
+        )
+
+    def test_displaces_flex(self):
+        day = make_day()
+        flex = Entry(name="flex", normal_time=60)
+        day.add_flex(flex)
+        result, _, popped = day.add_fixed(Entry(name="call"), Time(hour=12), Time(hour=13))
+        assert (result, popped) == (AddResult.DISPLACED, [flex])
+        assert "flex" not in day
+
+
+class TestAllocateEntries:
+    def test_priority_and_dates(self):
+        first = Date.parse("2026-01-01")
+        calendar = Calendar({
+            first + i: CalendarDay(schedule=make_day(), entries=[]) for i in range(3)
+        })
+        entries = [
+            Entry(name="late", normal_time=60 * 7, earliest_date=first + 2),
+            Entry(name="urgent", normal_time=60 * 7, due_date=first, priority=0.9),
+            Entry(name="low", normal_time=60 * 7, due_date=first, priority=0.1),
+            Entry(name="free", normal_time=60 * 7),
+        ]
+        remaining, log = calendar.allocate_entries(entries, context_hierarchy=ContextHierarchy())
+        assert list(remaining) == ["low"]
+        assert "urgent" in calendar[first].entries
+        assert "late" in calendar[first + 2].entries
+        assert "free" in calendar[first].entries  # the other gap of the first day
+        assert not calendar[first + 1].entries
+        assert [record.name for record in log.records] == ["urgent", "free", "late", "low"]
+        assert log.records[-1].date is None
+
+    def test_dependencies(self):
+        first = Date.parse("2026-01-01")
+        calendar = Calendar({
+            first + i: CalendarDay(schedule=make_day(), entries=[]) for i in range(3)
+        })
+        entries = [
+            Entry(name="review", normal_time=60, priority=0.9, dependencies={"draft"}),
+            Entry(name="draft", normal_time=60, priority=0.1),
+            Entry(name="publish", normal_time=60, dependencies={"review"}, due_date=first + 1),
+            Entry(name="other", normal_time=60 * 7, priority=0.5, due_date=first),
+        ]
+        remaining, _ = calendar.allocate_entries(entries, context_hierarchy=ContextHierarchy())
+        assert list(remaining) == ["publish"]  # review cannot come before the second day
+        assert "draft" in calendar[first].entries  # before `other`, with the priority of review
+        assert "review" in calendar[first + 1].entries
+        with pytest.raises(TemporalLogicError, match="Dependency cycle"):
+            calendar.allocate_entries(
+                [Entry(name="a", dependencies={"b"}), Entry(name="b", dependencies={"a"})],
+                context_hierarchy=ContextHierarchy(),
+            )
+
+    def test_displaces_lower_priority(self):
+        first = Date.parse("2026-01-01")
+        calendar = Calendar({first: CalendarDay(schedule=make_day(), entries=[])})
+        entries = [Entry(name=name, normal_time=60 * 7, priority=0.1) for name in ("early", "late")]
+        remaining, _ = calendar.allocate_entries(entries, context_hierarchy=ContextHierarchy())
+        assert not remaining
+        urgent = Entry(name="urgent", normal_time=60 * 7, priority=0.9)
+        remaining, log = calendar.allocate_entries([urgent], context_hierarchy=ContextHierarchy())
+        assert "urgent" in calendar[first].entries
+        assert len(remaining) == 1
+        assert set(calendar[first].entries).isdisjoint(remaining)
+        assert log.records[0].name == "urgent"
+        assert log.records[0].date == first
+
+    def test_process_pool(self):
+        first = Date.parse("2026-01-01")
+        calendars = [
+            Calendar({first + i: CalendarDay(schedule=make_day(), entries=[]) for i in range(6)})
+            for _ in range(2)
+        ]
+        entries = [
+            Entry(
+                name=f"e{i}",
+                normal_time=60 + 30 * (i % 4),
+                priority=(i % 5) / 5,
+                earliest_date=first + 2 * (i % 3),
+                due_date=first + 2 * (i % 3) + 1,
+            )
+            for i in range(40)
+        ]
+        serial, serial_log = calendars[0].allocate_entries(
+            entries, context_hierarchy=ContextHierarchy()
+        )
+        pooled, pooled_log = calendars[1].allocate_entries(
+            entries, context_hierarchy=ContextHierarchy(), max_workers=2, block_days=1
+        )
+        assert str(calendars[0]) == str(calendars[1])
+        assert sorted(serial) == sorted(pooled)
+        assert sorted(serial_log.records, key=str) == sorted(pooled_log.records, key=str)
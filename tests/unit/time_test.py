@@ -81,6 +81,7 @@ class TestTime:
             (125.5, 2, 5, 30.0),
             (0, 0, 0, 0.0),
             (1440, 0, 0, 0.0),  # from_X returns 00:00 rather than 24:00
+            (359.99999999, 6, 0, 0.0),  # rounding carries into the minute
         ],
     )
     def test_from_minutes(